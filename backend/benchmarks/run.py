@@ -0,0 +1,399 @@
+"""Offline benchmarks for the search hot paths.
+
+Measures the stages every search goes through, without touching the network:
+parsing recorded Seek results pages, normalizing JobSpy DataFrames, the role
+and work-type filters, and building the ``Job`` response. Each stage runs at
+several result sizes and reports throughput (jobs per second, from the median
+run) and peak memory (from ``tracemalloc``).
+
+Results can be saved as a JSON baseline and compared with a later run:
+
+    python backend/benchmarks/run.py --output baseline.json
+    python backend/benchmarks/run.py --compare baseline.json
+
+Seek pages of any size are built by repeating the job cards (and embedded
+JSON jobs) of the pages recorded under ``fixtures/`` with fresh ids; JobSpy
+frames are generated with a fixed seed, so runs are repeatable.
+"""
+
+import argparse
+import glob
+import json
+import os
+import platform
+import random
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+# Add backend to path (so we can import src as a package), and src for the
+# scrapers' config import
+backend_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(backend_dir, "src"))
+sys.path.insert(0, backend_dir)
+
+from src.models import Job
+from src.scrapers.jobspy_wrapper import _format_job, _format_jobs
+from src.scrapers.seek import (
+    _EMBEDDED_STATE_MARKER,
+    _JSON_DECODER,
+    _extract_embedded_jobs,
+    _parse_job_article,
+    _parse_page,
+)
+from src.serialization import dumps, project_jobs
+from src.utils import filter_by_work_type, filter_jobs
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+SALARY_MIN, SALARY_MAX = 100000, 150000
+BENCH_ROLE = "software engineer"
+BENCH_WORK_TYPE = "remote"
+
+_ARTICLE_PATTERN = re.compile(r"<article\b.*?</article>", re.S)
+_JOB_ID_PATTERN = re.compile(r"(/job/|data-job-id=\")(\d+)")
+
+
+# Inputs
+
+
+class RecordedPages:
+    """Job cards and embedded JSON jobs taken from the recorded Seek pages."""
+
+    def __init__(self, pattern: str = os.path.join(FIXTURES_DIR, "seek_*.html")):
+        paths = sorted(glob.glob(pattern))
+        if not paths:
+            raise FileNotFoundError(f"No recorded Seek pages match {pattern}")
+
+        self.cards: List[str] = []
+        self.embedded: List[Dict[str, Any]] = []
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                html = f.read()
+            self.cards.extend(_ARTICLE_PATTERN.findall(html))
+            self.embedded.extend(_extract_embedded_jobs(html) or [])
+
+        # The first page supplies the markup around the cards and the state script
+        with open(paths[0], encoding="utf-8") as f:
+            html = f.read()
+        cards_end = html.rfind("</article>") + len("</article>")
+        self._head = html[: html.find("<article")]
+        self._middle = html[cards_end : html.find("<script", cards_end)]
+        self._state = self._load_state(html)
+
+    @staticmethod
+    def _load_state(html: str) -> Dict[str, Any]:
+        marker = html.find(_EMBEDDED_STATE_MARKER)
+        state, _ = _JSON_DECODER.raw_decode(html, html.find("{", marker))
+        return state
+
+    def page(self, size: int, embedded: bool = True) -> str:
+        """Build a results page with ``size`` job cards, optionally with the embedded state."""
+        cards = []
+        jobs = []
+        for i in range(size):
+            job_id = str(10_000_000 + i)
+            card = self.cards[i % len(self.cards)]
+            cards.append(_JOB_ID_PATTERN.sub(lambda m: m.group(1) + job_id, card))
+            if self.embedded:
+                jobs.append({**self.embedded[i % len(self.embedded)], "id": job_id})
+
+        html = self._head + "\n".join(cards) + self._middle
+        if embedded:
+            state = json.loads(json.dumps(self._state))
+            state["results"]["results"]["jobs"] = jobs
+            html += f"<script>{_EMBEDDED_STATE_MARKER} = {json.dumps(state)};</script>"
+        return html + "</body></html>"
+
+
+_TITLES = [
+    "Senior Software Engineer",
+    "Software Developer",
+    "Frontend Engineer (React)",
+    "Data Analyst",
+    "DevOps Engineer",
+    "Product Manager",
+    "Backend Developer - Python",
+    "Registered Nurse",
+    "Sales Account Executive",
+    "Lead Platform Engineer",
+]
+_LOCATIONS = ["Sydney, NSW", "Melbourne, VIC", "Remote", "Brisbane, QLD (Hybrid)", None]
+_SITES = ["indeed", "linkedin", "glassdoor"]
+
+
+def make_jobspy_frame(size: int, seed: int = 42) -> pd.DataFrame:
+    """Build a DataFrame shaped like JobSpy's scrape_jobs output, with missing values."""
+    rng = random.Random(seed)
+    nan = float("nan")
+    rows = []
+    for i in range(size):
+        site = _SITES[i % len(_SITES)]
+        min_amount = float(rng.randrange(60, 180) * 1000) if rng.random() < 0.6 else nan
+        rows.append(
+            {
+                "id": f"{site[:2]}-{i}",
+                "site": site,
+                "job_url": f"https://www.{site}.com/viewjob?jk={i:08x}",
+                "job_url_direct": f"https://careers.example.com/{i}" if i % 4 == 0 else nan,
+                "title": rng.choice(_TITLES),
+                "company": f"Company {i % 250}",
+                "location": rng.choice(_LOCATIONS),
+                "date_posted": date(2024, 1 + i % 12, 1 + i % 28) if i % 5 else nan,
+                "job_type": "fulltime" if i % 3 else nan,
+                "interval": "yearly" if min_amount == min_amount else nan,
+                "min_amount": min_amount,
+                "max_amount": min_amount + 20000 if min_amount == min_amount else nan,
+                "currency": "AUD",
+                "is_remote": i % 7 == 0,
+                "salary_range": (
+                    f"{int(min_amount)}-{int(min_amount) + 20000}"
+                    if min_amount == min_amount
+                    else nan
+                ),
+                "company_url": f"https://www.{site}.com/company/{i % 250}",
+                "company_url_direct": f"https://company{i % 250}.example.com" if i % 2 else "",
+                "description": " ".join(rng.choice(_TITLES) for _ in range(40)),
+                "work_from_home_type": "hybrid" if i % 9 == 0 else nan,
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+# Stages
+
+
+class Stage:
+    """One benchmarked step: ``prepare(size)`` builds the inputs, ``run`` is timed."""
+
+    def __init__(
+        self, name: str, prepare: Callable[[int], Tuple[Any, ...]], run: Callable[..., Any]
+    ):
+        self.name = name
+        self.prepare = prepare
+        self.run = run
+
+
+def build_stages(pages: RecordedPages) -> List[Stage]:
+    """Every benchmarked stage, in the order a search runs them."""
+
+    def articles(size: int) -> Tuple[Any, ...]:
+        soup = BeautifulSoup(pages.page(size, embedded=False), "html.parser")
+        return (soup.find_all("article"),)
+
+    def page(embedded: bool) -> Callable[[int], Tuple[Any, ...]]:
+        return lambda size: (pages.page(size, embedded=embedded),)
+
+    def frame(size: int) -> Tuple[Any, ...]:
+        return (make_jobspy_frame(size),)
+
+    def jobs(size: int) -> Tuple[Any, ...]:
+        return (_format_jobs(make_jobspy_frame(size)),)
+
+    return [
+        Stage(
+            "seek_article",
+            articles,
+            lambda cards: [_parse_job_article(card, SALARY_MIN, SALARY_MAX) for card in cards],
+        ),
+        Stage(
+            "seek_page_json",
+            page(True),
+            lambda html: _parse_page(html, SALARY_MIN, SALARY_MAX, engine="json"),
+        ),
+        Stage(
+            "seek_page_fast",
+            page(False),
+            lambda html: _parse_page(html, SALARY_MIN, SALARY_MAX, engine="fast"),
+        ),
+        Stage(
+            "seek_page_legacy",
+            page(False),
+            lambda html: _parse_page(html, SALARY_MIN, SALARY_MAX, engine="legacy"),
+        ),
+        Stage(
+            "jobspy_format_rows",
+            frame,
+            lambda df: [_format_job(row) for _, row in df.iterrows()],
+        ),
+        Stage("jobspy_format_frame", frame, _format_jobs),
+        Stage("filter_role", jobs, lambda records: filter_jobs(records, BENCH_ROLE)),
+        Stage(
+            "filter_work_type",
+            jobs,
+            lambda records: filter_by_work_type(records, BENCH_WORK_TYPE),
+        ),
+        Stage(
+            "job_model",
+            jobs,
+            lambda records: [Job.model_validate(job).model_dump(mode="json") for job in records],
+        ),
+        Stage("serialize_fast", jobs, lambda records: dumps(project_jobs(records))),
+    ]
+
+
+# Measurement
+
+
+def measure(stage: Stage, size: int, repeat: int) -> Dict[str, float]:
+    """Time ``repeat`` runs of a stage and record its peak memory in one more run."""
+    args = stage.prepare(size)
+    stage.run(*args)  # warm up caches (compiled role queries, pydantic validators)
+
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        stage.run(*args)
+        durations.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        stage.run(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    median = statistics.median(durations)
+    return {
+        "median_s": median,
+        "best_s": min(durations),
+        "jobs_per_s": size / median if median else float("inf"),
+        "peak_kib": peak / 1024,
+        "bytes_per_job": peak / size,
+    }
+
+
+def run_benchmarks(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    stages: Optional[Sequence[str]] = None,
+    repeat: int = 5,
+    report: Callable[[str], None] = print,
+) -> Dict[str, Any]:
+    """Run the selected stages at every size and return the results document."""
+    selected = build_stages(RecordedPages())
+    if stages:
+        unknown = set(stages) - {stage.name for stage in selected}
+        if unknown:
+            raise ValueError(f"Unknown stage(s): {', '.join(sorted(unknown))}")
+        selected = [stage for stage in selected if stage.name in stages]
+
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    report(f"{'stage':<22}{'jobs':>8}{'median ms':>12}{'jobs/s':>12}{'peak KiB':>11}")
+    for stage in selected:
+        for size in sizes:
+            result = measure(stage, size, repeat)
+            results.setdefault(stage.name, {})[str(size)] = result
+            report(
+                f"{stage.name:<22}{size:>8}{result['median_s'] * 1000:>12.2f}"
+                f"{result['jobs_per_s']:>12.0f}{result['peak_kib']:>11.0f}"
+            )
+
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float = 0.2
+) -> List[Dict[str, Any]]:
+    """
+    Compare two results documents stage by stage and size by size.
+
+    A stage is a regression when its median time grew by more than
+    ``tolerance`` (a fraction) or an improvement when it shrank by more.
+    Stages or sizes missing from either document are skipped.
+
+    Returns:
+        One row per shared stage and size with the time and memory ratios
+    """
+    rows = []
+    for stage, sizes in current["results"].items():
+        for size, result in sizes.items():
+            before = baseline["results"].get(stage, {}).get(size)
+            if not before:
+                continue
+            time_ratio = result["median_s"] / before["median_s"]
+            memory_ratio = result["peak_kib"] / before["peak_kib"] if before["peak_kib"] else 1.0
+            if time_ratio > 1 + tolerance:
+                verdict = "slower"
+            elif time_ratio < 1 - tolerance:
+                verdict = "faster"
+            else:
+                verdict = "same"
+            rows.append(
+                {
+                    "stage": stage,
+                    "size": int(size),
+                    "time_ratio": time_ratio,
+                    "memory_ratio": memory_ratio,
+                    "verdict": verdict,
+                }
+            )
+    return rows
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the search hot paths offline.")
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: [int(size) for size in value.split(",")],
+        default=list(DEFAULT_SIZES),
+        help="Comma-separated job counts (default: 10,100,1000,10000)",
+    )
+    parser.add_argument("--stages", help="Comma-separated stages to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per stage and size")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--compare", help="Compare with a baseline JSON file")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Relative change in median time reported as slower/faster (default: 0.2)",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with status 1 if any stage is slower than the baseline",
+    )
+    args = parser.parse_args(argv)
+
+    stages = [name.strip() for name in args.stages.split(",")] if args.stages else None
+    current = run_benchmarks(args.sizes, stages, args.repeat)
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    regressions = 0
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"\nCompared with {args.compare} (created {baseline['meta']['created']}):")
+        print(f"{'stage':<22}{'jobs':>8}{'time':>9}{'memory':>9}  verdict")
+        for row in compare(baseline, current, args.tolerance):
+            regressions += row["verdict"] == "slower"
+            print(
+                f"{row['stage']:<22}{row['size']:>8}{row['time_ratio']:>8.2f}x"
+                f"{row['memory_ratio']:>8.2f}x  {row['verdict']}"
+            )
+
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
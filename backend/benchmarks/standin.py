@@ -0,0 +1,176 @@
+"""Local stand-in job board serving recorded Seek pages.
+
+Answers each request with the response recorded for its path and query
+(``SCRAPER_MODE=record``, see ``src/scrapers/replay.py``), so a search can be
+scraped end to end over real HTTP without reaching Seek:
+
+    python backend/benchmarks/standin.py --recordings recordings --latency 0.2
+    SEEK_BASE_URL=http://127.0.0.1:8765/jobs make start
+
+Requests without a recording get the ``--fallback`` page (by default the
+results page under ``fixtures/``), or a 404 with ``--no-fallback``. Latency
+and failures can be injected to see how searches behave when the board is
+slow or erroring.
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Add backend to path (so we can import src as a package), and src for the
+# scrapers' config import
+backend_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(backend_dir, "src"))
+sys.path.insert(0, backend_dir)
+
+from src.config import SCRAPER_RECORDINGS_DIR
+from src.scrapers.replay import load_response, request_key
+
+DEFAULT_FALLBACK = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "fixtures", "seek_results_page.html"
+)
+
+
+class StandinJobBoard(ThreadingHTTPServer):
+    """HTTP server answering from recordings, with injected latency and errors.
+
+    Args:
+        address: (host, port) to listen on; port 0 picks a free port
+        recordings: Directory written by SCRAPER_MODE=record
+        fallback: HTML served for requests without a recording (None for a 404)
+        latency: Seconds added to every response
+        jitter: Up to this many extra seconds added at random
+        error_rate: Fraction of requests answered with ``error_status``
+        error_status: Status of injected failures (e.g. 503, or 429 to look blocked)
+        seed: Seed for the latency and failure draws
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int] = ("127.0.0.1", 8765),
+        recordings: str = SCRAPER_RECORDINGS_DIR,
+        fallback: Optional[str] = DEFAULT_FALLBACK,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: Optional[int] = None,
+    ):
+        super().__init__(address, _Handler)
+        self.recordings = recordings
+        self.fallback = None
+        if fallback:
+            with open(fallback, "rb") as f:
+                self.fallback = f.read()
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to use as SEEK_BASE_URL."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/jobs"
+
+    def draw(self) -> Tuple[float, bool]:
+        """Delay and whether to fail, for one request."""
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            return delay, self._random.random() < self.error_rate
+
+    def start(self) -> "StandinJobBoard":
+        """Serve on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: StandinJobBoard
+
+    def do_GET(self) -> None:
+        delay, fail = self.server.draw()
+        if delay:
+            time.sleep(delay)
+        if fail:
+            self._send(self.server.error_status, {}, b"Injected failure")
+            return
+
+        url = urlsplit(self.path)
+        recorded = load_response(request_key("GET", url.path, url.query), self.server.recordings)
+        if recorded is not None:
+            self._send(recorded["status"], recorded["headers"], recorded["body"].encode("utf-8"))
+        elif self.server.fallback is not None:
+            self._send(200, {"content-type": "text/html; charset=utf-8"}, self.server.fallback)
+        else:
+            self._send(404, {}, b"No recording")
+
+    def _send(self, status: int, headers: Dict[str, str], body: bytes) -> None:
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        # Keep load tests quiet; failures are visible to the scraper anyway
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve recorded Seek pages locally.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--recordings", default=SCRAPER_RECORDINGS_DIR)
+    parser.add_argument("--fallback", default=DEFAULT_FALLBACK, help="Page for unrecorded requests")
+    parser.add_argument("--no-fallback", action="store_true", help="404 unrecorded requests")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added per response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra seconds, at most")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests failed")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    server = StandinJobBoard(
+        (args.host, args.port),
+        recordings=args.recordings,
+        fallback=None if args.no_fallback else args.fallback,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+    )
+    print(f"Stand-in job board on {server.url} (recordings: {args.recordings})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
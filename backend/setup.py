@@ -6,7 +6,21 @@ setup(
     description="A powerful job scraping tool with a CLI and Web UI.",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
-    py_modules=["main", "server", "config", "models", "utils"],
+    py_modules=[
+        "main",
+        "server",
+        "config",
+        "models",
+        "utils",
+        "store",
+        "dedup",
+        "serialization",
+        "cache_backends",
+        "searches",
+        "scheduler",
+        "metrics",
+        "tracing",
+    ],
     install_requires=[
         "fastapi",
         "uvicorn",
@@ -15,10 +29,16 @@ setup(
         "pandas",
         "requests",
         "beautifulsoup4",
+        "lxml",
         "termcolor",
         "tabulate",
-        "httpx",
+        "orjson",
+        "httpx[http2]",
     ],
+    extras_require={
+        # Shared search cache on a Redis-compatible server (CACHE_BACKEND=redis)
+        "redis": ["redis"],
+    },
     entry_points={
         "console_scripts": [
             "career-hunter=main:main",
@@ -0,0 +1,273 @@
+"""Storage backends for the search caches.
+
+The in-memory backend is private to one process. The SQLite and Redis backends
+let several uvicorn workers on one host share cached searches, so scaling out
+workers does not multiply upstream scraping.
+"""
+
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+try:
+    from .config import CACHE_BACKEND, CACHE_PATH, CACHE_REDIS_URL
+    from .serialization import dumps, loads
+except ImportError:
+    from config import CACHE_BACKEND, CACHE_PATH, CACHE_REDIS_URL
+    from serialization import dumps, loads
+
+# Cache entries are dictionaries of {"timestamp": float, "data": Any}
+Entry = Dict[str, Any]
+
+
+class CacheBackend(ABC):
+    """Bounded key/entry storage with least-recently-used eviction."""
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        # Entries evicted by this process to stay within maxsize
+        self.evictions = 0
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Entry]:
+        """Return the entry for ``key`` and mark it recently used, or None."""
+
+    @abstractmethod
+    def set(self, key: str, entry: Entry) -> None:
+        """Store an entry, evicting the least recently used ones when full."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove ``key`` if present."""
+
+    @abstractmethod
+    def clear(self) -> int:
+        """Remove every entry. Returns the number of entries removed."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of stored entries."""
+
+
+class MemoryBackend(CacheBackend):
+    """Per-process backend on an OrderedDict."""
+
+    def __init__(self, maxsize: int):
+        super().__init__(maxsize)
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, key: str) -> Optional[Entry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            # Move to end (most recently used)
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: Entry) -> None:
+        self._entries.pop(key, None)
+        # Remove oldest if at capacity
+        while len(self._entries) >= self._maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        self._entries[key] = entry
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> int:
+        count = len(self._entries)
+        self._entries.clear()
+        return count
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteBackend(CacheBackend):
+    """Backend in a SQLite file shared by every worker process on the host.
+
+    Entries are stored as JSON, so dates come back as ISO strings exactly as
+    the API serializes them. Each cache uses its own namespace in the file.
+    Reads only note recency in memory; it is written with the next ``set``,
+    just before eviction uses it, so concurrent readers never take the write lock.
+    """
+
+    def __init__(self, maxsize: int, namespace: str, path: str = CACHE_PATH):
+        super().__init__(maxsize)
+        self._namespace = namespace
+        self._path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        # Keys read since the last write, with when they were read
+        self._touched: Dict[str, float] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the table on first use."""
+        if self._conn is None:
+            conn = sqlite3.connect(self._path, timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, timestamp REAL NOT NULL, "
+                "accessed REAL NOT NULL, data BLOB NOT NULL, PRIMARY KEY (namespace, key))"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cache_accessed ON cache(namespace, accessed)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[Entry]:
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT timestamp, data FROM cache WHERE namespace = ? AND key = ?",
+                (self._namespace, key),
+            ).fetchone()
+            if row is None:
+                return None
+            self._touched[key] = time.time()
+        return {"timestamp": row[0], "data": loads(row[1])}
+
+    def set(self, key: str, entry: Entry) -> None:
+        data = dumps(entry["data"])
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "UPDATE cache SET accessed = ? WHERE namespace = ? AND key = ?",
+                    [(at, self._namespace, read) for read, at in self._touched.items()],
+                )
+                self._touched.clear()
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (namespace, key, timestamp, accessed, data) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (self._namespace, key, entry["timestamp"], time.time(), data),
+                )
+                self.evictions += conn.execute(
+                    "DELETE FROM cache WHERE namespace = ? AND key NOT IN ("
+                    "SELECT key FROM cache WHERE namespace = ? ORDER BY accessed DESC LIMIT ?)",
+                    (self._namespace, self._namespace, self._maxsize),
+                ).rowcount
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._touched.pop(key, None)
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "DELETE FROM cache WHERE namespace = ? AND key = ?", (self._namespace, key)
+                )
+
+    def clear(self) -> int:
+        with self._lock:
+            self._touched.clear()
+            conn = self._connect()
+            with conn:
+                return conn.execute(
+                    "DELETE FROM cache WHERE namespace = ?", (self._namespace,)
+                ).rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            conn = self._connect()
+            return conn.execute(
+                "SELECT COUNT(*) FROM cache WHERE namespace = ?", (self._namespace,)
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class RedisBackend(CacheBackend):
+    """Backend on a Redis-compatible server (Redis, Valkey, KeyDB).
+
+    Recency is tracked in a sorted set per namespace so the cache stays
+    bounded without relying on the server's eviction policy. Requires the
+    optional ``redis`` package.
+    """
+
+    def __init__(
+        self, maxsize: int, namespace: str, url: str = CACHE_REDIS_URL, client: Any = None
+    ):
+        super().__init__(maxsize)
+        if client is None:
+            try:
+                import redis
+            except ImportError as e:
+                raise ImportError(
+                    "CACHE_BACKEND=redis requires the redis package: pip install redis"
+                ) from e
+            client = redis.Redis.from_url(url)
+        self._client = client
+        self._prefix = f"career_hunter:{namespace}:"
+        self._recency = f"career_hunter:{namespace}:__recency__"
+
+    def get(self, key: str) -> Optional[Entry]:
+        raw = self._client.get(self._prefix + key)
+        if raw is None:
+            return None
+        self._client.zadd(self._recency, {key: time.time()})
+        return loads(raw)
+
+    def set(self, key: str, entry: Entry) -> None:
+        pipe = self._client.pipeline()
+        pipe.set(self._prefix + key, dumps(entry))
+        pipe.zadd(self._recency, {key: time.time()})
+        pipe.execute()
+
+        overflow = self._client.zcard(self._recency) - self._maxsize
+        if overflow > 0:
+            oldest = self._client.zrange(self._recency, 0, overflow - 1)
+            for old_key in oldest:
+                self.delete(old_key.decode() if isinstance(old_key, bytes) else old_key)
+            self.evictions += len(oldest)
+
+    def delete(self, key: str) -> None:
+        pipe = self._client.pipeline()
+        pipe.delete(self._prefix + key)
+        pipe.zrem(self._recency, key)
+        pipe.execute()
+
+    def clear(self) -> int:
+        keys = self._client.zrange(self._recency, 0, -1)
+        for key in keys:
+            self._client.delete(self._prefix + (key.decode() if isinstance(key, bytes) else key))
+        self._client.delete(self._recency)
+        return len(keys)
+
+    def __len__(self) -> int:
+        return int(self._client.zcard(self._recency))
+
+
+def create_backend(maxsize: int, namespace: str, kind: str = CACHE_BACKEND) -> CacheBackend:
+    """
+    Build the cache backend selected by configuration.
+
+    Args:
+        maxsize: Maximum number of entries kept
+        namespace: Name separating this cache's entries in a shared backend
+        kind: "memory", "sqlite" or "redis"
+
+    Returns:
+        A cache backend instance
+
+    Raises:
+        ValueError: If ``kind`` is not a known backend
+    """
+    kind = kind.lower()
+    if kind == "memory":
+        return MemoryBackend(maxsize)
+    if kind == "sqlite":
+        return SQLiteBackend(maxsize, namespace)
+    if kind == "redis":
+        return RedisBackend(maxsize, namespace)
+    raise ValueError(f"Unknown cache backend: {kind}. Use memory, sqlite or redis.")
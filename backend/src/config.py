@@ -1,5 +1,6 @@
 """Application configuration and constants."""
 
+import os
 from typing import Dict, Set
 
 # CORS settings
@@ -21,6 +22,10 @@ A powerful job aggregation API that scrapes multiple job boards and returns unif
 - **Smart filtering**: Filters jobs by role relevance using synonym matching
 - **Work type filtering**: Filter by remote, hybrid, or on-site positions
 - **Salary range**: Search within specific salary ranges
+- **Streaming results**: `/api/search/stream` delivers each source's jobs as soon as it finishes
+- **Saved searches**: `/api/saved-searches` are refreshed on a schedule so they answer from cache
+- **Background searches**: `/api/searches` returns an id at once; poll it for progress and results
+- **Metrics**: `/metrics` exposes scrape, filter, cache and search metrics for Prometheus
 
 ### Supported Job Boards
 - Seek (Australia only)
@@ -81,8 +86,102 @@ WORK_TYPE_KEYWORDS = {
 }
 
 # Scraper settings
-SEEK_BASE_URL = "https://www.seek.com.au/jobs"
+JOBSPY_SITES = ["indeed", "linkedin", "glassdoor"]
+# Worker threads shared by all JobSpy board scrapes (one task per board per search)
+JOBSPY_MAX_WORKERS = int(os.environ.get("JOBSPY_MAX_WORKERS", "6"))
+# Overridable to point Seek scrapes at a stand-in job board (benchmarks/standin.py)
+SEEK_BASE_URL = os.environ.get("SEEK_BASE_URL", "https://www.seek.com.au/jobs")
 SEEK_USER_AGENT = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 )
+# Shared HTTP client settings for async scrapers (seconds / connection counts)
+HTTP_TIMEOUT = float(os.environ.get("HTTP_TIMEOUT", "15"))
+HTTP_CONNECT_TIMEOUT = float(os.environ.get("HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_MAX_CONNECTIONS = int(os.environ.get("HTTP_MAX_CONNECTIONS", "20"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.environ.get("HTTP_MAX_KEEPALIVE_CONNECTIONS", "10"))
+HTTP_KEEPALIVE_EXPIRY = float(os.environ.get("HTTP_KEEPALIVE_EXPIRY", "30"))
+# Outbound rate limits per host (JobSpy boards are keyed by site name): sustained
+# requests per second, burst size and maximum concurrent requests. Concurrency
+# halves when a host answers 403/429 and creeps back up on success.
+# JobSpy makes its own requests, so for the boards a "request" is a whole board
+# scrape (several result pages, plus description fetches on LinkedIn): these
+# limits bound scrapes per second, not HTTP requests per second.
+RATE_LIMIT_DEFAULT = {"rate": 2.0, "burst": 4, "max_concurrency": 4}
+RATE_LIMITS: Dict[str, Dict[str, float]] = {
+    "www.seek.com.au": {"rate": 2.0, "burst": 4, "max_concurrency": 4},
+    "linkedin": {"rate": 0.2, "burst": 1, "max_concurrency": 2},
+    "indeed": {"rate": 0.5, "burst": 2, "max_concurrency": 3},
+    "glassdoor": {"rate": 0.5, "burst": 2, "max_concurrency": 3},
+}
+# Proxy pool (JOBSPY_PROXIES): proxies handed to each scrape, failures in a row
+# before a proxy is quarantined, and its cool-down (doubling per quarantine, seconds)
+PROXY_SUBSET_SIZE = int(os.environ.get("PROXY_SUBSET_SIZE", "2"))
+PROXY_FAILURE_THRESHOLD = int(os.environ.get("PROXY_FAILURE_THRESHOLD", "2"))
+PROXY_BASE_COOLDOWN = float(os.environ.get("PROXY_BASE_COOLDOWN", "30"))
+PROXY_MAX_COOLDOWN = float(os.environ.get("PROXY_MAX_COOLDOWN", "1800"))
+# Route Seek requests through the proxy pool as well
+SEEK_USE_PROXIES = os.environ.get("SEEK_USE_PROXIES", "false").lower() == "true"
+# Circuit breakers: failed scrapes in a row before a source is skipped, and how
+# long it is skipped before a probe scrape is allowed (seconds)
+CIRCUIT_FAILURE_THRESHOLD = int(os.environ.get("CIRCUIT_FAILURE_THRESHOLD", "3"))
+CIRCUIT_RESET_TIMEOUT = float(os.environ.get("CIRCUIT_RESET_TIMEOUT", "60"))
+# Scraper traffic: "live", "record" (live, saving Seek responses and JobSpy
+# DataFrames under SCRAPER_RECORDINGS_DIR) or "replay" (answer from the recordings)
+SCRAPER_MODE = os.environ.get("SCRAPER_MODE", "live")
+SCRAPER_RECORDINGS_DIR = os.environ.get("SCRAPER_RECORDINGS_DIR", "recordings")
+# Number of job cards Seek returns per results page
+SEEK_PAGE_SIZE = 22
+# Seek page parser: "auto" (embedded JSON, then fast HTML, then legacy), "json", "fast", "legacy"
+SEEK_PARSER_ENGINE = os.environ.get("SEEK_PARSER_ENGINE", "auto")
+# Maximum Seek results pages fetched at the same time for one search
+SEEK_MAX_CONCURRENT_PAGES = int(os.environ.get("SEEK_MAX_CONCURRENT_PAGES", "4"))
+
+# Near-duplicate detection across sources: MinHash signature size and LSH bands
+# used to find similar titles, and the Jaccard similarity of title words needed
+# to merge two postings of the same company
+DEDUP_NUM_PERM = 64
+DEDUP_BANDS = 16
+DEDUP_THRESHOLD = float(os.environ.get("DEDUP_THRESHOLD", "0.8"))
+
+# Search cache lifetimes (seconds): results are fresh until the soft TTL, then
+# served while a background refresh runs until the hard TTL
+SEARCH_CACHE_TTL = int(os.environ.get("SEARCH_CACHE_TTL", "900"))
+SEARCH_CACHE_STALE_TTL = int(os.environ.get("SEARCH_CACHE_STALE_TTL", "3600"))
+# A source that failed in an otherwise good scrape is retried on its own after
+# this many seconds, doubling per consecutive failure up to SEARCH_CACHE_TTL
+SOURCE_RETRY_BACKOFF = int(os.environ.get("SOURCE_RETRY_BACKOFF", "60"))
+# Where the search caches live: "memory" (per process), or "sqlite" / "redis" to
+# share them between uvicorn workers on one host
+CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "memory")
+CACHE_PATH = os.environ.get("CACHE_PATH", "career_hunter_cache.db")
+CACHE_REDIS_URL = os.environ.get("CACHE_REDIS_URL", "redis://localhost:6379/0")
+
+# Time budget for scraping one search (seconds), overridable per request. Sources
+# run in parallel and each gets this share of it; a source that misses its budget
+# is dropped from the response and the search returns what finished in time.
+SEARCH_DEADLINE = float(os.environ.get("SEARCH_DEADLINE", "25"))
+SOURCE_BUDGETS: Dict[str, float] = {
+    "seek": 0.8,
+    "linkedin": 1.0,
+    "indeed": 1.0,
+    "glassdoor": 1.0,
+}
+
+# Submitted (asynchronous) searches: scrapes run at the same time, and finished
+# searches kept for polling before the oldest are forgotten
+SEARCH_MAX_CONCURRENT = int(os.environ.get("SEARCH_MAX_CONCURRENT", "2"))
+SEARCH_MAX_RETAINED = int(os.environ.get("SEARCH_MAX_RETAINED", "200"))
+
+# Saved searches refreshed in the background: whether the scheduler runs, how
+# often it checks for due searches, the maximum random delay added to each run,
+# and refreshes allowed at once
+SCHEDULER_ENABLED = os.environ.get("SCHEDULER_ENABLED", "true").lower() == "true"
+SCHEDULER_TICK = float(os.environ.get("SCHEDULER_TICK", "5"))
+SCHEDULER_JITTER = float(os.environ.get("SCHEDULER_JITTER", "60"))
+SCHEDULER_MAX_CONCURRENT = int(os.environ.get("SCHEDULER_MAX_CONCURRENT", "2"))
+
+# Job store settings
+JOB_STORE_PATH = os.environ.get("JOB_STORE_PATH", "career_hunter.db")
+# Maximum age (seconds) of a stored search result that can answer a cache miss
+JOB_STORE_MAX_AGE = int(os.environ.get("JOB_STORE_MAX_AGE", "3600"))
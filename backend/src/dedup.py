@@ -0,0 +1,207 @@
+"""Cross-source near-duplicate detection using MinHash signatures and LSH banding."""
+
+import logging
+import re
+import zlib
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from .config import DEDUP_BANDS, DEDUP_NUM_PERM, DEDUP_THRESHOLD
+except ImportError:
+    from config import DEDUP_BANDS, DEDUP_NUM_PERM, DEDUP_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+# Universal hashing (a * x + b) mod p with a 31-bit prime keeps every product
+# of a and a 32-bit shingle hash inside uint64
+_PRIME = np.uint64((1 << 31) - 1)
+# Fixed seed so signatures are stable across processes and restarts
+_rng = np.random.default_rng(20240101)
+_HASH_A = _rng.integers(1, (1 << 31) - 1, size=DEDUP_NUM_PERM, dtype=np.uint64)
+_HASH_B = _rng.integers(0, (1 << 31) - 1, size=DEDUP_NUM_PERM, dtype=np.uint64)
+_ROWS_PER_BAND = DEDUP_NUM_PERM // DEDUP_BANDS
+
+# Title abbreviations boards spell differently
+_TITLE_ABBREVIATIONS = {
+    "sr": "senior",
+    "snr": "senior",
+    "jr": "junior",
+    "jnr": "junior",
+    "eng": "engineer",
+    "dev": "developer",
+    "mgr": "manager",
+}
+# Work arrangements some boards append to titles
+_TITLE_NOISE = frozenset({"remote", "hybrid", "onsite", "contract", "permanent", "temporary"})
+# Legal suffixes left out when comparing company names
+_COMPANY_SUFFIXES = frozenset(
+    {"pty", "ltd", "limited", "inc", "llc", "plc", "co", "corp", "corporation", "the"}
+)
+
+
+def _words(value: Any) -> List[str]:
+    return _WORD_PATTERN.findall(str(value or "").lower())
+
+
+def _company_key(job: Dict[str, Any]) -> str:
+    """Normalized company name: lowercase words without legal suffixes."""
+    return " ".join(word for word in _words(job.get("company")) if word not in _COMPANY_SUFFIXES)
+
+
+def _location_tokens(job: Dict[str, Any]) -> FrozenSet[str]:
+    return frozenset(_words(job.get("location")))
+
+
+def _title_tokens(job: Dict[str, Any]) -> FrozenSet[str]:
+    """Normalized title words, without work arrangements or the job's own location."""
+    location = _location_tokens(job)
+    words = (_TITLE_ABBREVIATIONS.get(word, word) for word in _words(job.get("title")))
+    return frozenset(word for word in words if word not in _TITLE_NOISE and word not in location)
+
+
+def minhash_signature(job: Dict[str, Any]) -> np.ndarray:
+    """Compute the MinHash signature of a job's normalized title over character trigrams."""
+    text = " ".join(sorted(_title_tokens(job)))
+    shingles = {text[i : i + 3] for i in range(max(1, len(text) - 2))}
+
+    hashes = np.fromiter(
+        (zlib.crc32(shingle.encode()) for shingle in shingles),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+    permuted = (_HASH_A[:, None] * hashes[None, :] + _HASH_B[:, None]) % _PRIME
+    return permuted.min(axis=1)
+
+
+def _band_keys(company: str, signature: np.ndarray) -> List[Tuple[str, int, bytes]]:
+    """Split a signature into LSH band keys, scoped to a company."""
+    return [
+        (
+            company,
+            band,
+            signature[band * _ROWS_PER_BAND : (band + 1) * _ROWS_PER_BAND].tobytes(),
+        )
+        for band in range(DEDUP_BANDS)
+    ]
+
+
+def _jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Exact Jaccard similarity of two token sets."""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class Deduplicator:
+    """Incrementally collapse near-duplicate postings found on different sources.
+
+    The first job seen for a posting becomes the canonical copy and collects
+    every source's job URL in ``source_urls``. Jobs are only compared with
+    canonical jobs of the same company whose titles share an LSH bucket, so
+    cost grows roughly linearly with the number of jobs. A candidate is merged
+    when the Jaccard similarity of the normalized title words reaches the
+    threshold and the locations (when both are known) share a word.
+    Descriptions are not compared: boards truncate them differently and they
+    often open with the same company boilerplate for every role. Jobs from the
+    same site are never merged.
+    """
+
+    def __init__(self, threshold: float = DEDUP_THRESHOLD):
+        self._threshold = threshold
+        self._buckets: Dict[Tuple[str, int, bytes], List[int]] = {}
+        self._titles: List[FrozenSet[str]] = []
+        self._locations: List[FrozenSet[str]] = []
+        self._canonical: List[Dict[str, Any]] = []
+        self.seen = 0
+        self.duplicates = 0
+
+    @property
+    def duplicate_ratio(self) -> float:
+        """Fraction of jobs seen so far that were duplicates."""
+        return self.duplicates / self.seen if self.seen else 0.0
+
+    def _find_match(
+        self,
+        keys: List[Tuple[str, int, bytes]],
+        title: FrozenSet[str],
+        location: FrozenSet[str],
+        site: Any,
+    ) -> Optional[int]:
+        """Return the index of the canonical job this one duplicates, if any."""
+        checked = set()
+        for key in keys:
+            for index in self._buckets.get(key, ()):
+                if index in checked:
+                    continue
+                checked.add(index)
+                if self._canonical[index].get("site") == site:
+                    continue
+                other_location = self._locations[index]
+                if location and other_location and not location & other_location:
+                    continue
+                if _jaccard(self._titles[index], title) >= self._threshold:
+                    return index
+        return None
+
+    def add(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Add jobs and return the ones that are not duplicates of earlier jobs.
+
+        Args:
+            jobs: Job dictionaries (not modified)
+
+        Returns:
+            Canonical copies of the new postings, each with ``source_urls``
+        """
+        new_jobs = []
+        for job in jobs:
+            self.seen += 1
+            title = _title_tokens(job)
+            location = _location_tokens(job)
+            job_url = job.get("job_url")
+            # Without a company or title there is nothing reliable to match on
+            company = _company_key(job)
+            keys = _band_keys(company, minhash_signature(job)) if company and title else []
+
+            match = self._find_match(keys, title, location, job.get("site"))
+            if match is not None:
+                self.duplicates += 1
+                source_urls = self._canonical[match]["source_urls"]
+                if job_url and job_url not in source_urls:
+                    source_urls.append(job_url)
+                continue
+
+            canonical = {**job, "source_urls": [job_url] if job_url else []}
+            index = len(self._canonical)
+            self._canonical.append(canonical)
+            self._titles.append(title)
+            self._locations.append(location)
+            for key in keys:
+                self._buckets.setdefault(key, []).append(index)
+            new_jobs.append(canonical)
+        return new_jobs
+
+
+def dedupe_jobs(jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Collapse cross-source near-duplicates, keeping the first copy of each posting.
+
+    Args:
+        jobs: List of job dictionaries
+
+    Returns:
+        Canonical jobs in original order, each with ``source_urls``
+    """
+    deduplicator = Deduplicator()
+    unique = deduplicator.add(jobs)
+    logger.info(
+        "Dedup: %d of %d jobs were duplicates (ratio %.2f)",
+        deduplicator.duplicates,
+        deduplicator.seen,
+        deduplicator.duplicate_ratio,
+    )
+    return unique
@@ -6,7 +6,7 @@ import asyncio
 import pandas as pd
 from tabulate import tabulate
 
-from scrapers import scrape_others, scrape_seek
+from scrapers import create_http_client, scrape_others, scrape_seek
 from utils import filter_jobs, parse_salary
 
 
@@ -31,7 +31,8 @@ async def run_search(role: str, country: str, location: str, salary: str, limit:
 
     # Scrape Seek (Australia only)
     if country.upper() == "AU":
-        seek_jobs = await scrape_seek(role, min_sal, max_sal, limit=limit)
+        async with create_http_client() as client:
+            seek_jobs = await scrape_seek(role, min_sal, max_sal, limit=limit, client=client)
         all_jobs.extend(seek_jobs)
         print(f"Found {len(seek_jobs)} jobs on Seek")
 
@@ -0,0 +1,290 @@
+"""In-process metrics exposed in the Prometheus text format.
+
+Counters, gauges and histograms are kept in memory per process and rendered
+by ``/metrics``. Recording is a dictionary lookup plus a locked add, so the
+scrape, filter and cache hot paths can be instrumented without measurable
+overhead. Values that already live elsewhere (cache sizes, queue depth) are
+read by callbacks only when the metrics are rendered.
+"""
+
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Latency buckets in seconds, from sub-millisecond filters to slow board scrapes
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: List["Metric"] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: "Metric") -> None:
+        """Add a metric; names must be unique."""
+        with self._lock:
+            if any(existing.name == metric.name for existing in self._metrics):
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics.append(metric)
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format."""
+        with self._lock:
+            metrics = list(self._metrics)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+class Metric:
+    """Base class for a named metric with optional labels."""
+
+    kind = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: MetricsRegistry = REGISTRY,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        registry.register(self)
+
+    def samples(self) -> List[str]:
+        """Rendered sample lines."""
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """Monotonically increasing count per label combination."""
+
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        """Add ``amount`` to the count for the given label values."""
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def value(self, *labelvalues: str) -> float:
+        """Current count for the given label values."""
+        return self._values.get(labelvalues, 0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in values
+        ]
+
+
+class Gauge(Counter):
+    """Value that can go up and down per label combination."""
+
+    kind = "gauge"
+
+    def dec(self, *labelvalues: str, amount: float = 1) -> None:
+        """Subtract ``amount`` from the value for the given label values."""
+        self.inc(*labelvalues, amount=-amount)
+
+    def set(self, *labelvalues: str, value: float) -> None:
+        """Set the value for the given label values."""
+        with self._lock:
+            self._values[labelvalues] = value
+
+    @contextmanager
+    def track(self, *labelvalues: str) -> Iterator[None]:
+        """Count the enclosed block as in progress."""
+        self.inc(*labelvalues)
+        try:
+            yield
+        finally:
+            self.dec(*labelvalues)
+
+
+class CallbackGauge(Metric):
+    """Gauge or counter whose values are read from a callback at render time.
+
+    The callback returns ``{label values: value}``; an unlabelled metric uses
+    the empty tuple as its only key.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        callback: Callable[[], Dict[LabelValues, float]],
+        kind: str = "gauge",
+        registry: MetricsRegistry = REGISTRY,
+    ):
+        super().__init__(name, documentation, labelnames, registry)
+        self.kind = kind
+        self._callback = callback
+
+    def samples(self) -> List[str]:
+        values = sorted(self._callback().items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in values
+        ]
+
+
+class _Distribution:
+    """Bucket counts and sum of one histogram's observations."""
+
+    __slots__ = ("counts", "total")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.total = 0.0
+
+
+class Histogram(Metric):
+    """Distribution of observed values in cumulative buckets per label combination."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        registry: MetricsRegistry = REGISTRY,
+    ):
+        super().__init__(name, documentation, labelnames, registry)
+        self.buckets = tuple(sorted(buckets))
+        # Per label values; the last bucket counts observations above every bound
+        self._values: Dict[LabelValues, _Distribution] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """Record one observation for the given label values."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            distribution = self._values.get(labelvalues)
+            if distribution is None:
+                distribution = _Distribution(len(self.buckets) + 1)
+                self._values[labelvalues] = distribution
+            distribution.counts[index] += 1
+            distribution.total += value
+
+    @contextmanager
+    def time(self, *labelvalues: str) -> Iterator[None]:
+        """Observe how long the enclosed block takes, in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *labelvalues)
+
+    def count(self, *labelvalues: str) -> int:
+        """Number of observations for the given label values."""
+        distribution = self._values.get(labelvalues)
+        return sum(distribution.counts) if distribution else 0
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(
+                (labels, (list(d.counts), d.total)) for labels, d in self._values.items()
+            )
+        lines = []
+        for labels, (counts, total) in values:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                bucket_labels = _format_labels(
+                    (*self.labelnames, "le"), (*labels, _format_value(bound))
+                )
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+# Application metrics
+
+SEARCH_DURATION = Histogram(
+    "career_hunter_search_duration_seconds",
+    "Time to answer /api/search, by whether the fresh cache answered it",
+    ["cache"],
+)
+SEARCHES_IN_FLIGHT = Gauge(
+    "career_hunter_searches_in_flight",
+    "Search requests currently being answered, by endpoint",
+    ["endpoint"],
+)
+SCRAPE_DURATION = Histogram(
+    "career_hunter_scrape_duration_seconds",
+    "Time spent scraping one source for one search",
+    ["source"],
+)
+SCRAPES = Counter(
+    "career_hunter_scrapes_total",
+    "Source scrapes by outcome (completed, failed, timeout, skipped)",
+    ["source", "status"],
+)
+SOURCE_JOBS = Counter(
+    "career_hunter_source_jobs_total",
+    "Jobs per source: scraped, and kept after the role and work-type filters",
+    ["source", "stage"],
+)
+FILTER_DURATION = Histogram(
+    "career_hunter_filter_duration_seconds",
+    "Time spent in a job filter",
+    ["filter"],
+)
+FILTER_JOBS = Counter(
+    "career_hunter_filter_jobs_total",
+    "Jobs passed through a job filter, by whether they were kept",
+    ["filter", "result"],
+)
+CACHE_REQUESTS = Counter(
+    "career_hunter_cache_requests_total",
+    "Cache lookups by result (hit, stale, miss)",
+    ["cache", "result"],
+)
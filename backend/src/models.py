@@ -2,7 +2,7 @@
 
 import math
 from datetime import date
-from typing import Any, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field, field_serializer, field_validator
 
@@ -72,6 +72,14 @@ class SearchRequest(BaseModel):
         le=100,
         json_schema_extra={"example": 25},
     )
+    deadline: Optional[float] = Field(
+        default=None,
+        description="Seconds to spend scraping before returning partial results "
+        "(default: server setting)",
+        gt=0,
+        le=120,
+        json_schema_extra={"example": 20},
+    )
 
 
 class Job(BaseModel):
@@ -91,6 +99,9 @@ class Job(BaseModel):
     work_from_home_type: Optional[str] = Field(
         None, description="Work arrangement type (remote, hybrid, etc.)"
     )
+    source_urls: Optional[List[str]] = Field(
+        None, description="Job URLs for this posting on every source it was found on"
+    )
 
     @field_validator(
         "location",
@@ -124,3 +135,67 @@ class HealthResponse(BaseModel):
     """Health check response model."""
 
     status: str = Field(..., description="Service status", json_schema_extra={"example": "ok"})
+
+
+class SourceProgress(BaseModel):
+    """Progress of one source within a submitted search."""
+
+    status: str = Field(
+        ..., description="Source status: 'pending', 'completed', 'failed', 'timeout' or 'skipped'"
+    )
+    count: Optional[int] = Field(None, description="Jobs scraped from this source")
+    error: Optional[str] = Field(None, description="Error message if the source failed")
+
+
+class SearchStatus(BaseModel):
+    """Status of a search submitted to the background pool."""
+
+    id: str = Field(..., description="Search identifier")
+    status: str = Field(
+        ...,
+        description="Search status: 'queued', 'running', 'completed' or 'failed'",
+        json_schema_extra={"example": "running"},
+    )
+    request: SearchRequest = Field(..., description="The submitted search parameters")
+    sources: Dict[str, SourceProgress] = Field(
+        default_factory=dict, description="Progress of every source being scraped"
+    )
+    total: Optional[int] = Field(None, description="Number of results once completed")
+    error: Optional[str] = Field(None, description="Error message if the search failed")
+    created_at: float = Field(..., description="Submission time (Unix seconds)")
+    started_at: Optional[float] = Field(None, description="Time scraping started")
+    finished_at: Optional[float] = Field(None, description="Time the search finished")
+
+
+class SearchResultsPage(BaseModel):
+    """One page of a completed search's results."""
+
+    id: str = Field(..., description="Search identifier")
+    total: int = Field(..., description="Total number of results")
+    offset: int = Field(..., description="Index of the first job in this page")
+    limit: int = Field(..., description="Maximum number of jobs in this page")
+    jobs: List[Job] = Field(..., description="Jobs in this page")
+
+
+class SavedSearchCreate(BaseModel):
+    """Request model for saving a search to refresh in the background."""
+
+    search: SearchRequest = Field(..., description="Search parameters to keep fresh")
+    interval: int = Field(
+        default=600,
+        description="Seconds between background refreshes",
+        ge=60,
+        le=86400,
+        json_schema_extra={"example": 600},
+    )
+
+
+class SavedSearch(BaseModel):
+    """A saved search refreshed on a schedule."""
+
+    id: str = Field(..., description="Saved search identifier")
+    search: SearchRequest = Field(..., description="Search parameters")
+    interval: int = Field(..., description="Seconds between background refreshes")
+    created_at: float = Field(..., description="Creation time (Unix seconds)")
+    last_run: Optional[float] = Field(None, description="Time of the last refresh")
+    last_error: Optional[str] = Field(None, description="Error from the last refresh, if any")
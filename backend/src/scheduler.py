@@ -0,0 +1,132 @@
+"""In-process scheduler that keeps saved searches warm in the cache and store."""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+try:
+    from .config import SCHEDULER_JITTER, SCHEDULER_MAX_CONCURRENT, SCHEDULER_TICK
+    from .tracing import detached_task
+except ImportError:
+    from config import SCHEDULER_JITTER, SCHEDULER_MAX_CONCURRENT, SCHEDULER_TICK
+    from tracing import detached_task
+
+logger = logging.getLogger(__name__)
+
+# Loads saved search records ({"id", "request", "interval", "last_run", ...}); called in a thread
+SavedSearchLoader = Callable[[], List[Dict[str, Any]]]
+# Refreshes one saved search
+SavedSearchRefresher = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class SavedSearchScheduler:
+    """Refresh each saved search on its own interval.
+
+    Start times are jittered so searches saved together (or a restart) do not
+    scrape all at once, and at most ``max_concurrent`` refreshes run at a time.
+    The saved searches are re-read on every tick, so additions and deletions
+    take effect without a restart.
+    """
+
+    def __init__(
+        self,
+        load: SavedSearchLoader,
+        refresh: SavedSearchRefresher,
+        max_concurrent: int = SCHEDULER_MAX_CONCURRENT,
+        jitter: float = SCHEDULER_JITTER,
+        tick: float = SCHEDULER_TICK,
+    ):
+        self._load = load
+        self._refresh = refresh
+        self._max_concurrent = max_concurrent
+        self._jitter = jitter
+        self._tick = tick
+        self._next_run: Dict[str, float] = {}
+        self._running: Set[str] = set()
+        self._tasks: Set[asyncio.Future] = set()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop_task: Optional[asyncio.Future] = None
+
+    def _schedule(self, saved: Dict[str, Any], now: float) -> float:
+        """Return the next run time of a saved search, scheduling it if new."""
+        next_run = self._next_run.get(saved["id"])
+        if next_run is None:
+            # Honour refreshes made before a restart, then spread the start
+            due = (saved.get("last_run") or 0) + saved["interval"]
+            next_run = max(due, now) + random.uniform(0, self._jitter)
+            self._next_run[saved["id"]] = next_run
+        return next_run
+
+    async def run_pending(self) -> int:
+        """Start refreshes for every saved search that is due. Returns how many started."""
+        loop = asyncio.get_running_loop()
+        saved_searches = await loop.run_in_executor(None, self._load)
+        now = time.time()
+
+        started = 0
+        for saved in saved_searches:
+            if saved["id"] in self._running or self._schedule(saved, now) > now:
+                continue
+            self._running.add(saved["id"])
+            # Refreshes are not traced with whichever request or tick started them
+            task = detached_task(self._run(saved))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            started += 1
+
+        # Forget deleted searches
+        current = {saved["id"] for saved in saved_searches}
+        for saved_id in list(self._next_run):
+            if saved_id not in current:
+                del self._next_run[saved_id]
+        return started
+
+    def _concurrency(self) -> asyncio.Semaphore:
+        """Semaphore bounding running refreshes, created on first use inside the event loop."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrent)
+        return self._semaphore
+
+    async def _run(self, saved: Dict[str, Any]) -> None:
+        try:
+            async with self._concurrency():
+                logger.info("Refreshing saved search %s", saved["id"])
+                await self._refresh(saved)
+        except Exception as e:
+            logger.error("Saved search %s refresh failed: %s", saved["id"], e)
+        finally:
+            self._running.discard(saved["id"])
+            self._next_run[saved["id"]] = (
+                time.time() + saved["interval"] + random.uniform(0, self._jitter)
+            )
+
+    async def _run_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self._tick)
+            try:
+                await self.run_pending()
+            except Exception as e:
+                logger.error("Saved search scheduler tick failed: %s", e)
+
+    async def wait(self) -> None:
+        """Wait for the refreshes currently running to finish."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def start(self) -> None:
+        """Start checking for due saved searches every tick."""
+        if self._loop_task is None:
+            self._loop_task = asyncio.ensure_future(self._run_forever())
+
+    async def stop(self) -> None:
+        """Stop the scheduler and cancel refreshes in progress."""
+        tasks = list(self._tasks)
+        if self._loop_task is not None:
+            tasks.append(self._loop_task)
+            self._loop_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._semaphore = None
@@ -1,2 +1,13 @@
-from .jobspy_wrapper import scrape_others  # noqa: F401
+from .breaker import breaker_stats, get_breaker  # noqa: F401
+from .http_client import create_http_client  # noqa: F401
+from .jobspy_wrapper import (  # noqa: F401
+    JOBSPY_EXECUTOR,
+    detach,
+    detached_workers,
+    pool_saturated,
+    scrape_others,
+    scrape_site,
+)
+from .proxies import PROXY_POOL  # noqa: F401
+from .ratelimit import limiter_stats  # noqa: F401
 from .seek import scrape_seek  # noqa: F401
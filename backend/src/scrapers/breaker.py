@@ -0,0 +1,130 @@
+"""Per-source circuit breakers.
+
+A source that keeps failing is skipped instantly instead of making every
+search wait for its full failure path. After a cool-down one probe scrape is
+let through; its outcome closes the circuit again or re-opens it.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict
+
+try:
+    from .config import CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT
+except ImportError:
+    from config import CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit breaker for one source.
+
+    The circuit opens after ``failure_threshold`` failed scrapes in a row and
+    stays open for ``reset_timeout`` seconds. Then it is half-open: a single
+    probe is allowed, and other scrapes are skipped until the probe reports.
+    A probe that never reports (e.g. it was cancelled) is replaced by a new
+    one after another ``reset_timeout``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_RESET_TIMEOUT,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_started = 0.0
+        self._lock = threading.Lock()
+
+    def is_open(self) -> bool:
+        """Whether scrapes are currently being skipped, without claiming a probe."""
+        with self._lock:
+            if self.state == CLOSED:
+                return False
+            if self.state == OPEN:
+                return time.monotonic() < self.opened_at + self.reset_timeout
+            return time.monotonic() < self._probe_started + self.reset_timeout
+
+    def allow(self) -> bool:
+        """Return whether a scrape may run now; may claim the half-open probe."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            now = time.monotonic()
+            if self.state == OPEN:
+                if now < self.opened_at + self.reset_timeout:
+                    return False
+                self.state = HALF_OPEN
+                logger.info("Circuit for %s half-open; probing", self.name)
+            elif now < self._probe_started + self.reset_timeout:
+                return False
+            self._probe_started = now
+            return True
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful scrape."""
+        with self._lock:
+            if self.state != CLOSED:
+                logger.info("Circuit for %s closed", self.name)
+            self.state = CLOSED
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        """Count a failed scrape, opening the circuit at the threshold or on a failed probe."""
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    logger.warning(
+                        "Circuit for %s open for %.0fs after %d failures",
+                        self.name,
+                        self.reset_timeout,
+                        self.failures,
+                    )
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        """Current state for diagnostics."""
+        with self._lock:
+            retry_in = 0.0
+            if self.state == OPEN:
+                retry_in = max(0.0, self.opened_at + self.reset_timeout - time.monotonic())
+            return {"state": self.state, "failures": self.failures, "retry_in": round(retry_in, 1)}
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(source: str) -> CircuitBreaker:
+    """Return the shared circuit breaker for a source, creating it on first use."""
+    with _breakers_lock:
+        breaker = _breakers.get(source)
+        if breaker is None:
+            breaker = CircuitBreaker(source)
+            _breakers[source] = breaker
+        return breaker
+
+
+def breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """State of every source's circuit seen so far."""
+    with _breakers_lock:
+        return {source: breaker.stats() for source, breaker in _breakers.items()}
+
+
+def reset_breakers() -> None:
+    """Forget every circuit, closing them all."""
+    with _breakers_lock:
+        _breakers.clear()
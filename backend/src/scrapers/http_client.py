@@ -0,0 +1,75 @@
+"""Shared httpx client factory for async scrapers."""
+
+import importlib.util
+import logging
+from typing import Optional
+
+import httpx
+
+from .ratelimit import RateLimitedTransport
+from .replay import REPLAY, wrap_transport
+
+try:
+    from .config import (
+        HTTP_CONNECT_TIMEOUT,
+        HTTP_KEEPALIVE_EXPIRY,
+        HTTP_MAX_CONNECTIONS,
+        HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        HTTP_TIMEOUT,
+        SCRAPER_MODE,
+    )
+except ImportError:
+    from config import (
+        HTTP_CONNECT_TIMEOUT,
+        HTTP_KEEPALIVE_EXPIRY,
+        HTTP_MAX_CONNECTIONS,
+        HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        HTTP_TIMEOUT,
+        SCRAPER_MODE,
+    )
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional h2 package; without it the client uses HTTP/1.1 keep-alive
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def create_http_client(proxy: Optional[str] = None) -> httpx.AsyncClient:
+    """
+    Create an AsyncClient tuned for scraping.
+
+    The client should be long-lived (one per app or CLI run) so that
+    connections and TLS sessions are reused across searches. Every request
+    goes through the shared per-host rate limiter. With SCRAPER_MODE=record
+    responses are saved as they arrive; with SCRAPER_MODE=replay they are
+    answered from the recordings instead, without rate limiting.
+
+    Args:
+        proxy: Optional proxy URL; "host:port" entries from JOBSPY_PROXIES are
+            treated as HTTP proxies
+
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    logger.info("Creating shared HTTP client (http2=%s)", HTTP2_AVAILABLE)
+    if proxy and "://" not in proxy:
+        proxy = f"http://{proxy}"
+    transport = httpx.AsyncHTTPTransport(
+        http2=HTTP2_AVAILABLE,
+        proxy=proxy,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+    )
+    if SCRAPER_MODE == REPLAY:
+        # Nothing leaves the process, so there is no host to protect
+        return httpx.AsyncClient(
+            transport=wrap_transport(transport, REPLAY),
+            timeout=httpx.Timeout(HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+        )
+    return httpx.AsyncClient(
+        transport=RateLimitedTransport(wrap_transport(transport, SCRAPER_MODE)),
+        timeout=httpx.Timeout(HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+    )
@@ -1,25 +1,111 @@
 """JobSpy wrapper for scraping LinkedIn, Indeed, and Glassdoor."""
 
 import logging
-import os
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Set
 
 import pandas as pd
 from jobspy import scrape_jobs
 
+from .proxies import PROXY_POOL
+from .ratelimit import RateLimitTimeout, get_limiter
+from .replay import RECORD, REPLAY, load_frame, save_frame
+
 try:
-    from .config import COUNTRY_MAP
+    from .config import COUNTRY_MAP, JOBSPY_MAX_WORKERS, JOBSPY_SITES, SCRAPER_MODE
 except ImportError:
-    from config import COUNTRY_MAP
+    from config import COUNTRY_MAP, JOBSPY_MAX_WORKERS, JOBSPY_SITES, SCRAPER_MODE
+
+# Relative to src when it is a package, otherwise src is on sys.path
+try:
+    from ..tracing import span
+except ImportError:
+    from tracing import span
 
 logger = logging.getLogger(__name__)
 
-# Proxy configuration from environment variable
-# Format: comma-separated list of proxies, e.g., "user:pass@host:port,host2:port2"
-PROXY_LIST: Optional[List[str]] = None
-_proxy_env = os.environ.get("JOBSPY_PROXIES", "")
-if _proxy_env:
-    PROXY_LIST = [p.strip() for p in _proxy_env.split(",") if p.strip()]
+# Dedicated bounded pool for board scrapes, so each board runs as its own task
+# without competing with the event loop's default executor
+JOBSPY_EXECUTOR = ThreadPoolExecutor(max_workers=JOBSPY_MAX_WORKERS, thread_name_prefix="jobspy")
+
+# Board scrapes whose caller stopped waiting; a worker thread cannot be
+# interrupted, so each holds its JOBSPY_EXECUTOR worker until it finishes
+_detached: Set[Future] = set()
+_detached_lock = threading.Lock()
+
+# JobSpy's board scrapers do not raise when a board fails (non-200 responses,
+# blocks, request errors): they log an error to these loggers and return no jobs
+_JOBSPY_LOGGERS = {
+    "linkedin": "JobSpy:LinkedIn",
+    "indeed": "JobSpy:Indeed",
+    "glassdoor": "JobSpy:Glassdoor",
+}
+
+
+def detach(future: Future) -> None:
+    """Give up on a board scrape: drop it if still queued, else count its worker as held."""
+    if future.cancel():
+        return
+    with _detached_lock:
+        _detached.add(future)
+    future.add_done_callback(_release)
+
+
+def _release(future: Future) -> None:
+    with _detached_lock:
+        _detached.discard(future)
+
+
+def detached_workers() -> int:
+    """JOBSPY_EXECUTOR workers still running scrapes their callers gave up on."""
+    with _detached_lock:
+        return len(_detached)
+
+
+def pool_saturated() -> bool:
+    """Whether detached scrapes hold every worker, so a new scrape would only queue."""
+    return detached_workers() >= JOBSPY_MAX_WORKERS
+
+
+class JobSpyError(RuntimeError):
+    """A JobSpy board scrape logged errors and returned no jobs."""
+
+    def __init__(self, site: str, errors: List[str]):
+        super().__init__(f"{site} scrape failed: {errors[-1]}")
+        self.site = site
+        self.errors = errors
+
+
+class _ErrorCollector(logging.Handler):
+    """Collects the messages of ERROR records logged while it is attached."""
+
+    def __init__(self) -> None:
+        super().__init__(logging.ERROR)
+        self.messages: List[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+@contextmanager
+def _capture_errors(site: str) -> Iterator[List[str]]:
+    """
+    Collect the errors JobSpy logs for a board during the enclosed scrape.
+
+    JobSpy scrapes in its own worker threads, so records cannot be tied to one
+    call: errors logged by an overlapping scrape of the same board count too.
+    Both scrapes hit the same board, so they share its outages.
+    """
+    collector = _ErrorCollector()
+    board_logger = logging.getLogger(_JOBSPY_LOGGERS.get(site, f"JobSpy:{site.title()}"))
+    board_logger.addHandler(collector)
+    try:
+        yield collector.messages
+    finally:
+        board_logger.removeHandler(collector)
 
 
 def _get_country_name(country_code: str) -> str:
@@ -35,6 +121,23 @@ def _safe_get(row: pd.Series, key: str, default: Any = None) -> Any:
     return value
 
 
+# Output fields and the default used when JobSpy leaves a value missing or NaN
+_FIELD_DEFAULTS: Dict[str, Any] = {
+    "id": "N/A",
+    "site": "N/A",
+    "title": "N/A",
+    "company": "N/A",
+    "location": "N/A",
+    "date_posted": "N/A",
+    "job_url": "N/A",
+    "salary_range": "N/A",
+    "company_url": "N/A",
+    "description": "",
+    "is_remote": False,
+    "work_from_home_type": "",
+}
+
+
 def _format_job(row: pd.Series) -> Dict[str, Any]:
     """Format a job row from JobSpy into a standardized dictionary."""
     # Get company URL (prefer direct, then platform specific)
@@ -58,64 +161,179 @@ def _format_job(row: pd.Series) -> Dict[str, Any]:
     }
 
 
+def _format_jobs(jobs_df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Format a JobSpy DataFrame into standardized dictionaries, column by column.
+
+    Produces the same records as calling _format_job on every row, but NaN
+    replacement and the company URL coalesce run once per column instead of
+    once per cell on a materialized Series.
+
+    Args:
+        jobs_df: DataFrame returned by scrape_jobs
+
+    Returns:
+        List of job dictionaries
+    """
+    frame = jobs_df.reindex(columns=[*_FIELD_DEFAULTS, "company_url_direct"]).astype(object)
+
+    # Get company URL (prefer direct whenever it is set and non-empty)
+    direct = frame["company_url_direct"]
+    has_direct = direct.notna() & direct.map(bool)
+    frame["company_url"] = direct.where(has_direct, frame["company_url"])
+
+    columns = []
+    for field, default in _FIELD_DEFAULTS.items():
+        column = frame[field]
+        columns.append(column.where(column.notna(), default).tolist())
+
+    # Emit all records in one pass over the column lists
+    fields = tuple(_FIELD_DEFAULTS)
+    return [dict(zip(fields, values)) for values in zip(*columns)]
+
+
+def _scrape_jobs_live(
+    site: str, scrape_params: Dict[str, Any], deadline: Optional[float] = None
+) -> pd.DataFrame:
+    """Run one JobSpy board scrape through the proxy pool and the board's rate limiter."""
+    # Hand JobSpy only the healthiest proxies; the outcome is credited to all of them
+    proxies = PROXY_POOL.select()
+    if proxies:
+        scrape_params = {**scrape_params, "proxies": proxies}
+        logger.info("Using %d proxies for scraping %s", len(proxies), site)
+
+    # JobSpy makes its own requests, so each board scrape counts as one limited
+    # request; the 403/429s it logs instead of raising throttle the board
+    try:
+        with get_limiter(site).limit(deadline) as outcome:
+            request_start = time.perf_counter()
+            with span(f"jobspy_{site}"), _capture_errors(site) as errors:
+                jobs_df: pd.DataFrame = scrape_jobs(**scrape_params)
+            for message in errors:
+                outcome.record_error(message)
+            if errors and jobs_df.empty:
+                raise JobSpyError(site, errors)
+    except RateLimitTimeout:
+        # The board was never contacted, so the proxies are not to blame
+        raise
+    except Exception:
+        PROXY_POOL.report(proxies, ok=False)
+        raise
+    # A blocked or refused proxy shows up only as logged errors
+    PROXY_POOL.report(proxies, ok=not errors, latency=time.perf_counter() - request_start)
+    return jobs_df
+
+
+def scrape_site(
+    site: str,
+    role: str,
+    location: str,
+    country_code: str = "AU",
+    limit: int = 25,
+    hours_old: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Scrape a single job board using JobSpy.
+
+    Unlike scrape_others, errors are raised so callers can tell a failed
+    board from one that returned no jobs, including JobSpyError when JobSpy
+    logged errors instead of raising and returned nothing.
+
+    Args:
+        site: JobSpy site name (indeed, linkedin, glassdoor)
+        role: Job role/title to search for
+        location: Location to search in
+        country_code: Country code (AU, US, UK, etc.)
+        limit: Maximum number of results (default 25)
+        hours_old: Only return jobs posted within this many hours (optional)
+        deadline: ``time.monotonic()`` after which the caller no longer waits;
+            a scrape still waiting on the rate limiter then raises
+            RateLimitTimeout without contacting the board (optional)
+
+    Returns:
+        List of job dictionaries
+    """
+    start = time.perf_counter()
+
+    # Build scrape parameters
+    scrape_params: Dict[str, Any] = {
+        "site_name": [site],
+        "search_term": role,
+        "location": location,
+        "results_wanted": limit,
+        "country_indeed": _get_country_name(country_code),
+        "linkedin_fetch_description": True,
+        "description_format": "markdown",
+    }
+
+    # Add optional parameters
+    if hours_old is not None:
+        scrape_params["hours_old"] = hours_old
+
+    if SCRAPER_MODE == REPLAY:
+        # Recorded frames are read from disk, so no proxy or rate limit is involved
+        with span(f"jobspy_{site}"):
+            jobs_df = load_frame(scrape_params)
+    else:
+        jobs_df = _scrape_jobs_live(site, scrape_params, deadline)
+        if SCRAPER_MODE == RECORD:
+            save_frame(scrape_params, jobs_df)
+    with span("jobspy_format"):
+        jobs = [] if jobs_df.empty else _format_jobs(jobs_df)
+
+    logger.info("Scraped %d jobs from %s in %.2fs", len(jobs), site, time.perf_counter() - start)
+    return jobs
+
+
 def scrape_others(
     role: str,
     location: str,
     country_code: str = "AU",
     limit: int = 25,
     hours_old: Optional[int] = None,
+    sites: Optional[List[str]] = None,
 ) -> List[Dict[str, Any]]:
     """
     Scrape jobs from LinkedIn, Indeed, and Glassdoor using JobSpy.
 
+    Each board is scraped as its own task on JOBSPY_EXECUTOR and results are
+    merged as they finish, so the call takes as long as the slowest board.
+
     Args:
         role: Job role/title to search for
         location: Location to search in
         country_code: Country code (AU, US, UK, etc.)
         limit: Maximum number of results per site (default 25)
         hours_old: Only return jobs posted within this many hours (optional)
+        sites: JobSpy site names to scrape (default JOBSPY_SITES)
 
     Returns:
         List of job dictionaries
     """
+    sites = sites or JOBSPY_SITES
     logger.info(
-        "Searching LinkedIn, Indeed, Glassdoor for '%s' in '%s' (limit=%d, hours_old=%s)",
+        "Searching %s for '%s' in '%s' (limit=%d, hours_old=%s)",
+        ", ".join(sites),
         role,
         country_code,
         limit,
         hours_old,
     )
 
-    country_name = _get_country_name(country_code)
+    futures = {
+        JOBSPY_EXECUTOR.submit(
+            scrape_site, site, role, location, country_code, limit, hours_old
+        ): site
+        for site in sites
+    }
+
+    jobs: List[Dict[str, Any]] = []
+    for future in as_completed(futures):
+        try:
+            jobs.extend(future.result())
+        except Exception as e:
+            logger.error("Error scraping %s: %s", futures[future], e)
 
-    try:
-        # Build scrape parameters
-        scrape_params = {
-            "site_name": ["indeed", "linkedin", "glassdoor"],
-            "search_term": role,
-            "location": location,
-            "results_wanted": limit,
-            "country_indeed": country_name,
-            "linkedin_fetch_description": True,
-            "description_format": "markdown",
-        }
-
-        # Add optional parameters
-        if hours_old is not None:
-            scrape_params["hours_old"] = hours_old
-
-        if PROXY_LIST:
-            scrape_params["proxies"] = PROXY_LIST
-            logger.info("Using %d proxies for scraping", len(PROXY_LIST))
-
-        jobs_df: pd.DataFrame = scrape_jobs(**scrape_params)
-
-        if jobs_df.empty:
-            return []
-
-        logger.info("Scraped %d jobs from job boards", len(jobs_df))
-        return [_format_job(row) for _, row in jobs_df.iterrows()]
-
-    except Exception as e:
-        logger.error("Error scraping other sites: %s", e)
-        return []
+    logger.info("Scraped %d jobs from job boards", len(jobs))
+    return jobs
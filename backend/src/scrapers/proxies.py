@@ -0,0 +1,149 @@
+"""Health-scored proxy pool for scrapers."""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+try:
+    from .config import (
+        PROXY_BASE_COOLDOWN,
+        PROXY_FAILURE_THRESHOLD,
+        PROXY_MAX_COOLDOWN,
+        PROXY_SUBSET_SIZE,
+    )
+except ImportError:
+    from config import (
+        PROXY_BASE_COOLDOWN,
+        PROXY_FAILURE_THRESHOLD,
+        PROXY_MAX_COOLDOWN,
+        PROXY_SUBSET_SIZE,
+    )
+
+logger = logging.getLogger(__name__)
+
+# Weight of the latest outcome in the moving averages
+_EWMA_ALPHA = 0.3
+
+
+class ProxyHealth:
+    """Moving-average health of one proxy."""
+
+    def __init__(self, proxy: str):
+        self.proxy = proxy
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        # Moving averages; new proxies start out as healthy and fast
+        self.success_rate = 1.0
+        self.latency = 0.0
+        self.quarantines = 0
+        self.quarantined_until = 0.0
+
+    @property
+    def score(self) -> float:
+        """Higher is healthier: success rate discounted by latency in seconds."""
+        return self.success_rate / (1.0 + self.latency)
+
+    def to_dict(self, now: float) -> Dict[str, Any]:
+        """Snapshot for monitoring."""
+        return {
+            "proxy": self.proxy,
+            "score": round(self.score, 3),
+            "success_rate": round(self.success_rate, 3),
+            "latency": round(self.latency, 3),
+            "successes": self.successes,
+            "failures": self.failures,
+            "quarantined_for": round(max(0.0, self.quarantined_until - now), 1),
+        }
+
+
+class ProxyPool:
+    """Rotate through proxies, preferring healthy ones and resting failing ones.
+
+    Every scrape reports its outcome for the proxies it used. After
+    ``failure_threshold`` failures in a row a proxy is quarantined; each
+    quarantine doubles the cool-down (up to ``max_cooldown``) until the proxy
+    succeeds again.
+    """
+
+    def __init__(
+        self,
+        proxies: List[str],
+        failure_threshold: int = PROXY_FAILURE_THRESHOLD,
+        base_cooldown: float = PROXY_BASE_COOLDOWN,
+        max_cooldown: float = PROXY_MAX_COOLDOWN,
+    ):
+        self._health = {proxy: ProxyHealth(proxy) for proxy in proxies}
+        self._failure_threshold = failure_threshold
+        self._base_cooldown = base_cooldown
+        self._max_cooldown = max_cooldown
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self._health)
+
+    def __len__(self) -> int:
+        return len(self._health)
+
+    def select(self, count: int = PROXY_SUBSET_SIZE) -> List[str]:
+        """
+        Return up to ``count`` of the healthiest proxies that are not quarantined.
+
+        When every proxy is quarantined the one released soonest is returned,
+        so scraping continues (slowly) instead of failing outright.
+        """
+        now = time.time()
+        with self._lock:
+            available = [h for h in self._health.values() if h.quarantined_until <= now]
+            if not available:
+                soonest = min(
+                    self._health.values(), key=lambda h: h.quarantined_until, default=None
+                )
+                return [soonest.proxy] if soonest else []
+            available.sort(key=lambda h: h.score, reverse=True)
+            return [h.proxy for h in available[:count]]
+
+    def report(self, proxies: List[str], ok: bool, latency: Optional[float] = None) -> None:
+        """Record the outcome of a request made through ``proxies``."""
+        now = time.time()
+        with self._lock:
+            for proxy in proxies:
+                health = self._health.get(proxy)
+                if health is None:
+                    continue
+                health.success_rate += _EWMA_ALPHA * ((1.0 if ok else 0.0) - health.success_rate)
+                if latency is not None:
+                    health.latency += _EWMA_ALPHA * (latency - health.latency)
+                if ok:
+                    health.successes += 1
+                    health.consecutive_failures = 0
+                    health.quarantines = 0
+                    continue
+
+                health.failures += 1
+                health.consecutive_failures += 1
+                if health.consecutive_failures >= self._failure_threshold:
+                    cooldown = min(self._max_cooldown, self._base_cooldown * 2**health.quarantines)
+                    health.quarantines += 1
+                    health.consecutive_failures = 0
+                    health.quarantined_until = now + cooldown
+                    logger.warning("Quarantining proxy %s for %.0fs", proxy, cooldown)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Health of every proxy, healthiest first."""
+        now = time.time()
+        with self._lock:
+            healths = sorted(self._health.values(), key=lambda h: h.score, reverse=True)
+            return [health.to_dict(now) for health in healths]
+
+
+def _parse_proxies(value: str) -> List[str]:
+    """Split a comma-separated proxy list."""
+    return [p.strip() for p in value.split(",") if p.strip()]
+
+
+# Proxy configuration from environment variable
+# Format: comma-separated list of proxies, e.g., "user:pass@host:port,host2:port2"
+PROXY_POOL = ProxyPool(_parse_proxies(os.environ.get("JOBSPY_PROXIES", "")))
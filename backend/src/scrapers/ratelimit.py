@@ -0,0 +1,239 @@
+"""Per-host rate limiting with a token bucket and AIMD adaptive concurrency.
+
+One ``HostLimiter`` per upstream host is shared by every search, whether it
+runs on the event loop (Seek via httpx) or in a JobSpy worker thread, so the
+aggregate request rate to a host stays bounded across concurrent searches.
+"""
+
+import asyncio
+import logging
+import re
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Union
+
+import httpx
+
+try:
+    from .config import RATE_LIMIT_DEFAULT, RATE_LIMITS
+except ImportError:
+    from config import RATE_LIMIT_DEFAULT, RATE_LIMITS
+
+logger = logging.getLogger(__name__)
+
+# Responses meaning the host wants us to slow down
+THROTTLE_STATUS_CODES = {403, 429}
+_THROTTLE_PATTERN = re.compile(r"\b(403|429)\b|too many requests|rate limit|blocked", re.IGNORECASE)
+
+# How often async waiters re-check for a free concurrency slot (seconds)
+_POLL_INTERVAL = 0.05
+
+
+class RateLimitTimeout(TimeoutError):
+    """A limited request could not start before its caller's deadline."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at ``rate`` tokens per second up to ``burst``."""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """Take a token and return how long to wait before using it (seconds).
+
+        With ``max_wait``, no token is taken and None is returned when the wait
+        would be longer.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+            if max_wait is not None and wait > max_wait:
+                return None
+            # Tokens may go negative: later callers queue behind earlier reservations
+            self._tokens -= 1
+            return wait
+
+    def drain(self) -> None:
+        """Drop stored tokens so the next request waits a full refill interval."""
+        with self._lock:
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = time.monotonic()
+
+
+class AdaptiveConcurrency:
+    """AIMD concurrency limit: grows by about one per window of successes, halves on throttling."""
+
+    def __init__(self, initial: int, maximum: int, minimum: int = 1):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = float(min(max(initial, minimum), maximum))
+        self.in_flight = 0
+        self._cond = threading.Condition()
+
+    def try_enter(self) -> bool:
+        """Take a slot if one is free."""
+        with self._cond:
+            if self.in_flight < int(self.limit):
+                self.in_flight += 1
+                return True
+            return False
+
+    def enter(self, timeout: Optional[float] = None) -> bool:
+        """Take a slot, blocking the calling thread until one is free or ``timeout`` passes."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self.in_flight < int(self.limit), timeout):
+                return False
+            self.in_flight += 1
+            return True
+
+    def leave(self, throttled: bool, adapt: bool = True) -> None:
+        """Release a slot and adapt the limit to the outcome, unless nothing was sent."""
+        with self._cond:
+            self.in_flight -= 1
+            if adapt and throttled:
+                self.limit = max(self.minimum, self.limit / 2)
+            elif adapt:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+
+class RequestOutcome:
+    """Collects the outcome of one limited request."""
+
+    def __init__(self) -> None:
+        self.throttled = False
+
+    def record_status(self, status_code: int) -> None:
+        """Mark the request throttled if the host answered 403 or 429."""
+        if status_code in THROTTLE_STATUS_CODES:
+            self.throttled = True
+
+    def record_error(self, error: Union[BaseException, str]) -> None:
+        """Mark the request throttled if an error (or logged error message) looks like a block."""
+        if _THROTTLE_PATTERN.search(str(error)):
+            self.throttled = True
+
+
+class HostLimiter:
+    """Rate and concurrency limits for one host."""
+
+    def __init__(self, host: str, rate: float, burst: float, max_concurrency: int):
+        self.host = host
+        self.bucket = TokenBucket(rate, burst)
+        self.concurrency = AdaptiveConcurrency(initial=max_concurrency, maximum=max_concurrency)
+
+    def _finish(self, outcome: RequestOutcome) -> None:
+        self.concurrency.leave(outcome.throttled)
+        if outcome.throttled:
+            self.bucket.drain()
+            logger.warning(
+                "Throttled by %s; concurrency limit now %.1f", self.host, self.concurrency.limit
+            )
+
+    @contextmanager
+    def limit(self, deadline: Optional[float] = None) -> Iterator[RequestOutcome]:
+        """Wait for a slot and a token in the calling thread, then run one request.
+
+        ``deadline`` (a ``time.monotonic()`` value) bounds both waits: when the
+        request could not start by then, nothing is sent and RateLimitTimeout
+        is raised, so a caller that gave up does not spend the host's budget.
+        """
+
+        def remaining() -> Optional[float]:
+            return None if deadline is None else deadline - time.monotonic()
+
+        if not self.concurrency.enter(remaining()):
+            raise RateLimitTimeout(f"No free {self.host} slot before the deadline")
+        delay = self.bucket.reserve(remaining())
+        if delay is None:
+            self.concurrency.leave(throttled=False, adapt=False)
+            raise RateLimitTimeout(f"No {self.host} rate budget before the deadline")
+        outcome = RequestOutcome()
+        try:
+            time.sleep(delay)
+            yield outcome
+        except Exception as e:
+            outcome.record_error(e)
+            raise
+        finally:
+            self._finish(outcome)
+
+    @asynccontextmanager
+    async def limit_async(self) -> AsyncIterator[RequestOutcome]:
+        """Wait for a slot and a token without blocking the event loop, then run one request."""
+        while not self.concurrency.try_enter():
+            await asyncio.sleep(_POLL_INTERVAL)
+        outcome = RequestOutcome()
+        try:
+            # Without a max_wait, reserve always takes a token
+            await asyncio.sleep(self.bucket.reserve() or 0.0)
+            yield outcome
+        except Exception as e:
+            outcome.record_error(e)
+            raise
+        finally:
+            self._finish(outcome)
+
+    def stats(self) -> Dict[str, Any]:
+        """Current limits for diagnostics."""
+        return {
+            "rate": self.bucket.rate,
+            "burst": self.bucket.burst,
+            "concurrency_limit": round(self.concurrency.limit, 2),
+            "in_flight": self.concurrency.in_flight,
+        }
+
+
+_limiters: Dict[str, HostLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(host: str) -> HostLimiter:
+    """
+    Return the shared limiter for a host, creating it on first use.
+
+    Args:
+        host: Hostname (e.g. www.seek.com.au) or JobSpy site name (e.g. linkedin)
+
+    Returns:
+        The host's HostLimiter, configured from RATE_LIMITS or RATE_LIMIT_DEFAULT
+    """
+    host = host.lower()
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            settings = {**RATE_LIMIT_DEFAULT, **RATE_LIMITS.get(host, {})}
+            limiter = HostLimiter(host, **settings)
+            _limiters[host] = limiter
+        return limiter
+
+
+def limiter_stats() -> Dict[str, Dict[str, Any]]:
+    """Current limits of every host seen so far."""
+    with _limiters_lock:
+        return {host: limiter.stats() for host, limiter in _limiters.items()}
+
+
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """httpx transport that applies the host's limiter to every request."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        limiter = get_limiter(request.url.host)
+        async with limiter.limit_async() as outcome:
+            response = await self._transport.handle_async_request(request)
+            outcome.record_status(response.status_code)
+            return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -0,0 +1,201 @@
+"""Record and replay scraper traffic for offline, reproducible runs.
+
+SCRAPER_MODE selects what the scrapers do:
+
+- ``live`` (default): scrape the job boards.
+- ``record``: scrape the job boards and save every Seek HTTP response and
+  JobSpy DataFrame under SCRAPER_RECORDINGS_DIR.
+- ``replay``: answer from those recordings without touching the network.
+
+Seek responses are keyed by method, path and query string, not by host, so
+recordings can also be served by the stand-in job board
+(``benchmarks/standin.py``) with SEEK_BASE_URL pointing at it. JobSpy frames
+are keyed by their scrape parameters, apart from the proxies and ``hours_old``:
+an incremental refresh derives ``hours_old`` from the time since the last
+scrape, so its frames are keyed only as incremental, and replay falls back to
+the full scrape's frame when no incremental one was recorded.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode
+
+import httpx
+import pandas as pd
+
+try:
+    from .config import SCRAPER_MODE, SCRAPER_RECORDINGS_DIR
+except ImportError:
+    from config import SCRAPER_MODE, SCRAPER_RECORDINGS_DIR
+
+logger = logging.getLogger(__name__)
+
+LIVE = "live"
+RECORD = "record"
+REPLAY = "replay"
+
+# The recorded body is stored decoded, so these no longer describe it
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+class RecordingMissing(LookupError):
+    """No recording matches a request in replay mode."""
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:20]
+
+
+def request_key(method: str, path: str, query: str = "") -> str:
+    """Recording key of an HTTP request: method, path and sorted query, without the host."""
+    params = sorted(parse_qsl(query, keep_blank_values=True))
+    return _digest(f"{method.upper()} {path}?{urlencode(params)}")
+
+
+def http_recording_path(key: str, directory: Optional[str] = None) -> str:
+    """File holding the recorded response for a request key."""
+    return os.path.join(directory or SCRAPER_RECORDINGS_DIR, "http", f"{key}.json")
+
+
+def load_response(key: str, directory: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Recorded response (status, headers, body) for a request key, if there is one."""
+    try:
+        with open(http_recording_path(key, directory), encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _json_default(value: Any) -> Any:
+    if hasattr(value, "isoformat"):
+        # dates and timestamps
+        return value.isoformat()
+    if hasattr(value, "item"):
+        # numpy scalars
+        return value.item()
+    return str(value)
+
+
+def _write_json(path: str, data: Any) -> None:
+    # Write then rename, so a concurrent replay never reads a partial file
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, default=_json_default)
+    os.replace(tmp_path, path)
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """httpx transport that saves every response of the wrapped transport."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, directory: Optional[str] = None):
+        self._transport = transport
+        self._directory = directory
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self._transport.handle_async_request(request)
+        body = await response.aread()
+        await response.aclose()
+
+        headers = {k: v for k, v in response.headers.items() if k not in _DROPPED_HEADERS}
+        key = request_key(request.method, request.url.path, request.url.query.decode())
+        _write_json(
+            http_recording_path(key, self._directory),
+            {
+                "method": request.method,
+                "url": str(request.url),
+                "status": response.status_code,
+                "headers": headers,
+                "body": body.decode(response.encoding or "utf-8", errors="replace"),
+            },
+        )
+        logger.debug("Recorded %s %s as %s", request.method, request.url, key)
+        return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """httpx transport that answers from recorded responses; unrecorded requests get a 404."""
+
+    def __init__(self, directory: Optional[str] = None):
+        self._directory = directory
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = request_key(request.method, request.url.path, request.url.query.decode())
+        recorded = load_response(key, self._directory)
+        if recorded is None:
+            logger.warning("No recording for %s %s", request.method, request.url)
+            return httpx.Response(404, text="No recording", request=request)
+        return httpx.Response(
+            recorded["status"],
+            headers=recorded["headers"],
+            content=recorded["body"].encode("utf-8"),
+            request=request,
+        )
+
+
+def wrap_transport(
+    transport: httpx.AsyncBaseTransport, mode: Optional[str] = None
+) -> httpx.AsyncBaseTransport:
+    """Apply SCRAPER_MODE to an HTTP transport: unchanged, recording, or replaced by replay."""
+    mode = mode or SCRAPER_MODE
+    if mode == RECORD:
+        return RecordingTransport(transport)
+    if mode == REPLAY:
+        return ReplayTransport()
+    return transport
+
+
+def _frame_key_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Scrape parameters a recorded frame is keyed by."""
+    keyed = {name: value for name, value in params.items() if name not in ("proxies", "hours_old")}
+    if params.get("hours_old") is not None:
+        keyed["incremental"] = True
+    return keyed
+
+
+def frame_recording_path(params: Dict[str, Any], directory: Optional[str] = None) -> str:
+    """File holding the recorded DataFrame for JobSpy scrape parameters."""
+    keyed = _frame_key_params(params)
+    site = "-".join(params.get("site_name") or ["jobspy"])
+    key = _digest(json.dumps(keyed, sort_keys=True, default=_json_default))
+    return os.path.join(directory or SCRAPER_RECORDINGS_DIR, "jobspy", f"{site}-{key}.json")
+
+
+def save_frame(
+    params: Dict[str, Any], frame: pd.DataFrame, directory: Optional[str] = None
+) -> None:
+    """Save a JobSpy DataFrame as JSON records; dates become ISO strings and NaN null."""
+    records = frame.astype(object).where(frame.notna(), None).to_dict(orient="records")
+    _write_json(
+        frame_recording_path(params, directory),
+        {"params": _frame_key_params(params), "columns": list(frame.columns), "records": records},
+    )
+
+
+def load_frame(params: Dict[str, Any], directory: Optional[str] = None) -> pd.DataFrame:
+    """Recorded DataFrame for JobSpy scrape parameters; raises RecordingMissing if none.
+
+    An incremental scrape without a recording of its own replays the full
+    scrape's frame, which holds every job an incremental one could return.
+    """
+    paths = [frame_recording_path(params, directory)]
+    if params.get("hours_old") is not None:
+        full = {name: value for name, value in params.items() if name != "hours_old"}
+        paths.append(frame_recording_path(full, directory))
+    for path in paths:
+        try:
+            with open(path, encoding="utf-8") as f:
+                recorded = json.load(f)
+            break
+        except FileNotFoundError:
+            continue
+    else:
+        raise RecordingMissing(f"No JobSpy recording for {params.get('site_name')}")
+    return pd.DataFrame(recorded["records"], columns=recorded["columns"])
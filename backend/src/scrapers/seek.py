@@ -1,19 +1,63 @@
 """Seek.com.au job scraper."""
 
+import asyncio
+import json
 import logging
+import math
 import re
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 try:
-    from .config import SEEK_BASE_URL, SEEK_USER_AGENT
+    from lxml import etree
+    from lxml import html as lxml_html
 except ImportError:
-    from config import SEEK_BASE_URL, SEEK_USER_AGENT
+    # lxml is optional; without it the fast engine strains job cards with html.parser
+    etree = None
+    lxml_html = None
+
+try:
+    from .config import (
+        SEEK_BASE_URL,
+        SEEK_MAX_CONCURRENT_PAGES,
+        SEEK_PAGE_SIZE,
+        SEEK_PARSER_ENGINE,
+        SEEK_USE_PROXIES,
+        SEEK_USER_AGENT,
+    )
+except ImportError:
+    from config import (
+        SEEK_BASE_URL,
+        SEEK_MAX_CONCURRENT_PAGES,
+        SEEK_PAGE_SIZE,
+        SEEK_PARSER_ENGINE,
+        SEEK_USE_PROXIES,
+        SEEK_USER_AGENT,
+    )
+
+from .http_client import create_http_client
+from .proxies import PROXY_POOL
+
+# Relative to src when it is a package, otherwise src is on sys.path
+try:
+    from ..tracing import span
+except ImportError:
+    from tracing import span
 
 logger = logging.getLogger(__name__)
 
+# Only job cards are built into the tree by the fast engine without lxml
+_JOB_CARD_STRAINER = SoupStrainer("article")
+# Text nodes BeautifulSoup's get_text() returns, which leaves out scripts and styles
+_CARD_TEXT: Any = (
+    etree.XPath(".//text()[not(parent::script or parent::style)]") if etree is not None else None
+)
+_EMBEDDED_STATE_MARKER = "window.SEEK_REDUX_DATA"
+_JSON_DECODER = json.JSONDecoder()
+
 
 def _extract_job_id(job_url: str) -> str:
     """Extract job ID from Seek URL."""
@@ -35,6 +79,37 @@ def _extract_work_type(location: str) -> tuple:
     return is_remote, work_from_home_type
 
 
+def _build_job(
+    title: str,
+    company: str,
+    location: str,
+    job_url: str,
+    company_url: str,
+    description: str,
+    salary_min: int,
+    salary_max: int,
+    date_posted: str = "Recent",
+    work_type_text: str = "",
+) -> Dict[str, Any]:
+    """Build a job dictionary in the shape shared by every Seek parser engine."""
+    is_remote, work_from_home_type = _extract_work_type(f"{location} {work_type_text}".strip())
+
+    return {
+        "id": _extract_job_id(job_url),
+        "site": "Seek",
+        "title": title,
+        "company": company,
+        "location": location,
+        "date_posted": date_posted,
+        "job_url": job_url,
+        "salary_range": f"{salary_min}-{salary_max}",
+        "company_url": company_url,
+        "description": description,
+        "is_remote": is_remote,
+        "work_from_home_type": work_from_home_type,
+    }
+
+
 def _parse_job_article(article: Any, salary_min: int, salary_max: int) -> Dict[str, Any] | None:
     """Parse a single job article element from Seek."""
     try:
@@ -62,43 +137,333 @@ def _parse_job_article(article: Any, salary_min: int, salary_max: int) -> Dict[s
         teaser_elem = article.find(attrs={"data-automation": "jobShortDescription"})
         description = teaser_elem.text.strip() if teaser_elem else ""
 
-        # Extract work type
-        is_remote, work_from_home_type = _extract_work_type(location)
-
-        return {
-            "id": _extract_job_id(job_url),
-            "site": "Seek",
-            "title": title,
-            "company": company,
-            "location": location,
-            "date_posted": "Recent",
-            "job_url": job_url,
-            "salary_range": f"{salary_min}-{salary_max}",
-            "company_url": company_url,
-            "description": description,
-            "is_remote": is_remote,
-            "work_from_home_type": work_from_home_type,
-        }
+        return _build_job(
+            title, company, location, job_url, company_url, description, salary_min, salary_max
+        )
+    except Exception:
+        return None
+
+
+def _parse_page_legacy(
+    html: str, salary_min: int, salary_max: int
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Parse a full results page with html.parser (the original, slowest engine)."""
+    soup = BeautifulSoup(html, "html.parser")
+
+    # Find job articles
+    articles = soup.find_all("article")
+    if not articles:
+        articles = soup.find_all(attrs={"data-automation": "job-card"})
+
+    jobs = []
+    for article in articles:
+        job = _parse_job_article(article, salary_min, salary_max)
+        if job:
+            jobs.append(job)
+    return jobs, len(articles)
+
+
+def _parse_job_card(card: Any, salary_min: int, salary_max: int) -> Dict[str, Any] | None:
+    """Parse a job card by indexing its data-automation elements in a single pass."""
+    try:
+        elements: Dict[str, Any] = {}
+        for elem in card.find_all(attrs={"data-automation": True}):
+            elements.setdefault(elem["data-automation"], elem)
+
+        title_elem = elements.get("jobTitle")
+        company_elem = elements.get("jobCompany")
+        location_elem = elements.get("jobLocation")
+        teaser_elem = elements.get("jobShortDescription")
+
+        link_elem = None
+        if title_elem is not None:
+            link_elem = title_elem if title_elem.name == "a" else title_elem.find("a")
+        company_link_elem = company_elem.find("a") if company_elem is not None else None
+
+        return _build_job(
+            title_elem.get_text().strip() if title_elem is not None else "N/A",
+            company_elem.get_text().strip() if company_elem is not None else "N/A",
+            location_elem.get_text().strip() if location_elem is not None else "N/A",
+            f"https://www.seek.com.au{link_elem['href']}" if link_elem is not None else "N/A",
+            (
+                f"https://www.seek.com.au{company_link_elem['href']}"
+                if company_link_elem is not None
+                else "N/A"
+            ),
+            teaser_elem.get_text().strip() if teaser_elem is not None else "",
+            salary_min,
+            salary_max,
+        )
     except Exception:
         return None
 
 
+def _lxml_text(elem: Any) -> str:
+    """Stripped text of an lxml element, as BeautifulSoup's ``get_text().strip()`` returns it."""
+    return "".join(_CARD_TEXT(elem)).strip()
+
+
+def _parse_lxml_card(card: Any, salary_min: int, salary_max: int) -> Dict[str, Any] | None:
+    """Parse a job card from lxml's tree the same way _parse_job_card does from BeautifulSoup's."""
+    try:
+        elements: Dict[str, Any] = {}
+        for elem in card.iterfind(".//*[@data-automation]"):
+            elements.setdefault(elem.get("data-automation"), elem)
+
+        title_elem = elements.get("jobTitle")
+        company_elem = elements.get("jobCompany")
+        location_elem = elements.get("jobLocation")
+        teaser_elem = elements.get("jobShortDescription")
+
+        link_elem = None
+        if title_elem is not None:
+            link_elem = title_elem if title_elem.tag == "a" else title_elem.find(".//a")
+        company_link_elem = company_elem.find(".//a") if company_elem is not None else None
+
+        return _build_job(
+            _lxml_text(title_elem) if title_elem is not None else "N/A",
+            _lxml_text(company_elem) if company_elem is not None else "N/A",
+            _lxml_text(location_elem) if location_elem is not None else "N/A",
+            (
+                f"https://www.seek.com.au{link_elem.attrib['href']}"
+                if link_elem is not None
+                else "N/A"
+            ),
+            (
+                f"https://www.seek.com.au{company_link_elem.attrib['href']}"
+                if company_link_elem is not None
+                else "N/A"
+            ),
+            _lxml_text(teaser_elem) if teaser_elem is not None else "",
+            salary_min,
+            salary_max,
+        )
+    except Exception:
+        return None
+
+
+def _parse_page_fast(
+    html: str, salary_min: int, salary_max: int
+) -> Tuple[List[Dict[str, Any]], int] | None:
+    """Parse only the job cards of a results page.
+
+    With lxml installed the cards are read from lxml's own tree, skipping
+    BeautifulSoup entirely; otherwise html.parser builds a tree of the cards
+    only. Returns None when the page has no <article> cards so the caller can
+    fall back.
+    """
+    if lxml_html is not None:
+        try:
+            root = lxml_html.fromstring(html)
+        except (etree.ParserError, ValueError):
+            # Empty documents, or strings declaring their own encoding
+            return None
+        lxml_cards = list(root.iter("article"))
+        if not lxml_cards:
+            return None
+        jobs = []
+        for card in lxml_cards:
+            job = _parse_lxml_card(card, salary_min, salary_max)
+            if job:
+                jobs.append(job)
+        return jobs, len(lxml_cards)
+
+    soup = BeautifulSoup(html, "html.parser", parse_only=_JOB_CARD_STRAINER)
+    cards = soup.find_all("article")
+    if not cards:
+        return None
+
+    jobs = []
+    for card in cards:
+        job = _parse_job_card(card, salary_min, salary_max)
+        if job:
+            jobs.append(job)
+    return jobs, len(cards)
+
+
+def _extract_embedded_jobs(html: str) -> List[Dict[str, Any]] | None:
+    """Return the raw job list from the page's embedded SEEK_REDUX_DATA state, if present."""
+    marker = html.find(_EMBEDDED_STATE_MARKER)
+    if marker == -1:
+        return None
+    start = html.find("{", marker + len(_EMBEDDED_STATE_MARKER))
+    if start == -1:
+        return None
+
+    try:
+        state, _ = _JSON_DECODER.raw_decode(html, start)
+        jobs = state["results"]["results"]["jobs"]
+    except (ValueError, KeyError, TypeError):
+        return None
+    return jobs if isinstance(jobs, list) else None
+
+
+def _parse_embedded_job(raw: Dict[str, Any], salary_min: int, salary_max: int) -> Dict[str, Any]:
+    """Convert one embedded JSON job into the standard job dictionary."""
+    advertiser = raw.get("advertiser") or {}
+    locations = raw.get("locations") or []
+    location = raw.get("location") or (locations[0].get("label") if locations else None)
+    arrangements = (raw.get("workArrangements") or {}).get("data") or []
+    arrangement_text = " ".join(
+        str((item.get("label") or {}).get("text", "")) for item in arrangements
+    )
+    listing_date = raw.get("listingDate")
+
+    return _build_job(
+        title=raw.get("title") or "N/A",
+        company=raw.get("companyName") or advertiser.get("description") or "N/A",
+        location=location or "N/A",
+        job_url=f"https://www.seek.com.au/job/{raw['id']}" if raw.get("id") else "N/A",
+        company_url=(
+            f"https://www.seek.com.au/jobs?advertiserid={advertiser['id']}"
+            if advertiser.get("id")
+            else "N/A"
+        ),
+        description=raw.get("teaser") or "",
+        salary_min=salary_min,
+        salary_max=salary_max,
+        date_posted=listing_date[:10] if listing_date else "Recent",
+        work_type_text=arrangement_text,
+    )
+
+
+def _parse_page_json(
+    html: str, salary_min: int, salary_max: int
+) -> Tuple[List[Dict[str, Any]], int] | None:
+    """Parse a results page from its embedded JSON state. Returns None if it has none."""
+    raw_jobs = _extract_embedded_jobs(html)
+    if raw_jobs is None:
+        return None
+
+    jobs = []
+    for raw in raw_jobs:
+        try:
+            jobs.append(_parse_embedded_job(raw, salary_min, salary_max))
+        except (AttributeError, KeyError, TypeError):
+            continue
+    return jobs, len(raw_jobs)
+
+
+def _parse_page(
+    html: str, salary_min: int, salary_max: int, engine: str = SEEK_PARSER_ENGINE
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Parse one Seek results page with the selected engine.
+
+    Engines are tried fastest first and fall back to the next one when a page
+    does not have what they need: ``json`` (embedded state), ``fast`` (job
+    cards only, read with lxml when installed) and ``legacy`` (full
+    html.parser parse). ``auto`` starts with ``json``.
+
+    Returns:
+        Tuple of (jobs, number of job cards on the page)
+    """
+    if engine in ("auto", "json"):
+        parsed = _parse_page_json(html, salary_min, salary_max)
+        if parsed is not None:
+            return parsed
+    if engine in ("auto", "json", "fast"):
+        parsed = _parse_page_fast(html, salary_min, salary_max)
+        if parsed is not None:
+            return parsed
+    return _parse_page_legacy(html, salary_min, salary_max)
+
+
+async def _scrape_pages(
+    client: httpx.AsyncClient,
+    params: Dict[str, Any],
+    headers: Dict[str, str],
+    salary_min: int,
+    salary_max: int,
+    limit: int,
+    known_ids: Optional[Set[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch as many results pages as ``limit`` needs, concurrently, on one client.
+
+    With ``known_ids`` pages are fetched one at a time, newest first, and paging
+    stops at the first page containing a known job; only jobs listed before it
+    are returned.
+    """
+    page_count = max(1, math.ceil(limit / SEEK_PAGE_SIZE))
+    semaphore = asyncio.Semaphore(1 if known_ids else SEEK_MAX_CONCURRENT_PAGES)
+    # Lowest page known to be the last one; later pages are skipped once it is found
+    last_page = page_count
+
+    async def fetch_page(page: int) -> List[Dict[str, Any]] | None:
+        nonlocal last_page
+        async with semaphore:
+            if page > last_page:
+                return None
+            page_params = {**params, "page": page} if page > 1 else params
+            try:
+                with span("seek_http"):
+                    response = await client.get(SEEK_BASE_URL, params=page_params, headers=headers)
+            except httpx.HTTPError as e:
+                logger.error("Error fetching Seek page %d: %s", page, e)
+                last_page = min(last_page, page - 1)
+                return None
+
+        if response.status_code != 200:
+            logger.warning("Failed to fetch Seek page %d: Status %d", page, response.status_code)
+            last_page = min(last_page, page - 1)
+            return None
+
+        with span("seek_parse"):
+            page_jobs, card_count = _parse_page(response.text, salary_min, salary_max)
+        if card_count < SEEK_PAGE_SIZE:
+            last_page = min(last_page, page)
+        if known_ids and any(job["id"] in known_ids for job in page_jobs):
+            # Results are sorted by listing date, so later pages are all known
+            last_page = min(last_page, page)
+        return page_jobs
+
+    pages = await asyncio.gather(*(fetch_page(page) for page in range(1, page_count + 1)))
+    if pages[0] is None:
+        raise RuntimeError("Failed to fetch the first Seek results page")
+
+    # Merge pages in order, stopping at the first page that failed or was skipped
+    jobs: List[Dict[str, Any]] = []
+    seen_ids = set()
+    for page_jobs in pages[:last_page]:
+        if page_jobs is None:
+            break
+        for job in page_jobs:
+            if known_ids and job["id"] in known_ids:
+                return jobs[:limit]
+            if job["id"] not in seen_ids or job["id"] == "seek_unknown":
+                seen_ids.add(job["id"])
+                jobs.append(job)
+    return jobs[:limit]
+
+
 async def scrape_seek(
     role: str,
     salary_min: int,
     salary_max: int,
     limit: int = 10,
     client: httpx.AsyncClient | None = None,
+    known_ids: Optional[Set[str]] = None,
+    raise_errors: bool = False,
 ) -> List[Dict[str, Any]]:
     """
     Scrape job listings from Seek.com.au.
 
+    Results pages needed to reach ``limit`` are fetched concurrently (at most
+    SEEK_MAX_CONCURRENT_PAGES at a time) and paging stops at the first short page.
+    For incremental refreshes, pass the ids already scraped as ``known_ids``:
+    paging then stops at the first known job and only newer jobs are returned.
+
     Args:
         role: Job role/title to search for
         salary_min: Minimum salary
         salary_max: Maximum salary
         limit: Maximum number of results
-        client: Optional existing httpx.AsyncClient to reuse
+        client: Optional shared httpx.AsyncClient to reuse; a short-lived one
+            from create_http_client() is used when omitted
+        known_ids: Job ids from a previous scrape of the same search (optional)
+        raise_errors: Raise when Seek cannot be scraped instead of returning no jobs,
+            so callers can tell an outage from an empty search
 
     Returns:
         List of job dictionaries
@@ -122,30 +487,25 @@ async def scrape_seek(
 
     jobs: List[Dict[str, Any]] = []
 
+    # Route through the healthiest pooled proxy when enabled; it needs its own client
+    proxies = PROXY_POOL.select(1) if SEEK_USE_PROXIES else []
+    start = time.perf_counter()
+
     try:
-        if client:
-            response = await client.get(SEEK_BASE_URL, params=params, headers=headers)
+        if client and not proxies:
+            jobs = await _scrape_pages(
+                client, params, headers, salary_min, salary_max, limit, known_ids
+            )
         else:
-            async with httpx.AsyncClient() as new_client:
-                response = await new_client.get(SEEK_BASE_URL, params=params, headers=headers)
-
-        if response.status_code != 200:
-            logger.warning("Failed to fetch Seek: Status %d", response.status_code)
-            return []
-
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        # Find job articles
-        articles = soup.find_all("article")
-        if not articles:
-            articles = soup.find_all(attrs={"data-automation": "job-card"})
-
-        for article in articles[:limit]:
-            job = _parse_job_article(article, salary_min, salary_max)
-            if job:
-                jobs.append(job)
-
+            async with create_http_client(proxies[0] if proxies else None) as new_client:
+                jobs = await _scrape_pages(
+                    new_client, params, headers, salary_min, salary_max, limit, known_ids
+                )
+        PROXY_POOL.report(proxies, ok=True, latency=time.perf_counter() - start)
     except Exception as e:
+        PROXY_POOL.report(proxies, ok=False)
         logger.error("Error scraping Seek: %s", e)
+        if raise_errors:
+            raise
 
     return jobs
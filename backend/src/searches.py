@@ -0,0 +1,164 @@
+"""Registry of searches submitted to run in the background."""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+try:
+    from .config import SEARCH_MAX_CONCURRENT, SEARCH_MAX_RETAINED
+    from .models import SearchRequest, SearchStatus, SourceProgress
+    from .tracing import detached_task
+except ImportError:
+    from config import SEARCH_MAX_CONCURRENT, SEARCH_MAX_RETAINED
+    from models import SearchRequest, SearchStatus, SourceProgress
+    from tracing import detached_task
+
+logger = logging.getLogger(__name__)
+
+# Terminal search states; only finished searches are evicted
+FINISHED = {"completed", "failed"}
+
+
+class SubmittedSearch:
+    """State and results of one submitted search."""
+
+    def __init__(self, request: SearchRequest, sources: List[str]):
+        self.id = uuid.uuid4().hex
+        self.request = request
+        self.status = "queued"
+        self.sources = {source: SourceProgress(status="pending") for source in sources}
+        self.jobs: Optional[List[Dict[str, Any]]] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def source_done(
+        self,
+        source: str,
+        jobs: List[Dict[str, Any]],
+        error: Optional[str],
+        status: Optional[str] = None,
+    ) -> None:
+        """Record that one source finished, failed, timed out or was skipped."""
+        self.sources[source] = SourceProgress(
+            status=status or ("failed" if error else "completed"), count=len(jobs), error=error
+        )
+
+    def finish(self, jobs: List[Dict[str, Any]]) -> None:
+        """Store the results; sources answered from a cache are marked completed."""
+        for source, progress in self.sources.items():
+            if progress.status == "pending":
+                self.sources[source] = SourceProgress(status="completed")
+        self.jobs = jobs
+        self.status = "completed"
+        self.finished_at = time.time()
+
+    def fail(self, error: str) -> None:
+        """Mark the search as failed."""
+        self.error = error
+        self.status = "failed"
+        self.finished_at = time.time()
+
+    def to_status(self) -> SearchStatus:
+        """Build the API status model."""
+        return SearchStatus(
+            id=self.id,
+            status=self.status,
+            request=self.request,
+            sources=self.sources,
+            total=len(self.jobs) if self.jobs is not None else None,
+            error=self.error,
+            created_at=self.created_at,
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+        )
+
+
+# Runs a submitted search, reporting per-source progress on the search, and returns its jobs
+SearchRunner = Callable[[SubmittedSearch], Awaitable[List[Dict[str, Any]]]]
+
+
+class SearchRegistry:
+    """Run submitted searches on a bounded pool and keep them for polling.
+
+    At most ``max_concurrent`` searches scrape at once; the rest wait queued.
+    Up to ``max_retained`` searches are kept, forgetting the oldest finished
+    ones first.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = SEARCH_MAX_CONCURRENT,
+        max_retained: int = SEARCH_MAX_RETAINED,
+    ):
+        self._max_concurrent = max_concurrent
+        self._max_retained = max_retained
+        self._searches: OrderedDict = OrderedDict()
+        self._tasks: Dict[str, asyncio.Future] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def submit(
+        self, request: SearchRequest, sources: List[str], runner: SearchRunner
+    ) -> SubmittedSearch:
+        """
+        Queue a search and return it immediately.
+
+        Raises:
+            RuntimeError: If the registry is full of searches that have not finished
+        """
+        self._evict()
+        if len(self._searches) >= self._max_retained:
+            raise RuntimeError("Too many searches in progress, try again later")
+
+        search = SubmittedSearch(request, sources)
+        self._searches[search.id] = search
+        # The search outlives the request submitting it, so it is not traced with it
+        task = detached_task(self._run(search, runner))
+        self._tasks[search.id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(search.id, None))
+        logger.info("Submitted search %s: role=%s", search.id, request.role)
+        return search
+
+    def _concurrency(self) -> asyncio.Semaphore:
+        """Semaphore bounding running searches, created lazily for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self._max_concurrent)
+            self._loop = loop
+        return self._semaphore
+
+    async def _run(self, search: SubmittedSearch, runner: SearchRunner) -> None:
+        async with self._concurrency():
+            search.status = "running"
+            search.started_at = time.time()
+            try:
+                search.finish(await runner(search))
+            except Exception as e:
+                logger.error("Submitted search %s failed: %s", search.id, e)
+                search.fail(str(e))
+
+    def _evict(self) -> None:
+        """Forget the oldest finished searches while over capacity."""
+        for search_id in list(self._searches):
+            if len(self._searches) < self._max_retained:
+                break
+            if self._searches[search_id].status in FINISHED:
+                del self._searches[search_id]
+
+    def get(self, search_id: str) -> Optional[SubmittedSearch]:
+        """Return a submitted search by id, if still retained."""
+        return self._searches.get(search_id)
+
+    async def wait(self, search_id: str) -> None:
+        """Wait until a submitted search has finished running."""
+        task = self._tasks.get(search_id)
+        if task is not None:
+            await asyncio.shield(task)
+
+    def __len__(self) -> int:
+        return len(self._searches)
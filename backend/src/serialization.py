@@ -0,0 +1,98 @@
+"""Fast JSON serialization and field projection for internal job records."""
+
+import json
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    HAS_ORJSON = False
+
+try:
+    from .models import Job
+except ImportError:
+    from models import Job
+
+# Fields a client may project, in response order
+JOB_FIELDS = tuple(Job.model_fields)
+
+
+def _default(value: Any) -> Any:
+    """Serialize values the JSON encoders do not handle natively."""
+    if isinstance(value, date):
+        return value.isoformat()
+    if hasattr(value, "item"):
+        # numpy scalars
+        return value.item()
+    return str(value)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, default=_default, separators=(",", ":")).encode()
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON produced by dumps."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """
+    Parse a comma-separated field list.
+
+    Args:
+        fields: Comma-separated job field names, or None for all fields
+
+    Returns:
+        List of field names, or None when no projection was requested
+
+    Raises:
+        ValueError: If a field name is not a Job field
+    """
+    if fields is None:
+        return None
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in names if name not in JOB_FIELDS]
+    if unknown:
+        raise ValueError(
+            f"Unknown field(s): {', '.join(unknown)}. Valid fields: {', '.join(JOB_FIELDS)}"
+        )
+    return names or None
+
+
+def project_jobs(
+    jobs: List[Dict[str, Any]],
+    fields: Optional[Sequence[str]] = None,
+    description_chars: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Project job records to the requested fields without re-validating them.
+
+    Args:
+        jobs: Normalized job dictionaries from the scrapers
+        fields: Fields to keep (default: every Job field)
+        description_chars: Truncate descriptions to at most this many characters
+
+    Returns:
+        New list of projected job dictionaries
+    """
+    selected = tuple(fields) if fields else JOB_FIELDS
+    max_chars = description_chars if "description" in selected else None
+
+    projected = []
+    for job in jobs:
+        record = {field: job.get(field) for field in selected}
+        if max_chars is not None:
+            description = record["description"]
+            if isinstance(description, str) and len(description) > max_chars:
+                record["description"] = description[:max_chars]
+        projected.append(record)
+    return projected
@@ -1,19 +1,99 @@
 """FastAPI server for Career Hunter API."""
 
 import asyncio
+import contextvars
 import hashlib
+import json
 import logging
+import math
+import sqlite3
 import time
-from collections import OrderedDict
-from typing import List
+import uuid
+from contextlib import aclosing, asynccontextmanager
+from typing import (
+    Annotated,
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Collection,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
 
-from .config import API_DESCRIPTION, API_TITLE, API_VERSION, CORS_ORIGINS
-from .models import HealthResponse, Job, SearchRequest
-from .scrapers import scrape_others, scrape_seek
-from .utils import filter_by_work_type, filter_jobs, parse_salary
+from .cache_backends import CacheBackend, MemoryBackend, create_backend
+from .config import (
+    API_DESCRIPTION,
+    API_TITLE,
+    API_VERSION,
+    CORS_ORIGINS,
+    JOB_STORE_MAX_AGE,
+    JOB_STORE_PATH,
+    JOBSPY_SITES,
+    SCHEDULER_ENABLED,
+    SEARCH_CACHE_STALE_TTL,
+    SEARCH_CACHE_TTL,
+    SEARCH_DEADLINE,
+    SOURCE_BUDGETS,
+    SOURCE_RETRY_BACKOFF,
+)
+from .dedup import Deduplicator, dedupe_jobs
+from .metrics import (
+    CACHE_REQUESTS,
+    CONTENT_TYPE,
+    REGISTRY,
+    SCRAPE_DURATION,
+    SCRAPES,
+    SEARCH_DURATION,
+    SEARCHES_IN_FLIGHT,
+    SOURCE_JOBS,
+    CallbackGauge,
+)
+from .models import (
+    HealthResponse,
+    Job,
+    SavedSearch,
+    SavedSearchCreate,
+    SearchRequest,
+    SearchResultsPage,
+    SearchStatus,
+)
+from .scheduler import SavedSearchScheduler
+from .scrapers import (
+    JOBSPY_EXECUTOR,
+    PROXY_POOL,
+    breaker_stats,
+    create_http_client,
+    detach,
+    detached_workers,
+    get_breaker,
+    limiter_stats,
+    pool_saturated,
+    scrape_seek,
+    scrape_site,
+)
+from .searches import SearchRegistry, SubmittedSearch
+from .serialization import dumps, parse_fields, project_jobs
+from .store import JobStore, job_key
+from .tracing import (
+    ServerTimingMiddleware,
+    Trace,
+    current_trace,
+    detached_task,
+    join_trace,
+    span,
+)
+from .utils import TitleIndex, filter_by_work_type, filter_jobs, parse_salary
 
 # Configure logging
 logging.basicConfig(
@@ -22,14 +102,43 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Per-source progress callback: (source, jobs, error)
+SourceCallback = Callable[[str, List[Dict[str, Any]], Optional[str]], None]
+# SearchCache.lookup result: (value, stale, timestamp), or None on a miss
+CacheHit = Optional[Tuple[Any, bool, float]]
+# Error reported for a source skipped because its circuit breaker is open
+SOURCE_SKIPPED = "Skipped: source is failing, retrying after a cool-down"
+# Error reported for a source that did not finish within its share of the deadline
+SOURCE_TIMED_OUT = "Timed out: source did not finish within its deadline budget"
+# Error reported for a JobSpy board not scraped because abandoned scrapes hold every worker
+SOURCE_BUSY = "Skipped: every JobSpy worker is busy with scrapes that missed their deadline"
+
 
 class LRUCache:
-    """LRU cache with TTL support and bounded size."""
+    """LRU cache with soft/hard TTL support and bounded size.
+
+    Entries are fresh until ``ttl`` and may still be served, flagged as stale,
+    until ``stale_ttl`` (default: ``ttl``, i.e. no stale serving). Entries are
+    kept in a pluggable backend (default: in process memory). Lookups are
+    counted in the cache metrics under ``name``. The ``_async`` variants keep
+    a shared backend's I/O off the event loop.
+    """
 
-    def __init__(self, maxsize: int = 100, ttl: int = 3600):
-        self._cache: OrderedDict = OrderedDict()
+    def __init__(
+        self,
+        maxsize: int = 100,
+        ttl: int = 3600,
+        stale_ttl: Optional[int] = None,
+        backend: Optional[CacheBackend] = None,
+        name: str = "search",
+    ):
+        self.name = name
+        self._cache = backend if backend is not None else MemoryBackend(maxsize)
         self._maxsize = maxsize
         self._ttl = ttl
+        self._stale_ttl = max(ttl, stale_ttl if stale_ttl is not None else ttl)
 
     def _make_key(self, request: SearchRequest) -> str:
         """Generate normalized cache key from request."""
@@ -43,42 +152,284 @@ class LRUCache:
         )
         return hashlib.md5(key_data.encode()).hexdigest()
 
-    def get(self, request: SearchRequest) -> List | None:
-        """Get cached result if valid."""
+    def lookup(self, request: SearchRequest) -> CacheHit:
+        """Get a cached result, whether it is past the soft TTL, and when it was produced."""
+        hit = self._lookup(request)
+        CACHE_REQUESTS.inc(self.name, "miss" if hit is None else "stale" if hit[1] else "hit")
+        return hit
+
+    def _lookup(self, request: SearchRequest) -> CacheHit:
         key = self._make_key(request)
-        if key not in self._cache:
+        entry = self._cache.get(key)
+        if entry is None:
             return None
 
-        entry = self._cache[key]
-        if time.time() - entry["timestamp"] >= self._ttl:
-            del self._cache[key]
+        age = time.time() - entry["timestamp"]
+        if age >= self._stale_ttl:
+            self._cache.delete(key)
             return None
+        return entry["data"], age >= self._ttl, entry["timestamp"]
 
-        # Move to end (most recently used)
-        self._cache.move_to_end(key)
-        return entry["data"]
-
-    def set(self, request: SearchRequest, data: List) -> None:
-        """Cache result with timestamp."""
-        key = self._make_key(request)
+    def get(self, request: SearchRequest) -> List | None:
+        """Get cached result if valid (fresh or stale)."""
+        hit = self.lookup(request)
+        return None if hit is None else hit[0]
 
-        # Remove oldest if at capacity
-        while len(self._cache) >= self._maxsize:
-            self._cache.popitem(last=False)
+    def set(self, request: SearchRequest, data: Any, timestamp: Optional[float] = None) -> None:
+        """Cache result with timestamp (default: now)."""
+        self._cache.set(
+            self._make_key(request),
+            {"timestamp": time.time() if timestamp is None else timestamp, "data": data},
+        )
 
-        self._cache[key] = {"timestamp": time.time(), "data": data}
+    def timestamp(self, request: SearchRequest) -> Optional[float]:
+        """Return when the cached result for a request was produced, if cached."""
+        entry = self._cache.get(self._make_key(request))
+        return None if entry is None else entry["timestamp"]
 
     def clear(self) -> int:
         """Clear all cached entries. Returns number of entries cleared."""
-        count = len(self._cache)
-        self._cache.clear()
-        return count
+        return self._cache.clear()
+
+    async def _off_loop(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a backend call in the default executor, unless the backend is in memory."""
+        if isinstance(self._cache, MemoryBackend):
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    async def lookup_async(self, request: SearchRequest) -> CacheHit:
+        """Like lookup, without blocking the event loop on a shared backend."""
+        return await self._off_loop(self.lookup, request)
+
+    async def set_async(
+        self, request: SearchRequest, data: Any, timestamp: Optional[float] = None
+    ) -> None:
+        """Like set, without blocking the event loop on a shared backend."""
+        await self._off_loop(self.set, request, data, timestamp)
+
+
+class RawScrapeCache(LRUCache):
+    """Cache of raw per-source scrape results.
+
+    Work type and limit are applied after scraping, so they are left out of
+    the key: one entry serves every work-type view of a search, and an entry
+    scraped with a larger limit also serves smaller limits.
+    """
+
+    def _make_key(self, request: SearchRequest) -> str:
+        """Generate a cache key from the parameters sent to the scrapers."""
+        key_data = (
+            f"{request.role.lower().strip()}"
+            f"-{request.country.upper()}"
+            f"-{request.location.lower().strip()}"
+            f"-{request.salary.lower().strip()}"
+        )
+        return hashlib.md5(key_data.encode()).hexdigest()
+
+    def _lookup(self, request: SearchRequest) -> CacheHit:
+        """Get the cached scrape if it is valid and covers the requested limit."""
+        hit = super()._lookup(request)
+        if hit is None or hit[0]["limit"] < request.limit:
+            return None
+        return hit
+
+    def store_scrape(
+        self,
+        request: SearchRequest,
+        data: Dict[str, List[Dict[str, Any]]],
+        timestamp: Optional[float] = None,
+        watermarks: Optional[Dict[str, float]] = None,
+        retry: Optional[Dict[str, Dict[str, float]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Cache per-source jobs scraped for a request. Returns the cached entry.
+
+        ``watermarks`` maps each source to the time of its last successful
+        scrape, from which the next refresh continues incrementally. ``retry``
+        maps each failed source to its consecutive failures and when it is
+        next retried. ``updated_at`` differs from ``scraped_at`` once failed
+        sources were retried into the entry.
+
+        A fresh entry scraped with a larger limit is kept and returned instead,
+        so a smaller scrape finishing after it does not shrink the entry.
+        """
+        current = self._lookup(request)
+        if current is not None and not current[1] and current[0]["limit"] > request.limit:
+            return current[0]
+        now = time.time()
+        entry = {
+            "limit": request.limit,
+            "sources": data,
+            "scraped_at": now if timestamp is None else timestamp,
+            "updated_at": now,
+            "watermarks": watermarks or {},
+            "retry": retry or {},
+        }
+        super().set(request, entry, entry["scraped_at"])
+        return entry
 
+    async def store_scrape_async(
+        self,
+        request: SearchRequest,
+        data: Dict[str, List[Dict[str, Any]]],
+        timestamp: Optional[float] = None,
+        watermarks: Optional[Dict[str, float]] = None,
+        retry: Optional[Dict[str, Dict[str, float]]] = None,
+    ) -> Dict[str, Any]:
+        """Like store_scrape, without blocking the event loop on a shared backend."""
+        return await self._off_loop(self.store_scrape, request, data, timestamp, watermarks, retry)
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one shared task.
+
+    The task records into its own trace rather than that of the request which
+    started it; callers awaiting it through ``do`` add its spans to their trace.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._traces: Dict[str, Trace] = {}
+
+    async def do(
+        self, key: str, func: Callable[[], Awaitable[T]], timeout: Optional[float] = None
+    ) -> T:
+        """Await ``func()``, or join the in-flight call already running for ``key``.
+
+        ``timeout`` bounds how long a joining caller waits (raising
+        ``asyncio.TimeoutError``); the call itself keeps running for the others.
+        """
+        task, started = self.start(key, func)
+        trace = self._traces.get(key)
+        try:
+            if not started:
+                logger.info("Joining in-flight search for key %s", key)
+                if timeout is not None:
+                    return await asyncio.wait_for(asyncio.shield(task), timeout)
+
+            # Shield so one caller disconnecting does not cancel the shared scrape
+            return await asyncio.shield(task)
+        finally:
+            if trace is not None and task.done():
+                join_trace(trace)
+
+    def start(self, key: str, func: Callable[[], Awaitable[T]]) -> Tuple[asyncio.Future, bool]:
+        """Start ``func()`` for ``key`` unless already in flight; returns (task, started)."""
+        task = self._inflight.get(key)
+        if task is not None:
+            return task, False
+        trace = Trace()
+        task = detached_task(func(), trace)
+        self._inflight[key] = task
+        self._traces[key] = trace
+        task.add_done_callback(lambda done: self._forget(key, done))
+        return task, True
+
+    def _forget(self, key: str, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+            del self._traces[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._inflight
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+
+# Raw scrape tier: per-source results keyed without post-scrape filters
+raw_cache = RawScrapeCache(
+    maxsize=50,
+    ttl=SEARCH_CACHE_TTL,
+    stale_ttl=SEARCH_CACHE_STALE_TTL,
+    backend=create_backend(50, "raw"),
+    name="raw",
+)
+
+# Derived tier: filtered views of raw scrapes, never outliving the scrape they came from
+search_cache = LRUCache(
+    maxsize=100,
+    ttl=SEARCH_CACHE_TTL,
+    stale_ttl=SEARCH_CACHE_STALE_TTL,
+    backend=create_backend(100, "search"),
+)
+
+# Title indexes of raw scrapes, by raw cache key and scrape time, shared by
+# every work-type and limit view derived from the same scrape
+_title_indexes = MemoryBackend(50)
+
+# Persistent job store; survives restarts and answers repeat searches without scraping
+job_store = JobStore(JOB_STORE_PATH)
+
+# In-flight scrapes keyed on the raw cache key and limit
+search_flights = SingleFlight()
+
+# Sources each in-flight scrape has finished so far, by flight key, for joiners
+# whose own deadline passes before the shared scrape completes
+_partial_scrapes: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+
+# Searches submitted through /api/searches, run on a bounded background pool
+search_registry = SearchRegistry()
+
+# Values read from the objects above when /metrics is rendered
+CallbackGauge(
+    "career_hunter_cache_entries",
+    "Entries currently held by each cache tier",
+    ["cache"],
+    lambda: {(cache.name,): len(cache._cache) for cache in (search_cache, raw_cache)},
+)
+CallbackGauge(
+    "career_hunter_cache_evictions_total",
+    "Entries evicted from each cache tier by this process",
+    ["cache"],
+    lambda: {(cache.name,): cache._cache.evictions for cache in (search_cache, raw_cache)},
+    kind="counter",
+)
+CallbackGauge(
+    "career_hunter_executor_queue_depth",
+    "JobSpy board scrapes waiting for a worker thread",
+    [],
+    lambda: {(): JOBSPY_EXECUTOR._work_queue.qsize()},
+)
+CallbackGauge(
+    "career_hunter_executor_detached_workers",
+    "JobSpy worker threads still running board scrapes that missed their deadline",
+    [],
+    lambda: {(): detached_workers()},
+)
+CallbackGauge(
+    "career_hunter_scrapes_in_flight",
+    "Shared scrapes currently running",
+    [],
+    lambda: {(): len(search_flights)},
+)
+
+# Keeps saved searches fresh; the store is looked up per call so it can be swapped
+saved_search_scheduler = SavedSearchScheduler(
+    load=lambda: job_store.list_saved_searches(),
+    refresh=lambda saved: _refresh_saved(saved),
+)
+
+# Background refreshes of stale entries; referenced so they are not garbage collected
+_refresh_tasks: Set[asyncio.Future] = set()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Hold one pooled HTTP client for the app's lifetime and run the saved search scheduler."""
+    async with create_http_client() as client:
+        app.state.http_client = client
+        if SCHEDULER_ENABLED:
+            saved_search_scheduler.start()
+        try:
+            yield
+        finally:
+            await saved_search_scheduler.stop()
+    app.state.http_client = None
 
-# Bounded LRU cache with TTL (15 minutes)
-search_cache = LRUCache(maxsize=100, ttl=900)
 
 app = FastAPI(
+    lifespan=lifespan,
     title=API_TITLE,
     description=API_DESCRIPTION,
     version=API_VERSION,
@@ -92,7 +443,540 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "X-Skipped-Sources", "X-Source-Status"],
 )
+# Added last so it is outermost and times the whole request
+app.add_middleware(ServerTimingMiddleware)
+
+
+async def _load_stored(key: str) -> Optional[Tuple[List[Dict[str, Any]], float]]:
+    """Return stored results for a recently scraped search and when it was scraped, if any."""
+    loop = asyncio.get_running_loop()
+    try:
+        with span("store_read"):
+            return await loop.run_in_executor(None, job_store.load_search, key, JOB_STORE_MAX_AGE)
+    except sqlite3.Error as e:
+        logger.error("Error reading job store: %s", e)
+        return None
+
+
+async def _save_raw(
+    request: SearchRequest,
+    sources: Dict[str, List[Dict[str, Any]]],
+    errors: Optional[Dict[str, str]] = None,
+    watermarks: Optional[Dict[str, float]] = None,
+    previous: Optional[Dict[str, Any]] = None,
+    retried: bool = False,
+) -> Dict[str, Any]:
+    """
+    Cache raw per-source results and persist every scraped job to the job store.
+
+    Sources that failed keep the jobs of the previous cached scrape, if any, and
+    are retried on their own with exponential backoff (see ``_due_retries``);
+    sources skipped by their breaker or a busy pool are not retried. With
+    ``retried``, only failed sources of ``previous`` were scraped: the other
+    sources and the scrape time are kept.
+    """
+    errors = errors or {}
+    if errors and previous is None:
+        hit = await raw_cache.lookup_async(request)
+        previous = hit[0] if hit is not None else None
+
+    now = time.time()
+    retry = dict(previous.get("retry", {})) if previous is not None else {}
+    for source in sources:
+        error = errors.get(source)
+        if error is not None and _source_status(error) in ("failed", "timeout"):
+            failures = retry.get(source, {}).get("failures", 0) + 1
+            backoff = min(SOURCE_RETRY_BACKOFF * 2 ** (failures - 1), SEARCH_CACHE_TTL)
+            retry[source] = {"failures": failures, "after": now + backoff}
+        else:
+            retry.pop(source, None)
+
+    timestamp = None
+    if previous is not None:
+        for source in errors:
+            sources[source] = previous["sources"].get(source, [])
+        if retried:
+            for source, jobs in previous["sources"].items():
+                sources.setdefault(source, jobs)
+            timestamp = previous["scraped_at"]
+    entry = await raw_cache.store_scrape_async(request, sources, timestamp, watermarks, retry)
+    scraped = [job for jobs in sources.values() for job in jobs]
+    loop = asyncio.get_running_loop()
+    try:
+        with span("store_write"):
+            await loop.run_in_executor(None, job_store.upsert_jobs, scraped)
+    except sqlite3.Error as e:
+        logger.error("Error writing job store: %s", e)
+    logger.info("Cached %d scraped jobs from %d sources", len(scraped), len(sources))
+    return entry
+
+
+def _due_retries(entry: Dict[str, Any], now: Optional[float] = None) -> List[str]:
+    """Failed sources of a raw scrape whose retry backoff has passed."""
+    now = time.time() if now is None else now
+    return [source for source, retry in entry.get("retry", {}).items() if retry["after"] <= now]
+
+
+def _view_timestamp(entry: Dict[str, Any]) -> float:
+    """Timestamp of views derived from a raw scrape.
+
+    That is its scrape time, moved back so the views go stale when a failed
+    source is next due a retry, and are then derived again from the retried scrape.
+    """
+    retry_at = min((retry["after"] for retry in entry.get("retry", {}).values()), default=None)
+    if retry_at is None:
+        return entry["scraped_at"]
+    return min(entry["scraped_at"], retry_at - SEARCH_CACHE_TTL)
+
+
+async def _serve_raw(
+    request: SearchRequest, key: str, entry: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """Derive, cache and record the filtered view of a raw scrape for a request."""
+    index_key = f"{raw_cache._make_key(request)}-{entry.get('updated_at', entry['scraped_at'])}"
+    jobs = _derive_results(request, entry["sources"], index_key)
+    await search_cache.set_async(request, jobs, _view_timestamp(entry))
+    await _record_search(key, jobs)
+    return jobs
+
+
+async def _record_search(key: str, jobs: List[Dict[str, Any]]) -> None:
+    """Record the result ids of a search in the job store."""
+    loop = asyncio.get_running_loop()
+    try:
+        await loop.run_in_executor(None, job_store.ingest, key, [], jobs)
+    except sqlite3.Error as e:
+        logger.error("Error writing job store: %s", e)
+
+
+def _search_sources(request: SearchRequest) -> List[str]:
+    """Return the sources scraped for a request, in response order."""
+    sources = ["seek"] if request.country.upper() == "AU" else []
+    return sources + JOBSPY_SITES
+
+
+def _skipped_sources(request: SearchRequest) -> List[str]:
+    """Return the sources of a request currently skipped by their circuit breakers."""
+    return [source for source in _search_sources(request) if get_breaker(source).is_open()]
+
+
+def _source_status(error: Optional[str]) -> str:
+    """Per-source status reported to clients for a scrape outcome."""
+    if error is None:
+        return "completed"
+    if error in (SOURCE_SKIPPED, SOURCE_BUSY):
+        return "skipped"
+    if error == SOURCE_TIMED_OUT:
+        return "timeout"
+    return "failed"
+
+
+def _record_scrape(
+    source: str, jobs: List[Dict[str, Any]], error: Optional[str], start: float
+) -> None:
+    """Record the outcome, latency and job count of one source scrape, and its span."""
+    elapsed = time.perf_counter() - start
+    status = _source_status(error)
+    SCRAPES.inc(source, status)
+    if status != "skipped":
+        SCRAPE_DURATION.observe(elapsed, source)
+    SOURCE_JOBS.inc(source, "scraped", amount=len(jobs))
+    trace = current_trace()
+    if trace is not None:
+        trace.add(f"source_{source}", start, elapsed)
+
+
+def _flight_key(request: SearchRequest) -> str:
+    """Key shared by concurrent scrapes of the same sources and limit."""
+    return f"{raw_cache._make_key(request)}-{request.limit}"
+
+
+def _rescrape_request(request: SearchRequest, previous: Optional[Dict[str, Any]]) -> SearchRequest:
+    """The request re-scraping a cached scrape, at its limit when larger than the request's.
+
+    A refresh started by a smaller search would otherwise replace the larger
+    scrape with a smaller one, and the larger searches it served scrape again.
+    """
+    if previous is None or previous["limit"] <= request.limit:
+        return request
+    return request.model_copy(update={"limit": previous["limit"]})
+
+
+def _title_index(
+    request: SearchRequest,
+    sources: Dict[str, List[Dict[str, Any]]],
+    index_key: Optional[str] = None,
+) -> Tuple[TitleIndex, Dict[int, Tuple[str, int]]]:
+    """
+    Title index over every scraped job, and each job's (source, rank) by id.
+
+    Given an ``index_key`` naming the raw scrape, the index is built once and
+    reused for each view of it.
+    """
+    if index_key is not None:
+        cached = _title_indexes.get(index_key)
+        if cached is not None:
+            return cached["index"], cached["origin"]
+
+    # Combine results in a stable source order
+    all_jobs = []
+    origin: Dict[int, Tuple[str, int]] = {}
+    for source in _search_sources(request):
+        for rank, job in enumerate(sources.get(source, [])):
+            all_jobs.append(job)
+            origin[id(job)] = (source, rank)
+    index = TitleIndex(all_jobs)
+    if index_key is not None:
+        _title_indexes.set(index_key, {"index": index, "origin": origin})
+    return index, origin
+
+
+def _derive_results(
+    request: SearchRequest,
+    sources: Dict[str, List[Dict[str, Any]]],
+    index_key: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Apply the post-scrape limit, role and work-type filters and dedupe.
+
+    ``index_key`` names the raw scrape ``sources`` came from, so its title
+    index is reused (see ``_title_index``).
+    """
+    index, origin = _title_index(request, sources, index_key)
+
+    # Apply filters, trimming larger cached scrapes to the requested limit
+    filtered_jobs = [
+        job
+        for job in filter_jobs(index.jobs, request.role, index=index)
+        if origin[id(job)][1] < request.limit
+    ]
+    filtered_jobs = filter_by_work_type(filtered_jobs, request.work_type)
+
+    kept: Dict[str, int] = {}
+    for job in filtered_jobs:
+        source = origin[id(job)][0]
+        kept[source] = kept.get(source, 0) + 1
+    for source, count in kept.items():
+        SOURCE_JOBS.inc(source, "kept", amount=count)
+
+    # Collapse the same posting found on several sources
+    with span("dedupe"):
+        return dedupe_jobs(filtered_jobs)
+
+
+def _hours_since(watermark: float, now: float) -> int:
+    """Whole hours covering the time since a watermark, plus an hour of overlap."""
+    return max(1, math.ceil((now - watermark) / 3600)) + 1
+
+
+async def _iter_sources(
+    request: SearchRequest,
+    min_sal: int,
+    max_sal: int,
+    previous: Optional[Dict[str, Any]] = None,
+    only: Optional[Collection[str]] = None,
+) -> AsyncIterator[Tuple[str, List[Dict[str, Any]], Optional[str]]]:
+    """
+    Scrape every source in parallel and yield results as each one finishes.
+
+    Sources whose circuit breaker is open are not scraped; they are yielded at
+    once with the SOURCE_SKIPPED error. Each source gets its SOURCE_BUDGETS share
+    of the request's deadline; one that misses it is yielded with the
+    SOURCE_TIMED_OUT error. Seek is cancelled, while a JobSpy board's worker
+    thread cannot be interrupted and is left to finish in the background; while
+    such scrapes hold every JobSpy worker, boards are yielded with SOURCE_BUSY
+    instead of queueing behind them.
+
+    Args:
+        previous: Raw cache entry of an earlier scrape of the same search; sources
+            with a watermark in it are scraped incrementally and yield only jobs
+            listed since then
+        only: Scrape just these sources (optional)
+
+    Yields:
+        Tuples of (source, jobs, error); error is None when the source succeeded
+    """
+    # Not set when the app runs without its lifespan (e.g. TestClient without a with-block)
+    http_client = getattr(app.state, "http_client", None)
+    watermarks = previous.get("watermarks", {}) if previous else {}
+    now = time.time()
+    deadline = request.deadline or SEARCH_DEADLINE
+
+    async def run_source(source: str) -> Tuple[str, List[Dict[str, Any]], Optional[str]]:
+        breaker = get_breaker(source)
+        if not breaker.allow():
+            return source, [], SOURCE_SKIPPED
+
+        watermark = watermarks.get(source)
+        budget = deadline * SOURCE_BUDGETS.get(source, 1.0)
+        future = None
+        try:
+            if source == "seek":
+                known_ids = None
+                if watermark is not None and previous is not None:
+                    known_ids = {job["id"] for job in previous["sources"].get("seek", [])}
+                scrape = scrape_seek(
+                    request.role,
+                    min_sal,
+                    max_sal,
+                    limit=request.limit,
+                    client=http_client,
+                    known_ids=known_ids,
+                    raise_errors=True,
+                )
+            else:
+                # Not the board's fault, so the breaker is left alone
+                if pool_saturated():
+                    logger.warning("Every JobSpy worker is busy; skipping %s", source)
+                    return source, [], SOURCE_BUSY
+                # JobSpy boards block, so each runs on the dedicated pool; the
+                # copied context carries the request's trace into the thread
+                future = JOBSPY_EXECUTOR.submit(
+                    contextvars.copy_context().run,
+                    scrape_site,
+                    source,
+                    request.role,
+                    request.location,
+                    request.country,
+                    request.limit,
+                    _hours_since(watermark, now) if watermark is not None else None,
+                    # A scrape detached at its budget skips the board if still rate limited
+                    time.monotonic() + budget,
+                )
+                scrape = asyncio.wrap_future(future)
+            jobs = await asyncio.wait_for(scrape, budget)
+            breaker.record_success()
+            return source, jobs, None
+        except asyncio.TimeoutError:
+            if future is not None:
+                detach(future)
+            breaker.record_failure()
+            logger.warning("%s missed its %.1fs budget; continuing without it", source, budget)
+            return source, [], SOURCE_TIMED_OUT
+        except Exception as e:
+            breaker.record_failure()
+            logger.error("Error scraping %s: %s", source, e)
+            return source, [], str(e)
+
+    async def scrape_source(source: str) -> Tuple[str, List[Dict[str, Any]], Optional[str]]:
+        start = time.perf_counter()
+        result = await run_source(source)
+        _record_scrape(source, result[1], result[2], start)
+        return result
+
+    tasks = [
+        asyncio.ensure_future(scrape_source(source))
+        for source in _search_sources(request)
+        if only is None or source in only
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # Stop outstanding scrapes if the consumer goes away early
+        for task in tasks:
+            task.cancel()
+
+
+def _merge_new_jobs(
+    new_jobs: List[Dict[str, Any]], old_jobs: List[Dict[str, Any]], limit: int
+) -> List[Dict[str, Any]]:
+    """Put newly scraped jobs ahead of previously scraped ones, without repeats."""
+    new_keys = {job_key(job) for job in new_jobs}
+    merged = new_jobs + [job for job in old_jobs if job_key(job) not in new_keys]
+    return merged[:limit]
+
+
+async def _scrape_all(
+    request: SearchRequest,
+    min_sal: int,
+    max_sal: int,
+    on_source: Optional[SourceCallback] = None,
+    previous: Optional[Dict[str, Any]] = None,
+    only: Optional[Collection[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Scrape every source in parallel and cache the raw results.
+
+    Each successful source records a watermark (the scrape start time). Given
+    the ``previous`` raw cache entry, sources are re-scraped incrementally from
+    their watermarks and the new jobs are merged into the previous ones.
+
+    Args:
+        on_source: Called with (source, jobs, error) as each source finishes
+        previous: Raw cache entry to refresh incrementally (optional)
+        only: Retry just these failed sources of ``previous`` (optional)
+
+    Raises:
+        RuntimeError: If every source of a full scrape failed; the cache is
+            left untouched
+    """
+    logger.info(
+        "Starting %s scrape: role=%s, country=%s, location=%s",
+        "retry" if only else "incremental" if previous else "full",
+        request.role,
+        request.country,
+        request.location,
+    )
+
+    started_at = time.time()
+    watermarks = dict(previous.get("watermarks", {})) if previous else {}
+    sources: Dict[str, List[Dict[str, Any]]] = {}
+    errors: Dict[str, str] = {}
+    flight_key = _flight_key(request)
+    _partial_scrapes[flight_key] = sources
+    try:
+        async for source, jobs, error in _iter_sources(request, min_sal, max_sal, previous, only):
+            if error is not None:
+                errors[source] = error
+            else:
+                if previous is not None and source in watermarks:
+                    old_jobs = previous["sources"].get(source, [])
+                    logger.info("%s: %d new jobs since last scrape", source, len(jobs))
+                    jobs = _merge_new_jobs(jobs, old_jobs, request.limit)
+                watermarks[source] = started_at
+            sources[source] = jobs
+            if on_source is not None:
+                on_source(source, jobs, error)
+    finally:
+        if _partial_scrapes.get(flight_key) is sources:
+            del _partial_scrapes[flight_key]
+    # A failed retry is still saved, so the sources back off further
+    if errors and len(errors) == len(sources) and only is None:
+        raise RuntimeError(f"All sources failed: {errors}")
+    return await _save_raw(request, sources, errors, watermarks, previous, retried=only is not None)
+
+
+def _refresh_in_background(
+    request: SearchRequest, min_sal: int, max_sal: int, only: Optional[List[str]] = None
+) -> None:
+    """Re-scrape a stale search, or retry its failed ``only`` sources, without blocking."""
+    flight_key = _flight_key(request)
+    if flight_key in search_flights:
+        return
+
+    async def refresh() -> None:
+        hit = await raw_cache.lookup_async(request)
+        previous = hit[0] if hit is not None else None
+        if only is not None and previous is None:
+            return
+        scrape_request = _rescrape_request(request, previous)
+        try:
+            await search_flights.do(
+                _flight_key(scrape_request),
+                lambda: _scrape_all(scrape_request, min_sal, max_sal, previous=previous, only=only),
+            )
+        except Exception as e:
+            # Keep serving the stale copy until its hard TTL
+            logger.error("Background refresh failed, serving stale results: %s", e)
+
+    if only is not None:
+        logger.info("Retrying %s for role=%s in background", ", ".join(only), request.role)
+    else:
+        logger.info("Serving stale results; refreshing role=%s in background", request.role)
+    # Not traced: the refresh outlives the request that found the entry stale
+    task = detached_task(refresh())
+    _refresh_tasks.add(task)
+    task.add_done_callback(_refresh_tasks.discard)
+
+
+async def _cached_results(
+    request: SearchRequest, key: str, min_sal: int, max_sal: int, hit: CacheHit
+) -> Optional[List[Dict[str, Any]]]:
+    """Answer from either cache tier, refreshing stale entries in the background.
+
+    ``hit`` is the caller's ``search_cache.lookup(request)``, so each search is
+    counted once in the cache metrics.
+    """
+    if hit is not None and not hit[1]:
+        return hit[0]
+
+    # A cached scrape only needs re-filtering for a different work type or limit
+    raw_hit = await raw_cache.lookup_async(request)
+    if raw_hit is None:
+        if hit is None:
+            return None
+        # Stale view whose scrape was evicted
+        _refresh_in_background(request, min_sal, max_sal)
+        return hit[0]
+
+    entry, stale, _ = raw_hit
+    if stale:
+        _refresh_in_background(request, min_sal, max_sal)
+    elif _due_retries(entry):
+        _refresh_in_background(request, min_sal, max_sal, only=_due_retries(entry))
+    if hit is not None and hit[2] >= entry["scraped_at"]:
+        return hit[0]
+    logger.info("Raw cache hit: deriving view for work_type=%s", request.work_type)
+    return await _serve_raw(request, key, entry)
+
+
+async def _run_search(
+    request: SearchRequest,
+    key: str,
+    min_sal: int,
+    max_sal: int,
+    hit: CacheHit,
+    on_source: Optional[SourceCallback] = None,
+) -> List[Dict[str, Any]]:
+    """Answer a search from the caches, the job store or by scraping.
+
+    ``hit`` is the caller's ``search_cache.lookup(request)``. ``on_source`` only
+    sees per-source progress when this call starts the scrape.
+    """
+    jobs = await _cached_results(request, key, min_sal, max_sal, hit)
+    if jobs is not None:
+        return jobs
+    return await _search_uncached(request, key, min_sal, max_sal, on_source)
+
+
+async def _search_uncached(
+    request: SearchRequest,
+    key: str,
+    min_sal: int,
+    max_sal: int,
+    on_source: Optional[SourceCallback] = None,
+    check_store: bool = True,
+) -> List[Dict[str, Any]]:
+    """Answer a search the caches missed from the job store or by scraping.
+
+    With ``check_store`` False the store is skipped, so a scrape in flight when
+    this is called is joined before it can finish.
+    """
+    # Answer from the job store when this search was scraped recently
+    stored = await _load_stored(key) if check_store else None
+    if stored is not None:
+        stored_jobs, scraped_at = stored
+        logger.info("Job store hit: returning %d stored jobs", len(stored_jobs))
+        # Cached as of the stored scrape, so it turns stale when that scrape does
+        await search_cache.set_async(request, stored_jobs, scraped_at)
+        return stored_jobs
+
+    # Concurrent searches over the same sources share one scrape, but a search
+    # joining a longer one still answers within its own deadline
+    flight_key = _flight_key(request)
+    try:
+        with span("scrape"):
+            entry = await search_flights.do(
+                flight_key,
+                lambda: _scrape_all(request, min_sal, max_sal, on_source),
+                timeout=request.deadline or SEARCH_DEADLINE,
+            )
+    except asyncio.TimeoutError:
+        partial = dict(_partial_scrapes.get(flight_key, {}))
+        logger.warning(
+            "Shared scrape outlasted this search's deadline; answering from %d finished sources",
+            len(partial),
+        )
+        return _derive_results(request, partial)
+    except RuntimeError as e:
+        logger.error("Search failed: %s", e)
+        return []
+    filtered_jobs = await _serve_raw(request, key, entry)
+
+    logger.info("Search complete: found %d jobs", len(filtered_jobs))
+    return filtered_jobs
 
 
 @app.post(
@@ -117,71 +1001,434 @@ Search for jobs across multiple job boards.
 - `remote`: Only remote/work-from-home jobs
 - `hybrid`: Only hybrid jobs
 - `onsite`: Only on-site jobs
+
+**Failing Sources:**
+A source that keeps failing is skipped for a cool-down period instead of slowing
+every search down; skipped sources are listed in the `X-Skipped-Sources` header.
+
+**Deadline:**
+Scraping stops after `deadline` seconds (default from the server's `SEARCH_DEADLINE`);
+sources that have not finished are left out. When the search scraped, the
+`X-Source-Status` header gives each source's status, e.g.
+`seek=completed, linkedin=timeout, indeed=failed, glassdoor=skipped`.
+
+**Timing:**
+Every response carries a `Server-Timing` header with the time spent per stage
+(cache lookup, each source, Seek HTTP and parsing, JobSpy, filters, dedupe,
+validation or serialization). `debug=timing` instead returns
+`{"jobs": [...], "trace": {...}}` with every span of the request.
+
+**Fast Response Mode:**
+Setting `fast=true`, `fields` or `description_chars` serializes the normalized jobs
+directly, skipping per-job model validation:
+- `fields=id,title,company,job_url` returns only those fields
+- `description_chars=200` truncates descriptions to 200 characters
     """,
     tags=["Jobs"],
 )
-async def search_jobs(request: SearchRequest) -> List[Job]:
+async def search_jobs(
+    request: SearchRequest,
+    response: Response,
+    fast: Annotated[bool, Query(description="Serialize with the fast JSON path")] = False,
+    fields: Annotated[
+        Optional[str], Query(description="Comma-separated job fields to return (implies fast)")
+    ] = None,
+    description_chars: Annotated[
+        Optional[int],
+        Query(ge=0, description="Truncate descriptions to this many characters (implies fast)"),
+    ] = None,
+    debug: Annotated[
+        Optional[Literal["timing"]],
+        Query(description="'timing' wraps the jobs with a JSON trace of every stage"),
+    ] = None,
+) -> List[Job] | Response:
     """Search for jobs across multiple job boards."""
-    # Check cache
-    cached_result = search_cache.get(request)
-    if cached_result is not None:
+    try:
+        projection = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    fast = fast or projection is not None or description_chars is not None
+
+    # Fresh derived views are answered without parsing anything else
+    start = time.perf_counter()
+    skipped: List[str] = []
+    statuses: Dict[str, str] = {}
+    with span("cache_lookup"):
+        hit = await search_cache.lookup_async(request)
+    fresh_hit = False
+    if hit is not None and not hit[1]:
         logger.info("Cache hit for search: role=%s, location=%s", request.role, request.location)
-        return cached_result
+        fresh_hit = True
+        jobs = hit[0]
+    else:
+        skipped = _skipped_sources(request)
+        try:
+            min_sal, max_sal = parse_salary(request.salary)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
-    logger.info(
-        "Cache miss. Starting scrape: role=%s, country=%s, location=%s",
-        request.role,
-        request.country,
-        request.location,
-    )
+        key = search_cache._make_key(request)
+        with SEARCHES_IN_FLIGHT.track("search"):
+            jobs = await _run_search(
+                request,
+                key,
+                min_sal,
+                max_sal,
+                hit,
+                on_source=lambda source, _, error: statuses.update({source: _source_status(error)}),
+            )
+    SEARCH_DURATION.observe(time.perf_counter() - start, "hit" if fresh_hit else "miss")
+
+    headers = {"X-Skipped-Sources": ",".join(skipped)} if skipped else {}
+    if statuses:
+        headers["X-Source-Status"] = ", ".join(
+            f"{source}={statuses[source]}"
+            for source in _search_sources(request)
+            if source in statuses
+        )
+    trace = current_trace()
+    if debug == "timing" and trace is not None:
+        with span("serialize"):
+            if fast:
+                body = project_jobs(jobs, projection, description_chars)
+            else:
+                body = _serialize_jobs(jobs)
+        content = dumps({"jobs": body, "trace": trace.to_dict()})
+        return Response(content=content, media_type="application/json", headers=headers)
+    if fast:
+        with span("serialize"):
+            content = dumps(project_jobs(jobs, projection, description_chars))
+        return Response(content=content, media_type="application/json", headers=headers)
+    response.headers.update(headers)
+    # Validate here so the pydantic cost shows up as a stage; FastAPI then only dumps
+    with span("validate"):
+        return [Job.model_validate(job) for job in jobs]
+
+
+def _serialize_jobs(jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Serialize jobs exactly as the Job response model would."""
+    return [Job.model_validate(job).model_dump(mode="json") for job in jobs]
 
+
+def _encode_event(event: Dict[str, Any], sse: bool) -> str:
+    """Encode a stream event as an NDJSON line or a Server-Sent Event."""
+    data = json.dumps(event)
+    if sse:
+        return f"event: {event['event']}\ndata: {data}\n\n"
+    return f"{data}\n"
+
+
+@app.post(
+    "/api/search/stream",
+    response_class=StreamingResponse,
+    summary="Search for jobs (streaming)",
+    description="""
+Streaming variant of `/api/search` that pushes each source's jobs as soon as they are ready.
+
+The response is newline-delimited JSON (`application/x-ndjson`), or Server-Sent Events
+when the request sends `Accept: text/event-stream`. Each event is an object with an
+`event` field:
+
+- `jobs`: `{"event": "jobs", "source": "linkedin", "jobs": [...]}`, one per source,
+  already filtered by role and work type. Cached results arrive as a single
+  `cache` source.
+- `summary`: `{"event": "summary", "total": 42, "sources": {...}, "skipped": [...],
+  "elapsed_ms": 1234.5}`, always last, with the job count, status (`completed`,
+  `failed`, `timeout` or `skipped`) and error (if any) for every source, and the
+  sources skipped because they keep failing. Sources still running when the
+  request's deadline passes are reported as `timeout`.
+    """,
+    tags=["Jobs"],
+)
+async def search_jobs_stream(request: SearchRequest, http_request: Request) -> StreamingResponse:
+    """Stream search results per source as each scraper finishes."""
     try:
         min_sal, max_sal = parse_salary(request.salary)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    # Helper for safe Seek scraping
-    async def safe_scrape_seek():
-        if request.country.upper() == "AU":
+    sse = "text/event-stream" in http_request.headers.get("accept", "")
+    key = search_cache._make_key(request)
+
+    async def events() -> AsyncIterator[str]:
+        # aclosing stops waiting when the client disconnects; the shared scrape
+        # still finishes and is cached for later searches
+        with SEARCHES_IN_FLIGHT.track("stream"):
+            async with aclosing(stream_events()) as stream:
+                async for event in stream:
+                    yield event
+
+    async def stream_events() -> AsyncGenerator[str, None]:
+        start = time.perf_counter()
+        sources: Dict[str, Dict[str, Any]] = {}
+        skipped: List[str] = []
+
+        # Reuse a cached or stored result before scraping
+        hit = await search_cache.lookup_async(request)
+        cached = await _cached_results(request, key, min_sal, max_sal, hit)
+        if cached is None:
+            stored = await _load_stored(key)
+            if stored is not None:
+                cached, scraped_at = stored
+                await search_cache.set_async(request, cached, scraped_at)
+
+        # Scrape as a shared flight, so identical searches and streams arriving
+        # meanwhile join it; a stream finding one in flight joins it instead
+        results: asyncio.Queue = asyncio.Queue()
+        flight = None
+        if cached is None:
+            flight, started = search_flights.start(
+                _flight_key(request),
+                lambda: _scrape_all(
+                    request, min_sal, max_sal, on_source=lambda *result: results.put_nowait(result)
+                ),
+            )
+            if not started:
+                cached = await _search_uncached(request, key, min_sal, max_sal, check_store=False)
+            else:
+                # None marks the end of the scrape's results
+                flight.add_done_callback(lambda _: results.put_nowait(None))
+
+        if cached is not None:
+            sources["cache"] = {"count": len(cached), "status": "completed", "error": None}
+            yield _encode_event(
+                {"event": "jobs", "source": "cache", "jobs": _serialize_jobs(cached)}, sse
+            )
+            total = len(cached)
+        elif flight is not None:
+            batches: Dict[str, List[Dict[str, Any]]] = {}
+            # Jobs already streamed for one source are not repeated for later sources
+            deduplicator = Deduplicator()
+            while (result := await results.get()) is not None:
+                source, jobs, error = result
+                batch = filter_jobs(jobs, request.role)
+                batch = filter_by_work_type(batch, request.work_type)
+                SOURCE_JOBS.inc(source, "kept", amount=len(batch))
+                batch = deduplicator.add(batch)
+                batches[source] = batch
+                sources[source] = {
+                    "count": len(batch),
+                    "status": _source_status(error),
+                    "error": error,
+                }
+                if error == SOURCE_SKIPPED:
+                    skipped.append(source)
+                yield _encode_event(
+                    {"event": "jobs", "source": source, "jobs": _serialize_jobs(batch)}, sse
+                )
+
+            filtered_jobs: List[Dict[str, Any]] = []
+            for source in _search_sources(request):
+                filtered_jobs.extend(batches.get(source, []))
+            # The flight cached the raw scrape, unless every source failed
             try:
-                return await scrape_seek(request.role, min_sal, max_sal, limit=request.limit)
-            except Exception as e:
-                logger.error("Error scraping Seek: %s", e)
-                return []
-        return []
+                entry = flight.result()
+            except RuntimeError as e:
+                logger.error("Streamed search failed: %s", e)
+            else:
+                await search_cache.set_async(request, filtered_jobs, _view_timestamp(entry))
+                await _record_search(key, filtered_jobs)
+            total = len(filtered_jobs)
+            logger.info(
+                "Streamed search complete: found %d jobs (duplicate ratio %.2f)",
+                total,
+                deduplicator.duplicate_ratio,
+            )
+
+        yield _encode_event(
+            {
+                "event": "summary",
+                "total": total,
+                "sources": sources,
+                "skipped": skipped,
+                "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+            },
+            sse,
+        )
+
+    media_type = "text/event-stream" if sse else "application/x-ndjson"
+    return StreamingResponse(events(), media_type=media_type)
+
+
+async def _run_submitted(search: SubmittedSearch) -> List[Dict[str, Any]]:
+    """Run a search submitted through /api/searches, reporting per-source progress."""
+    request = search.request
+    min_sal, max_sal = parse_salary(request.salary)
+    key = search_cache._make_key(request)
+
+    def on_source(source: str, jobs: List[Dict[str, Any]], error: Optional[str]) -> None:
+        search.source_done(source, jobs, error, status=_source_status(error))
 
-    # Helper for safe Others scraping
-    def safe_scrape_others():
+    with SEARCHES_IN_FLIGHT.track("submitted"):
+        hit = await search_cache.lookup_async(request)
+        return await _run_search(request, key, min_sal, max_sal, hit, on_source=on_source)
+
+
+@app.post(
+    "/api/searches",
+    response_model=SearchStatus,
+    status_code=202,
+    summary="Submit a search",
+    description="""
+Start a search in the background and return its id immediately.
+
+Poll `GET /api/searches/{id}` for status and per-source progress, then fetch
+results from `GET /api/searches/{id}/results`. Searches are scraped on a bounded
+pool, so a submitted search may wait in the `queued` state. Sources skipped because
+they keep failing are reported with the `skipped` status, and sources that miss the
+search's deadline with the `timeout` status.
+    """,
+    tags=["Searches"],
+)
+async def submit_search(request: SearchRequest) -> SearchStatus:
+    """Submit a search to run in the background."""
+    try:
+        parse_salary(request.salary)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        search = search_registry.submit(request, _search_sources(request), _run_submitted)
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return search.to_status()
+
+
+def _get_submitted(search_id: str) -> SubmittedSearch:
+    """Look up a submitted search or raise 404."""
+    search = search_registry.get(search_id)
+    if search is None:
+        raise HTTPException(status_code=404, detail=f"Search {search_id} not found")
+    return search
+
+
+@app.get(
+    "/api/searches/{search_id}",
+    response_model=SearchStatus,
+    summary="Get search status",
+    description="Return the status of a submitted search and the progress of each source.",
+    tags=["Searches"],
+)
+def get_search(search_id: str) -> SearchStatus:
+    """Return the status of a submitted search."""
+    return _get_submitted(search_id).to_status()
+
+
+@app.get(
+    "/api/searches/{search_id}/results",
+    response_model=SearchResultsPage,
+    summary="Get search results",
+    description="""
+Return one page of a completed search's results.
+
+Responds with 409 while the search is still queued or running, or if it failed.
+    """,
+    tags=["Searches"],
+)
+def get_search_results(
+    search_id: str,
+    offset: Annotated[int, Query(ge=0, description="Index of the first job")] = 0,
+    limit: Annotated[int, Query(ge=1, le=100, description="Maximum jobs per page")] = 25,
+) -> SearchResultsPage:
+    """Return a page of results for a completed search."""
+    search = _get_submitted(search_id)
+    if search.status != "completed":
+        detail = search.error or f"Search is {search.status}"
+        raise HTTPException(status_code=409, detail=detail)
+    return SearchResultsPage(
+        id=search.id,
+        total=len(search.jobs),
+        offset=offset,
+        limit=limit,
+        jobs=search.jobs[offset : offset + limit],
+    )
+
+
+async def _refresh_saved(saved: Dict[str, Any]) -> None:
+    """Re-scrape a saved search into the caches and store, recording the outcome."""
+    request = SearchRequest(**saved["request"])
+    error = None
+    try:
+        min_sal, max_sal = parse_salary(request.salary)
+        # Only jobs listed since the last refresh are fetched when it is still cached
+        hit = await raw_cache.lookup_async(request)
+        previous = hit[0] if hit is not None else None
+        scrape_request = _rescrape_request(request, previous)
+        entry = await search_flights.do(
+            _flight_key(scrape_request),
+            lambda: _scrape_all(scrape_request, min_sal, max_sal, previous=previous),
+        )
+        await _serve_raw(request, search_cache._make_key(request), entry)
+    except Exception as e:
+        error = str(e)
+        raise
+    finally:
+        loop = asyncio.get_running_loop()
         try:
-            return scrape_others(
-                request.role, request.location, request.country, limit=request.limit
+            await loop.run_in_executor(
+                None, job_store.mark_saved_search_run, saved["id"], time.time(), error
             )
-        except Exception as e:
-            logger.error("Error scraping other sites: %s", e)
-            return []
+        except sqlite3.Error as e:
+            logger.error("Error writing job store: %s", e)
 
-    # Execute scrapers in parallel
-    loop = asyncio.get_running_loop()
 
-    seek_task = safe_scrape_seek()
-    others_task = loop.run_in_executor(None, safe_scrape_others)
+def _to_saved_search(saved: Dict[str, Any]) -> SavedSearch:
+    """Build the API model for a stored saved search."""
+    return SavedSearch(
+        id=saved["id"],
+        search=SearchRequest(**saved["request"]),
+        interval=int(saved["interval"]),
+        created_at=saved["created_at"],
+        last_run=saved["last_run"],
+        last_error=saved["last_error"],
+    )
 
-    results = await asyncio.gather(seek_task, others_task)
 
-    # Combine results
-    all_jobs = []
-    for res in results:
-        all_jobs.extend(res)
+@app.post(
+    "/api/saved-searches",
+    response_model=SavedSearch,
+    status_code=201,
+    summary="Save a search",
+    description="""
+Save a search to be re-scraped in the background every `interval` seconds, so
+`/api/search` with the same parameters is answered from the cache.
+    """,
+    tags=["Saved Searches"],
+)
+def create_saved_search(saved: SavedSearchCreate) -> SavedSearch:
+    """Persist a saved search; the scheduler picks it up on its next tick."""
+    try:
+        parse_salary(saved.search.salary)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    record = job_store.save_search(uuid.uuid4().hex, saved.search.model_dump(), saved.interval)
+    return _to_saved_search(record)
 
-    # Apply filters
-    filtered_jobs = filter_jobs(all_jobs, request.role)
-    filtered_jobs = filter_by_work_type(filtered_jobs, request.work_type)
 
-    # Save to cache
-    search_cache.set(request, filtered_jobs)
+@app.get(
+    "/api/saved-searches",
+    response_model=List[SavedSearch],
+    summary="List saved searches",
+    description="List saved searches with the time and outcome of their last refresh.",
+    tags=["Saved Searches"],
+)
+def list_saved_searches() -> List[SavedSearch]:
+    """Return every saved search."""
+    return [_to_saved_search(saved) for saved in job_store.list_saved_searches()]
 
-    logger.info("Search complete: found %d jobs", len(filtered_jobs))
-    return filtered_jobs
+
+@app.delete(
+    "/api/saved-searches/{saved_id}",
+    status_code=204,
+    summary="Delete a saved search",
+    description="Stop refreshing a saved search.",
+    tags=["Saved Searches"],
+)
+def delete_saved_search(saved_id: str) -> Response:
+    """Delete a saved search."""
+    if not job_store.delete_saved_search(saved_id):
+        raise HTTPException(status_code=404, detail=f"Saved search {saved_id} not found")
+    return Response(status_code=204)
 
 
 @app.get(
@@ -196,6 +1443,36 @@ def health_check() -> HealthResponse:
     return HealthResponse(status="ok")
 
 
+@app.get(
+    "/metrics",
+    response_class=Response,
+    summary="Metrics",
+    description="Scrape, filter, cache and search metrics in the Prometheus text format.",
+    tags=["System"],
+)
+def metrics() -> Response:
+    """Render every metric for a Prometheus scrape."""
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
+@app.get(
+    "/api/scraper-stats",
+    summary="Scraper stats",
+    description=(
+        "Health of the proxy pool, the current per-host rate limits and the state "
+        "of each source's circuit breaker."
+    ),
+    tags=["System"],
+)
+def scraper_stats() -> dict:
+    """Return proxy pool, rate limiter and circuit breaker state for monitoring."""
+    return {
+        "proxies": PROXY_POOL.stats(),
+        "rate_limits": limiter_stats(),
+        "circuits": breaker_stats(),
+    }
+
+
 @app.post(
     "/api/clear-cache",
     summary="Clear search cache",
@@ -203,7 +1480,12 @@ def health_check() -> HealthResponse:
     tags=["System"],
 )
 def clear_cache() -> dict:
-    """Clear the search cache and return the number of entries cleared."""
-    count = search_cache.clear()
+    """Clear both cache tiers and return the number of entries cleared."""
+    count = search_cache.clear() + raw_cache.clear()
+    _title_indexes.clear()
+    try:
+        job_store.clear_searches()
+    except sqlite3.Error as e:
+        logger.error("Error clearing stored searches: %s", e)
     logger.info("Cache cleared: %d entries removed", count)
     return {"cleared": count, "message": f"Cleared {count} cached entries"}
@@ -0,0 +1,341 @@
+"""Persistent SQLite job store keyed on job id."""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from .config import JOB_STORE_PATH
+except ImportError:
+    from config import JOB_STORE_PATH
+
+logger = logging.getLogger(__name__)
+
+# Columns persisted for every job, in the same order as the scraper dictionaries
+JOB_COLUMNS = (
+    "id",
+    "site",
+    "title",
+    "company",
+    "location",
+    "date_posted",
+    "job_url",
+    "salary_range",
+    "company_url",
+    "description",
+    "is_remote",
+    "work_from_home_type",
+)
+
+# Ids the scrapers emit when the real id could not be extracted
+_UNUSABLE_IDS = {"", "N/A", "seek_unknown"}
+
+# SQLite limits the number of host parameters per statement
+_MAX_PARAMS = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    site TEXT COLLATE NOCASE,
+    title TEXT,
+    company TEXT COLLATE NOCASE,
+    location TEXT COLLATE NOCASE,
+    date_posted TEXT,
+    job_url TEXT,
+    salary_range TEXT,
+    company_url TEXT,
+    description TEXT,
+    is_remote INTEGER,
+    work_from_home_type TEXT COLLATE NOCASE,
+    source_urls TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_site ON jobs(site);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company);
+CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs(location);
+CREATE INDEX IF NOT EXISTS idx_jobs_date_posted ON jobs(date_posted);
+CREATE INDEX IF NOT EXISTS idx_jobs_work_type ON jobs(work_from_home_type);
+
+CREATE TABLE IF NOT EXISTS searches (
+    key TEXT PRIMARY KEY,
+    job_ids TEXT NOT NULL,
+    scraped_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS saved_searches (
+    id TEXT PRIMARY KEY,
+    request TEXT NOT NULL,
+    interval REAL NOT NULL,
+    created_at REAL NOT NULL,
+    last_run REAL,
+    last_error TEXT
+);
+"""
+
+_UPSERT_SQL = (
+    f"INSERT INTO jobs ({', '.join(JOB_COLUMNS)}, source_urls, first_seen, last_seen) "
+    f"VALUES ({', '.join('?' for _ in JOB_COLUMNS)}, ?, ?, ?) "
+    "ON CONFLICT(id) DO UPDATE SET "
+    + ", ".join(f"{col} = excluded.{col}" for col in JOB_COLUMNS[1:])
+    + ", source_urls = COALESCE(excluded.source_urls, jobs.source_urls)"
+    + ", last_seen = excluded.last_seen"
+)
+
+# Columns added after the first release, created on existing databases at connect time
+_MIGRATIONS = {"source_urls": "ALTER TABLE jobs ADD COLUMN source_urls TEXT"}
+
+
+def job_key(job: Dict[str, Any]) -> str:
+    """Return the store key for a job, falling back to its URL when the id is unknown."""
+    job_id = str(job.get("id") or "")
+    if job_id in _UNUSABLE_IDS:
+        return str(job.get("job_url") or "N/A")
+    return job_id
+
+
+def _to_text(value: Any) -> Optional[str]:
+    """Convert a job field to text for storage."""
+    if value is None:
+        return None
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def _to_row(job: Dict[str, Any], now: float) -> tuple:
+    """Convert a job dictionary into an upsert parameter tuple."""
+    values: List[Any] = [job_key(job)]
+    for col in JOB_COLUMNS[1:]:
+        if col == "is_remote":
+            values.append(1 if job.get(col) else 0)
+        else:
+            values.append(_to_text(job.get(col)))
+    source_urls = job.get("source_urls")
+    values.append(json.dumps(source_urls) if source_urls is not None else None)
+    values.extend((now, now))
+    return tuple(values)
+
+
+def _from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    """Convert a stored row back into a job dictionary."""
+    job = {col: row[col] for col in JOB_COLUMNS}
+    job["is_remote"] = bool(job["is_remote"])
+    if row["source_urls"] is not None:
+        job["source_urls"] = json.loads(row["source_urls"])
+    return job
+
+
+class JobStore:
+    """SQLite-backed job store with batched upserts and indexed lookups.
+
+    The connection is opened lazily in WAL mode and shared between threads,
+    so the store can be used from executor threads as well as the event loop.
+    """
+
+    def __init__(self, path: str = JOB_STORE_PATH):
+        self._path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema on first use."""
+        if self._conn is None:
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            existing = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+            for column, statement in _MIGRATIONS.items():
+                if column not in existing:
+                    conn.execute(statement)
+            self._conn = conn
+        return self._conn
+
+    def upsert_jobs(self, jobs: Iterable[Dict[str, Any]]) -> int:
+        """Insert or update jobs by id in one transaction. Returns rows written."""
+        now = time.time()
+        rows = [_to_row(job, now) for job in jobs]
+        if not rows:
+            return 0
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(_UPSERT_SQL, rows)
+        return len(rows)
+
+    def get_jobs(self, ids: List[str]) -> List[Dict[str, Any]]:
+        """Fetch jobs by store key, preserving the order of ``ids``."""
+        found: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            conn = self._connect()
+            for start in range(0, len(ids), _MAX_PARAMS):
+                chunk = ids[start : start + _MAX_PARAMS]
+                placeholders = ", ".join("?" for _ in chunk)
+                cursor = conn.execute(f"SELECT * FROM jobs WHERE id IN ({placeholders})", chunk)
+                for row in cursor:
+                    found[row["id"]] = _from_row(row)
+        return [found[job_id] for job_id in ids if job_id in found]
+
+    def query_jobs(
+        self,
+        site: Optional[str] = None,
+        company: Optional[str] = None,
+        location: Optional[str] = None,
+        work_type: Optional[str] = None,
+        posted_since: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """
+        Query stored jobs using the indexed columns.
+
+        Args:
+            site: Source job board (case insensitive)
+            company: Company name (case insensitive)
+            location: Location string (case insensitive)
+            work_type: Work arrangement stored in work_from_home_type
+            posted_since: ISO date; only jobs posted on or after it are returned
+            limit: Maximum number of jobs to return
+
+        Returns:
+            List of job dictionaries, most recently seen first
+        """
+        clauses = []
+        params: List[Any] = []
+        for col, value in (
+            ("site", site),
+            ("company", company),
+            ("location", location),
+            ("work_from_home_type", work_type),
+        ):
+            if value is not None:
+                clauses.append(f"{col} = ?")
+                params.append(value)
+        if posted_since is not None:
+            clauses.append("date_posted >= ?")
+            params.append(posted_since)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        params.append(limit)
+        with self._lock:
+            conn = self._connect()
+            cursor = conn.execute(
+                f"SELECT * FROM jobs {where} ORDER BY last_seen DESC LIMIT ?", params
+            )
+            return [_from_row(row) for row in cursor]
+
+    def ingest(
+        self, key: str, scraped: List[Dict[str, Any]], results: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Upsert every scraped job and record the result ids for a search.
+
+        Args:
+            key: Normalized search key
+            scraped: All jobs returned by the scrapers
+            results: Jobs returned to the client for this search
+        """
+        now = time.time()
+        # Results go last so their source_urls win over the raw scraped copies
+        rows = [_to_row(job, now) for job in scraped]
+        rows.extend(_to_row(job, now) for job in results if job.get("source_urls"))
+        job_ids = json.dumps([job_key(job) for job in results])
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                if rows:
+                    conn.executemany(_UPSERT_SQL, rows)
+                conn.execute(
+                    "INSERT INTO searches (key, job_ids, scraped_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET "
+                    "job_ids = excluded.job_ids, scraped_at = excluded.scraped_at",
+                    (key, job_ids, now),
+                )
+        logger.info("Stored %d scraped jobs for search %s", len(scraped), key)
+
+    def load_search(self, key: str, max_age: float) -> Optional[Tuple[List[Dict[str, Any]], float]]:
+        """Return stored results for a search and when it was scraped, if within ``max_age``."""
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT job_ids, scraped_at FROM searches WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or time.time() - row["scraped_at"] >= max_age:
+            return None
+        return self.get_jobs(json.loads(row["job_ids"])), row["scraped_at"]
+
+    def save_search(
+        self, saved_id: str, request: Dict[str, Any], interval: float
+    ) -> Dict[str, Any]:
+        """
+        Create or replace a saved search.
+
+        Args:
+            saved_id: Saved search identifier
+            request: Search request parameters
+            interval: Seconds between background refreshes
+
+        Returns:
+            The saved search record
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO saved_searches (id, request, interval, created_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (saved_id, json.dumps(request), interval, now),
+                )
+        return {
+            "id": saved_id,
+            "request": request,
+            "interval": interval,
+            "created_at": now,
+            "last_run": None,
+            "last_error": None,
+        }
+
+    def list_saved_searches(self) -> List[Dict[str, Any]]:
+        """Return every saved search, oldest first."""
+        with self._lock:
+            conn = self._connect()
+            rows = conn.execute("SELECT * FROM saved_searches ORDER BY created_at").fetchall()
+        return [dict(row, request=json.loads(row["request"])) for row in rows]
+
+    def delete_saved_search(self, saved_id: str) -> bool:
+        """Delete a saved search. Returns False if it did not exist."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                cursor = conn.execute("DELETE FROM saved_searches WHERE id = ?", (saved_id,))
+        return cursor.rowcount > 0
+
+    def mark_saved_search_run(self, saved_id: str, ran_at: float, error: Optional[str]) -> None:
+        """Record when a saved search was last refreshed and whether it failed."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "UPDATE saved_searches SET last_run = ?, last_error = ? WHERE id = ?",
+                    (ran_at, error, saved_id),
+                )
+
+    def clear_searches(self) -> int:
+        """Forget recorded search results (jobs are kept). Returns rows removed."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                return conn.execute("DELETE FROM searches").rowcount
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
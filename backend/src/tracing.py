@@ -0,0 +1,166 @@
+"""Lightweight per-request tracing of search stages.
+
+A trace is started for every HTTP request and kept in a context variable, so
+stages anywhere below the endpoint (scrapers, filters, serialization) can
+record spans without threading a tracer through every call. Tasks created
+while handling the request inherit it; work handed to a thread pool must be
+run with ``contextvars.copy_context().run`` to do the same. Tasks that outlive
+the request (shared scrapes, background refreshes) are started with
+``detached_task`` instead, so they never record into it. Outside a request
+``span`` only checks the context variable, so it is safe on hot paths.
+
+The spans are reported in the ``Server-Timing`` response header and can be
+rendered as a JSON trace for debugging.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Coroutine, Dict, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Trace:
+    """Spans recorded while handling one request."""
+
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.spans: List[Dict[str, Any]] = []
+        # Scrapers record spans from worker threads
+        self._lock = threading.Lock()
+
+    def add(self, name: str, start: float, duration: float) -> None:
+        """Record a span that started at ``start`` (perf_counter) and lasted ``duration``."""
+        with self._lock:
+            self.spans.append({"name": name, "start": start - self.start, "duration": duration})
+
+    def extend(self, other: "Trace") -> None:
+        """Record the spans of another trace, such as shared work this request waited for.
+
+        Spans that started before this trace keep their place, at negative offsets.
+        """
+        with other._lock:
+            spans = list(other.spans)
+        offset = other.start - self.start
+        with self._lock:
+            self.spans.extend({**s, "start": s["start"] + offset} for s in spans)
+
+    def elapsed(self) -> float:
+        """Seconds since the trace started."""
+        return time.perf_counter() - self.start
+
+    def stages(self) -> Dict[str, Dict[str, Any]]:
+        """Total duration and count of spans per stage name, in first-seen order."""
+        with self._lock:
+            spans = list(self.spans)
+        stages: Dict[str, Dict[str, Any]] = {}
+        for span_ in spans:
+            stage = stages.setdefault(span_["name"], {"count": 0, "duration": 0.0})
+            stage["count"] += 1
+            stage["duration"] += span_["duration"]
+        return stages
+
+    def server_timing(self) -> str:
+        """Render the stages as a Server-Timing header value, ending with the total."""
+        entries = []
+        for name, stage in self.stages().items():
+            entry = f"{name};dur={stage['duration'] * 1000:.1f}"
+            if stage["count"] > 1:
+                entry += f';desc="x{stage["count"]}"'
+            entries.append(entry)
+        entries.append(f"total;dur={self.elapsed() * 1000:.1f}")
+        return ", ".join(entries)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Structured trace: every span plus per-stage totals, in milliseconds."""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s["start"])
+        return {
+            "total_ms": round(self.elapsed() * 1000, 3),
+            "stages": {
+                name: {"count": stage["count"], "total_ms": round(stage["duration"] * 1000, 3)}
+                for name, stage in self.stages().items()
+            },
+            "spans": [
+                {
+                    "name": s["name"],
+                    "start_ms": round(s["start"] * 1000, 3),
+                    "duration_ms": round(s["duration"] * 1000, 3),
+                }
+                for s in spans
+            ],
+        }
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+
+
+def current_trace() -> Optional[Trace]:
+    """The trace of the request being handled, if any."""
+    return _current_trace.get()
+
+
+def detached_task(coro: Coroutine[Any, Any, T], trace: Optional[Trace] = None) -> "asyncio.Task[T]":
+    """Start ``coro`` as a task recording into ``trace`` rather than the current request's.
+
+    Other context variables are still inherited.
+    """
+    context = contextvars.copy_context()
+    context.run(_current_trace.set, trace)
+    return context.run(asyncio.ensure_future, coro)
+
+
+def join_trace(trace: Trace) -> None:
+    """Add the spans of ``trace`` to the current request's trace, if there is one."""
+    current = _current_trace.get()
+    if current is not None and current is not trace:
+        current.extend(trace)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Record the enclosed block as a span of the current trace, if there is one."""
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add(name, start, time.perf_counter() - start)
+
+
+class ServerTimingMiddleware:
+    """ASGI middleware that traces each HTTP request and adds a Server-Timing header.
+
+    The header is sent with the response start, so for streaming responses it
+    covers the work done before the first byte.
+    """
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace = Trace()
+        token = _current_trace.set(trace)
+
+        async def send_with_timing(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", trace.server_timing().encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_trace.reset(token)
@@ -1,13 +1,18 @@
 """Utility functions for job filtering and salary parsing."""
 
 import re
+import time
 from functools import lru_cache
-from typing import Any, Dict, FrozenSet, List, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 try:
     from .config import JOB_SYNONYMS, STOP_WORDS
+    from .metrics import FILTER_DURATION, FILTER_JOBS
+    from .tracing import current_trace
 except ImportError:
     from config import JOB_SYNONYMS, STOP_WORDS
+    from metrics import FILTER_DURATION, FILTER_JOBS
+    from tracing import current_trace
 
 # Pre-compile regex patterns for better performance
 _NON_WORD_PATTERN = re.compile(r"[^\w\s]")
@@ -73,24 +78,36 @@ def _get_matching_tokens(role_token: str) -> FrozenSet[str]:
     return frozenset(possible_matches)
 
 
-def filter_jobs(jobs: List[Dict[str, Any]], role: str) -> List[Dict[str, Any]]:
-    """
-    Filter jobs based on title relevance to the search role.
+def _normalize_text(text: str) -> str:
+    """Lowercase text and strip punctuation (using pre-compiled pattern)."""
+    return _NON_WORD_PATTERN.sub("", text.lower())
 
-    All significant words from the role must match (with synonyms allowed).
 
-    Args:
-        jobs: List of job dictionaries
-        role: Search role string
+@lru_cache(maxsize=4096)
+def tokenize_title(title: str) -> FrozenSet[str]:
+    """Tokenize a job title. Cached because the same titles recur across searches."""
+    return frozenset(_normalize_text(title).split())
 
-    Returns:
-        Filtered list of jobs matching the role
+
+class RoleQuery:
+    """A role compiled into one group of acceptable title tokens per significant word.
+
+    A title matches when it contains at least one token from every group.
     """
-    if not jobs:
-        return []
 
-    # Tokenize and clean role (using pre-compiled pattern)
-    role_clean = _NON_WORD_PATTERN.sub("", role.lower())
+    __slots__ = ("role", "token_groups")
+
+    def __init__(self, role: str, token_groups: Tuple[FrozenSet[str], ...]):
+        self.role = role
+        self.token_groups = token_groups
+
+    def matches(self, title_tokens: FrozenSet[str]) -> bool:
+        """Check whether a tokenized title satisfies every token group."""
+        return all(not group.isdisjoint(title_tokens) for group in self.token_groups)
+
+
+@lru_cache(maxsize=256)
+def _compile_normalized_role(role_clean: str) -> RoleQuery:
     role_tokens = [t for t in role_clean.split() if t]
 
     # Filter out stop words
@@ -98,28 +115,91 @@ def filter_jobs(jobs: List[Dict[str, Any]], role: str) -> List[Dict[str, Any]]:
     if not significant_tokens:
         significant_tokens = role_tokens
 
-    filtered_jobs = []
+    groups = tuple(_get_matching_tokens(token) for token in dict.fromkeys(significant_tokens))
+    return RoleQuery(role_clean, groups)
+
+
+def compile_role(role: str) -> RoleQuery:
+    """Compile a search role into a RoleQuery, cached per normalized role."""
+    return _compile_normalized_role(" ".join(_normalize_text(role).split()))
 
-    for job in jobs:
-        title = job.get("title", "")
-        if not title or title == "N/A":
-            continue
 
-        title_clean = _NON_WORD_PATTERN.sub("", title.lower())
-        title_tokens = frozenset(title_clean.split())
+class TitleIndex:
+    """Inverted index from title token to a bitmap of job positions.
+
+    Build it once per job list; each role is then answered with integer
+    OR/AND operations instead of re-tokenizing every title.
+    """
+
+    def __init__(self, jobs: List[Dict[str, Any]]):
+        self.jobs = jobs
+        self._postings: Dict[str, int] = {}
+        self._titled = 0
+
+        for position, job in enumerate(jobs):
+            title = job.get("title", "")
+            if not title or title == "N/A":
+                continue
+            bit = 1 << position
+            self._titled |= bit
+            for token in tokenize_title(title):
+                self._postings[token] = self._postings.get(token, 0) | bit
+
+    def match(self, query: RoleQuery) -> List[Dict[str, Any]]:
+        """Return the indexed jobs whose titles match ``query``, in original order."""
+        matched = self._titled
+        for group in query.token_groups:
+            group_bits = 0
+            for token in group:
+                group_bits |= self._postings.get(token, 0)
+            matched &= group_bits
+            if not matched:
+                return []
+
+        jobs = []
+        while matched:
+            lowest = matched & -matched
+            jobs.append(self.jobs[lowest.bit_length() - 1])
+            matched ^= lowest
+        return jobs
+
+
+def filter_jobs(
+    jobs: List[Dict[str, Any]], role: str, index: Optional[TitleIndex] = None
+) -> List[Dict[str, Any]]:
+    """
+    Filter jobs based on title relevance to the search role.
+
+    All significant words from the role must match (with synonyms allowed).
+
+    Args:
+        jobs: List of job dictionaries
+        role: Search role string
+        index: Optional prebuilt TitleIndex over ``jobs``, reused across roles
+
+    Returns:
+        Filtered list of jobs matching the role
+    """
+    if not jobs:
+        return []
 
-        # Check if ALL significant role tokens match
-        all_match = True
-        for role_token in significant_tokens:
-            possible_matches = _get_matching_tokens(role_token)
-            if not possible_matches.intersection(title_tokens):
-                all_match = False
-                break
+    start = time.perf_counter()
+    if index is None:
+        index = TitleIndex(jobs)
+    matched = index.match(compile_role(role))
+    _record_filter("role", start, len(jobs), len(matched))
+    return matched
 
-        if all_match:
-            filtered_jobs.append(job)
 
-    return filtered_jobs
+def _record_filter(name: str, start: float, total: int, kept: int) -> None:
+    """Record the duration and outcome of one filter call, and a span when tracing."""
+    duration = time.perf_counter() - start
+    FILTER_DURATION.observe(duration, name)
+    trace = current_trace()
+    if trace is not None:
+        trace.add(f"filter_{name}", start, duration)
+    FILTER_JOBS.inc(name, "kept", amount=kept)
+    FILTER_JOBS.inc(name, "dropped", amount=total - kept)
 
 
 def _matches_work_type(text: str, work_type: str) -> bool:
@@ -147,6 +227,7 @@ def filter_by_work_type(jobs: List[Dict[str, Any]], work_type: str) -> List[Dict
     if not jobs or work_type == "all":
         return jobs
 
+    start = time.perf_counter()
     filtered = []
 
     for job in jobs:
@@ -170,4 +251,5 @@ def filter_by_work_type(jobs: List[Dict[str, Any]], work_type: str) -> List[Dict
             if not is_remote_job and not is_hybrid_job:
                 filtered.append(job)
 
+    _record_filter("work_type", start, len(jobs), len(filtered))
     return filtered
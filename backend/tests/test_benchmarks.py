@@ -0,0 +1,80 @@
+"""Tests for the offline benchmark suite."""
+
+import os
+import sys
+import unittest
+
+# Add backend to path (so we can import src as a package), and src for the
+# scrapers' config import
+backend_dir = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, os.path.join(backend_dir, "src"))
+sys.path.insert(0, backend_dir)
+
+from benchmarks.run import RecordedPages, compare, make_jobspy_frame, run_benchmarks
+from src.scrapers.seek import _parse_page
+
+
+def make_results(median_s, peak_kib=100.0):
+    """Build a results document with one stage at one size."""
+    return {
+        "meta": {"created": "2024-06-01T00:00:00+00:00"},
+        "results": {"filter_role": {"100": {"median_s": median_s, "peak_kib": peak_kib}}},
+    }
+
+
+class TestInputs(unittest.TestCase):
+    """Tests for the generated benchmark inputs."""
+
+    def test_page_has_requested_cards(self):
+        """Test every parser engine finds one job per requested card, each with its own id."""
+        pages = RecordedPages()
+        for engine, embedded in (("json", True), ("fast", False), ("legacy", False)):
+            with self.subTest(engine=engine):
+                jobs, cards = _parse_page(pages.page(50, embedded=embedded), 1, 2, engine=engine)
+                self.assertEqual(cards, 50)
+                self.assertEqual(len({job["id"] for job in jobs}), 50)
+
+    def test_jobspy_frame_is_repeatable(self):
+        """Test frames are generated from a fixed seed."""
+        frame = make_jobspy_frame(20)
+        self.assertEqual(len(frame), 20)
+        self.assertTrue(frame.equals(make_jobspy_frame(20)))
+        self.assertTrue(frame["min_amount"].isna().any())
+
+
+class TestRunAndCompare(unittest.TestCase):
+    """Tests for running stages and comparing results."""
+
+    def test_run_selected_stages(self):
+        """Test only the selected stages run, at every size."""
+        results = run_benchmarks(
+            sizes=[5, 10], stages=["filter_role"], repeat=1, report=lambda line: None
+        )
+        self.assertEqual(list(results["results"]), ["filter_role"])
+        self.assertEqual(set(results["results"]["filter_role"]), {"5", "10"})
+        self.assertGreater(results["results"]["filter_role"]["10"]["jobs_per_s"], 0)
+
+    def test_unknown_stage(self):
+        """Test an unknown stage name is rejected."""
+        with self.assertRaises(ValueError):
+            run_benchmarks(sizes=[5], stages=["nope"], repeat=1, report=lambda line: None)
+
+    def test_compare_verdicts(self):
+        """Test changes beyond the tolerance are reported as slower or faster."""
+        baseline = make_results(0.010)
+        self.assertEqual(compare(baseline, make_results(0.011))[0]["verdict"], "same")
+        self.assertEqual(compare(baseline, make_results(0.013))[0]["verdict"], "slower")
+        self.assertEqual(compare(baseline, make_results(0.005))[0]["verdict"], "faster")
+        self.assertEqual(compare(baseline, make_results(0.010, 200.0))[0]["memory_ratio"], 2.0)
+
+    def test_compare_skips_missing(self):
+        """Test stages missing from the baseline are skipped."""
+        current = make_results(0.010)
+        current["results"]["job_model"] = {"100": {"median_s": 0.01, "peak_kib": 1.0}}
+        self.assertEqual(
+            [row["stage"] for row in compare(make_results(0.01), current)], ["filter_role"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
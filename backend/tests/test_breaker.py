@@ -0,0 +1,119 @@
+"""Tests for per-source circuit breakers."""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add backend to path (so we can import src as a package), and src for the
+# scrapers' config import
+backend_dir = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, os.path.join(backend_dir, "src"))
+sys.path.insert(0, backend_dir)
+
+from src.scrapers.breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    breaker_stats,
+    get_breaker,
+    reset_breakers,
+)
+
+MONOTONIC = "src.scrapers.breaker.time.monotonic"
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Tests for CircuitBreaker state transitions."""
+
+    def setUp(self):
+        self.breaker = CircuitBreaker("glassdoor", failure_threshold=3, reset_timeout=60)
+
+    def trip(self, now=1000.0):
+        with patch(MONOTONIC, return_value=now):
+            for _ in range(3):
+                self.breaker.record_failure()
+
+    def test_opens_after_consecutive_failures(self):
+        """Test the circuit stays closed below the threshold and opens at it."""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertTrue(self.breaker.allow())
+
+        self.trip()
+        self.assertEqual(self.breaker.state, OPEN)
+        with patch(MONOTONIC, return_value=1030.0):
+            self.assertFalse(self.breaker.allow())
+            self.assertTrue(self.breaker.is_open())
+
+    def test_success_resets_failure_count(self):
+        """Test failures must be consecutive to open the circuit."""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CLOSED)
+
+    def test_half_open_allows_single_probe(self):
+        """Test one probe is let through after the cool-down."""
+        self.trip()
+        with patch(MONOTONIC, return_value=1061.0):
+            self.assertFalse(self.breaker.is_open())
+            self.assertTrue(self.breaker.allow())
+            self.assertEqual(self.breaker.state, HALF_OPEN)
+            self.assertFalse(self.breaker.allow())
+            self.assertTrue(self.breaker.is_open())
+
+    def test_successful_probe_closes(self):
+        """Test a successful probe closes the circuit."""
+        self.trip()
+        with patch(MONOTONIC, return_value=1061.0):
+            self.breaker.allow()
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertTrue(self.breaker.allow())
+
+    def test_failed_probe_reopens(self):
+        """Test a failed probe opens the circuit for another cool-down."""
+        self.trip()
+        with patch(MONOTONIC, return_value=1061.0):
+            self.breaker.allow()
+            self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, OPEN)
+        with patch(MONOTONIC, return_value=1100.0):
+            self.assertFalse(self.breaker.allow())
+            self.assertEqual(self.breaker.stats()["retry_in"], 21.0)
+
+    def test_lost_probe_is_replaced(self):
+        """Test a probe that never reports does not keep the circuit half-open forever."""
+        self.trip()
+        with patch(MONOTONIC, return_value=1061.0):
+            self.breaker.allow()
+        with patch(MONOTONIC, return_value=1122.0):
+            self.assertTrue(self.breaker.allow())
+
+
+class TestBreakerRegistry(unittest.TestCase):
+    """Tests for the shared per-source breakers."""
+
+    def setUp(self):
+        reset_breakers()
+        self.addCleanup(reset_breakers)
+
+    def test_get_breaker_is_shared(self):
+        """Test the same breaker is returned for a source."""
+        self.assertIs(get_breaker("seek"), get_breaker("seek"))
+        self.assertIsNot(get_breaker("seek"), get_breaker("indeed"))
+
+    def test_stats(self):
+        """Test stats cover every source seen."""
+        get_breaker("seek").record_failure()
+        self.assertEqual(
+            breaker_stats(), {"seek": {"state": CLOSED, "failures": 1, "retry_in": 0.0}}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
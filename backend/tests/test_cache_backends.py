@@ -0,0 +1,127 @@
+"""Tests for the search cache storage backends."""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from cache_backends import MemoryBackend, SQLiteBackend, create_backend
+
+
+def entry(data, timestamp=1.0):
+    """Build a cache entry."""
+    return {"timestamp": timestamp, "data": data}
+
+
+class BackendContract:
+    """Behaviour every backend must share; mixed into a TestCase per backend."""
+
+    def make_backend(self, maxsize):
+        raise NotImplementedError
+
+    def test_set_get_delete(self):
+        """Test entries round-trip and can be removed."""
+        backend = self.make_backend(10)
+        backend.set("a", entry([{"id": "1"}], timestamp=5.0))
+
+        self.assertEqual(backend.get("a"), entry([{"id": "1"}], timestamp=5.0))
+        self.assertIsNone(backend.get("missing"))
+
+        backend.delete("a")
+        self.assertIsNone(backend.get("a"))
+
+    def test_evicts_least_recently_used(self):
+        """Test the entry not read for longest is evicted when full."""
+        backend = self.make_backend(2)
+        backend.set("a", entry(1))
+        backend.set("b", entry(2))
+        backend.get("a")
+        backend.set("c", entry(3))
+
+        self.assertEqual(len(backend), 2)
+        self.assertIsNone(backend.get("b"))
+        self.assertIsNotNone(backend.get("a"))
+        self.assertEqual(backend.evictions, 1)
+
+    def test_clear_returns_count(self):
+        """Test clear removes every entry and reports how many."""
+        backend = self.make_backend(10)
+        backend.set("a", entry(1))
+        backend.set("b", entry(2))
+
+        self.assertEqual(backend.clear(), 2)
+        self.assertEqual(len(backend), 0)
+
+
+class TestMemoryBackend(BackendContract, unittest.TestCase):
+    """Tests for MemoryBackend."""
+
+    def make_backend(self, maxsize):
+        return MemoryBackend(maxsize)
+
+
+class TestSQLiteBackend(BackendContract, unittest.TestCase):
+    """Tests for SQLiteBackend."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "cache.db")
+        self.backends = []
+
+    def tearDown(self):
+        for backend in self.backends:
+            backend.close()
+        self.tmpdir.cleanup()
+
+    def make_backend(self, maxsize, namespace="search"):
+        backend = SQLiteBackend(maxsize, namespace, path=self.path)
+        self.backends.append(backend)
+        return backend
+
+    def test_entries_shared_between_instances(self):
+        """Test a second connection (another worker) sees entries the first wrote."""
+        writer = self.make_backend(10)
+        reader = self.make_backend(10)
+        writer.set("a", entry([{"id": "1", "date_posted": date(2024, 1, 15)}]))
+
+        self.assertEqual(reader.get("a")["data"], [{"id": "1", "date_posted": "2024-01-15"}])
+
+    def test_reads_do_not_write(self):
+        """Test a read leaves the file untouched until the next write records its recency."""
+        backend = self.make_backend(10)
+        backend.set("a", entry(1))
+        changes = backend._connect().total_changes
+
+        backend.get("a")
+        backend.get("a")
+        self.assertEqual(backend._connect().total_changes, changes)
+
+    def test_namespaces_are_isolated(self):
+        """Test caches sharing a file do not see or clear each other's entries."""
+        search = self.make_backend(10, "search")
+        raw = self.make_backend(10, "raw")
+        search.set("a", entry(1))
+        raw.set("a", entry(2))
+
+        self.assertEqual(search.clear(), 1)
+        self.assertEqual(raw.get("a")["data"], 2)
+
+
+class TestCreateBackend(unittest.TestCase):
+    """Tests for create_backend."""
+
+    def test_memory(self):
+        """Test the memory backend is built by name."""
+        self.assertIsInstance(create_backend(10, "search", kind="Memory"), MemoryBackend)
+
+    def test_unknown_kind(self):
+        """Test an unknown backend name raises ValueError."""
+        with self.assertRaises(ValueError):
+            create_backend(10, "search", kind="memcached")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+"""Tests for cross-source near-duplicate detection."""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from dedup import Deduplicator, dedupe_jobs, minhash_signature
+
+DESCRIPTION = (
+    "We are looking for a senior backend engineer to build scalable APIs in Python "
+    "and Go across our payments platform with a strong focus on reliability"
+)
+
+
+def make_job(site, job_url, **overrides):
+    """Build a job dictionary for dedup tests."""
+    job = {
+        "id": job_url,
+        "site": site,
+        "title": "Senior Backend Engineer",
+        "company": "Acme Payments",
+        "location": "Sydney NSW",
+        "description": DESCRIPTION,
+        "job_url": job_url,
+    }
+    job.update(overrides)
+    return job
+
+
+class TestMinHash(unittest.TestCase):
+    """Tests for MinHash signatures."""
+
+    def test_signature_is_deterministic(self):
+        """Test the same job always produces the same signature."""
+        job = make_job("Seek", "s1")
+        self.assertTrue((minhash_signature(job) == minhash_signature(dict(job))).all())
+
+    def test_signature_handles_empty_job(self):
+        """Test a job without text still gets a signature."""
+        self.assertEqual(len(minhash_signature({})), len(minhash_signature(make_job("a", "b"))))
+
+
+class TestDedupeJobs(unittest.TestCase):
+    """Tests for dedupe_jobs and Deduplicator."""
+
+    def test_merges_same_posting_across_sources(self):
+        """Test near-identical postings on different sites collapse into one."""
+        jobs = [
+            make_job("Seek", "https://seek/1"),
+            make_job(
+                "linkedin",
+                "https://linkedin/1",
+                location="Sydney, NSW",
+                description=DESCRIPTION + " Apply now.",
+            ),
+            make_job("indeed", "https://indeed/2", title="Frontend Developer", company="Other"),
+        ]
+
+        unique = dedupe_jobs(jobs)
+
+        self.assertEqual([job["job_url"] for job in unique], ["https://seek/1", "https://indeed/2"])
+        self.assertEqual(unique[0]["source_urls"], ["https://seek/1", "https://linkedin/1"])
+        self.assertEqual(unique[1]["source_urls"], ["https://indeed/2"])
+        self.assertNotIn("source_urls", jobs[0])
+
+    def test_merges_realistic_cross_source_pairs(self):
+        """Test the same posting is merged despite each board's own formatting."""
+        seek = {
+            "site": "Seek",
+            "job_url": "https://seek/9",
+            "title": "Senior Software Engineer",
+            "company": "Atlassian",
+            "location": "Sydney NSW",
+            "description": "Build the tools that teams use to plan and track work...",
+        }
+        linkedin = {
+            "site": "linkedin",
+            "job_url": "https://linkedin/9",
+            "title": "Sr. Software Engineer - Sydney",
+            "company": "Atlassian Pty Ltd",
+            "location": "Sydney, New South Wales, Australia",
+            "description": (
+                "At Atlassian, we're motivated by a common goal: to unleash the potential of "
+                "every team. Our software products help teams all over the planet. " * 5
+            ),
+        }
+        indeed = {
+            "site": "indeed",
+            "job_url": "https://indeed/9",
+            "title": "Senior Software Engineer (Hybrid)",
+            "company": "ATLASSIAN",
+            "location": "Sydney NSW 2000",
+            "description": "",
+        }
+
+        unique = dedupe_jobs([seek, linkedin, indeed])
+
+        self.assertEqual(len(unique), 1)
+        self.assertEqual(
+            unique[0]["source_urls"], ["https://seek/9", "https://linkedin/9", "https://indeed/9"]
+        )
+
+    def test_keeps_different_roles_at_one_company(self):
+        """Test roles sharing a company and boilerplate description are not merged."""
+        boilerplate = "Acme Payments is a fast-growing fintech on a mission to " * 10
+        jobs = [
+            make_job("Seek", "https://seek/1", title="Backend Engineer", description=boilerplate),
+            make_job(
+                "linkedin", "https://linkedin/1", title="Frontend Engineer", description=boilerplate
+            ),
+            make_job(
+                "indeed",
+                "https://indeed/1",
+                title="Senior Backend Engineer",
+                description=boilerplate,
+            ),
+        ]
+
+        self.assertEqual(len(dedupe_jobs(jobs)), 3)
+
+    def test_keeps_same_role_in_other_cities_and_companies(self):
+        """Test the same title is kept apart for other locations and companies."""
+        jobs = [
+            make_job("Seek", "https://seek/1"),
+            make_job("linkedin", "https://linkedin/1", location="Melbourne VIC"),
+            make_job("indeed", "https://indeed/1", company="Globex"),
+        ]
+
+        self.assertEqual(len(dedupe_jobs(jobs)), 3)
+
+    def test_does_not_merge_within_one_source(self):
+        """Test identical postings from the same site are kept (e.g. several openings)."""
+        jobs = [make_job("indeed", "https://indeed/1"), make_job("indeed", "https://indeed/2")]
+        self.assertEqual(len(dedupe_jobs(jobs)), 2)
+
+    def test_incremental_batches_and_ratio(self):
+        """Test later batches are checked against jobs from earlier batches."""
+        deduplicator = Deduplicator()
+
+        first = deduplicator.add([make_job("Seek", "https://seek/1")])
+        second = deduplicator.add(
+            [make_job("linkedin", "https://linkedin/1"), make_job("linkedin", "x", title="Chef")]
+        )
+
+        self.assertEqual(len(first), 1)
+        self.assertEqual([job["job_url"] for job in second], ["x"])
+        self.assertEqual(first[0]["source_urls"], ["https://seek/1", "https://linkedin/1"])
+        self.assertAlmostEqual(deduplicator.duplicate_ratio, 1 / 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,268 @@
+"""Tests for the JobSpy wrapper."""
+
+import logging
+import os
+import sys
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+# Add backend to path (so we can import src as a package), and src for the
+# scrapers' config import
+backend_dir = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, os.path.join(backend_dir, "src"))
+sys.path.insert(0, backend_dir)
+
+from src.scrapers.jobspy_wrapper import (
+    JobSpyError,
+    _format_job,
+    _format_jobs,
+    detach,
+    detached_workers,
+    scrape_others,
+    scrape_site,
+)
+from src.scrapers.proxies import ProxyPool
+from src.scrapers.ratelimit import HostLimiter, RateLimitTimeout
+
+
+def make_frame(site, count):
+    """Build a JobSpy-like DataFrame for one site."""
+    return pd.DataFrame(
+        [
+            {
+                "id": f"{site}-{i}",
+                "site": site,
+                "title": "Software Engineer",
+                "company": "Tech Corp",
+                "job_url": f"https://example.com/{site}/{i}",
+            }
+            for i in range(count)
+        ]
+    )
+
+
+def fake_scrape_jobs(**params):
+    """Return a frame per site; glassdoor is blocked, so like JobSpy it logs and returns nothing."""
+    site = params["site_name"][0]
+    if site == "glassdoor":
+        logging.getLogger("JobSpy:Glassdoor").error("Glassdoor response status code 429")
+        return pd.DataFrame()
+    return make_frame(site, 2)
+
+
+class TestFormatJobs(unittest.TestCase):
+    """Tests for columnar DataFrame normalization."""
+
+    def setUp(self):
+        self.frame = pd.DataFrame(
+            {
+                "id": ["li-1", "in-2", None],
+                "site": ["linkedin", "indeed", "glassdoor"],
+                "title": ["Engineer", np.nan, "Developer"],
+                "date_posted": [date(2024, 1, 15), None, np.nan],
+                "company_url": ["https://li/c1", np.nan, "https://gd/c3"],
+                "company_url_direct": ["", np.nan, "https://c3.example"],
+                "is_remote": [True, False, np.nan],
+                "min_amount": [100000.0, np.nan, 90000.0],
+            }
+        )
+
+    def test_matches_row_formatter(self):
+        """Test the columnar path produces the same records as _format_job."""
+        expected = [_format_job(row) for _, row in self.frame.iterrows()]
+        self.assertEqual(_format_jobs(self.frame), expected)
+
+    def test_defaults_and_company_url_coalesce(self):
+        """Test NaN defaults and the direct company URL preference."""
+        first, second, third = _format_jobs(self.frame)
+
+        self.assertEqual(first["company_url"], "https://li/c1")
+        self.assertEqual(second["company_url"], "N/A")
+        self.assertEqual(third["company_url"], "https://c3.example")
+        self.assertEqual(second["title"], "N/A")
+        self.assertEqual(third["id"], "N/A")
+        self.assertEqual(second["description"], "")
+        self.assertEqual(first["date_posted"], date(2024, 1, 15))
+        self.assertIs(third["is_remote"], False)
+        self.assertIs(first["is_remote"], True)
+        self.assertNotIn("min_amount", first)
+
+
+class TestScrapeOthers(unittest.TestCase):
+    """Tests for per-site fan-out in scrape_others."""
+
+    def setUp(self):
+        # Keep the real per-board rate limits from slowing the tests down
+        patcher = patch(
+            "src.scrapers.jobspy_wrapper.get_limiter",
+            side_effect=lambda site: HostLimiter(site, rate=1000, burst=100, max_concurrency=10),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch("src.scrapers.jobspy_wrapper.scrape_jobs", side_effect=fake_scrape_jobs)
+    def test_scrapes_each_site_separately(self, mock_scrape):
+        """Test each board is requested in its own scrape_jobs call."""
+        scrape_others("Engineer", "Sydney", "AU", limit=5, sites=["indeed", "linkedin"])
+
+        sites = sorted(call.kwargs["site_name"][0] for call in mock_scrape.call_args_list)
+        self.assertEqual(sites, ["indeed", "linkedin"])
+        for call in mock_scrape.call_args_list:
+            self.assertEqual(len(call.kwargs["site_name"]), 1)
+            self.assertEqual(call.kwargs["results_wanted"], 5)
+            self.assertEqual(call.kwargs["country_indeed"], "australia")
+
+    @patch("src.scrapers.jobspy_wrapper.scrape_jobs", side_effect=fake_scrape_jobs)
+    def test_failed_site_does_not_drop_others(self, mock_scrape):
+        """Test results from healthy boards are merged when one board fails."""
+        jobs = scrape_others("Engineer", "Sydney", "AU")
+
+        self.assertEqual(mock_scrape.call_count, 3)
+        self.assertEqual(sorted(job["site"] for job in jobs), ["indeed"] * 2 + ["linkedin"] * 2)
+
+    @patch("src.scrapers.jobspy_wrapper.scrape_jobs", side_effect=fake_scrape_jobs)
+    def test_scrape_site_raises_on_logged_failure(self, mock_scrape):
+        """Test a board that logged errors and returned nothing raises instead of returning []."""
+        with self.assertRaises(JobSpyError) as raised:
+            scrape_site("glassdoor", "Engineer", "Sydney")
+        self.assertIn("429", str(raised.exception))
+
+    @patch("src.scrapers.jobspy_wrapper.scrape_jobs", side_effect=RuntimeError("bad input"))
+    def test_scrape_site_raises_on_exception(self, mock_scrape):
+        """Test exceptions from scrape_jobs are raised as they are."""
+        with self.assertRaises(RuntimeError):
+            scrape_site("indeed", "Engineer", "Sydney")
+
+    @patch("src.scrapers.jobspy_wrapper.scrape_jobs")
+    def test_scrape_site_keeps_partial_results(self, mock_scrape):
+        """Test jobs are returned when a later page failed after earlier ones succeeded."""
+
+        def partial(**params):
+            logging.getLogger("JobSpy:LinkedIn").error("LinkedIn response status code 429")
+            return make_frame("linkedin", 2)
+
+        mock_scrape.side_effect = partial
+        self.assertEqual(len(scrape_site("linkedin", "Engineer", "Sydney")), 2)
+
+    @patch("src.scrapers.jobspy_wrapper.scrape_jobs")
+    def test_errors_are_captured_only_during_scrape(self, mock_scrape):
+        """Test errors logged outside a scrape do not fail it."""
+        logging.getLogger("JobSpy:Indeed").error("Indeed response status code 500")
+        mock_scrape.return_value = pd.DataFrame()
+        self.assertEqual(scrape_site("indeed", "Engineer", "Sydney"), [])
+
+    @patch("src.scrapers.jobspy_wrapper.scrape_jobs", side_effect=fake_scrape_jobs)
+    def test_scrape_site_reports_throttling(self, mock_scrape):
+        """Test a 429 that JobSpy logged halves the board's concurrency limit."""
+        limiter = HostLimiter("glassdoor", rate=1000, burst=100, max_concurrency=4)
+        with patch("src.scrapers.jobspy_wrapper.get_limiter", return_value=limiter):
+            with self.assertRaises(JobSpyError):
+                scrape_site("glassdoor", "Engineer", "Sydney")
+
+        self.assertEqual(limiter.concurrency.limit, 2)
+        self.assertEqual(limiter.concurrency.in_flight, 0)
+
+    @patch("src.scrapers.jobspy_wrapper.scrape_jobs")
+    def test_partial_scrape_reports_throttling(self, mock_scrape):
+        """Test a board throttled after returning some jobs is still slowed down."""
+
+        def partial(**params):
+            logging.getLogger("JobSpy:LinkedIn").error("LinkedIn: unexpected page (blocked?)")
+            return make_frame("linkedin", 2)
+
+        mock_scrape.side_effect = partial
+        limiter = HostLimiter("linkedin", rate=1000, burst=100, max_concurrency=2)
+        with patch("src.scrapers.jobspy_wrapper.get_limiter", return_value=limiter):
+            scrape_site("linkedin", "Engineer", "Sydney")
+
+        self.assertEqual(limiter.concurrency.limit, 1)
+
+    @patch("src.scrapers.jobspy_wrapper.scrape_jobs", return_value=pd.DataFrame())
+    def test_scrape_site_empty_frame(self, mock_scrape):
+        """Test an empty DataFrame yields no jobs."""
+        self.assertEqual(scrape_site("indeed", "Engineer", "Sydney", hours_old=24), [])
+        self.assertEqual(mock_scrape.call_args.kwargs["hours_old"], 24)
+
+    @patch("src.scrapers.jobspy_wrapper.scrape_jobs", side_effect=fake_scrape_jobs)
+    def test_scrape_site_reports_proxy_health(self, mock_scrape):
+        """Test the healthiest proxies are used and credited with the outcome."""
+        pool = ProxyPool(["a:1", "b:2", "c:3"], failure_threshold=1)
+        with patch("src.scrapers.jobspy_wrapper.PROXY_POOL", pool):
+            with self.assertRaises(RuntimeError):
+                scrape_site("glassdoor", "Engineer", "Sydney")
+            failed = mock_scrape.call_args.kwargs["proxies"]
+            scrape_site("indeed", "Engineer", "Sydney")
+
+        self.assertEqual(len(failed), 2)
+        # The failed proxies are quarantined, so the next scrape uses the other one
+        self.assertEqual(
+            mock_scrape.call_args.kwargs["proxies"], sorted({"a:1", "b:2", "c:3"} - set(failed))
+        )
+        stats = {s["proxy"]: s for s in pool.stats()}
+        self.assertTrue(all(stats[proxy]["failures"] == 1 for proxy in failed))
+
+    @patch("src.scrapers.jobspy_wrapper.scrape_jobs")
+    def test_logged_errors_fail_proxies(self, mock_scrape):
+        """Test proxies are reported unhealthy when JobSpy logged errors, even with some jobs."""
+
+        def refused(**params):
+            logging.getLogger("JobSpy:Indeed").error("Indeed: ProxyError('Connection refused')")
+            return make_frame("indeed", 1)
+
+        mock_scrape.side_effect = refused
+        pool = ProxyPool(["a:1"], failure_threshold=1)
+        with patch("src.scrapers.jobspy_wrapper.PROXY_POOL", pool):
+            jobs = scrape_site("indeed", "Engineer", "Sydney")
+
+        self.assertEqual(len(jobs), 1)
+        self.assertEqual(pool.stats()[0]["failures"], 1)
+        self.assertGreater(pool.stats()[0]["quarantined_for"], 0)
+
+    @patch("src.scrapers.jobspy_wrapper.scrape_jobs", side_effect=fake_scrape_jobs)
+    def test_scrape_past_deadline_skips_board(self, mock_scrape):
+        """Test a scrape still rate limited at its deadline never contacts the board."""
+        limiter = HostLimiter("linkedin", rate=1, burst=1, max_concurrency=1)
+        limiter.bucket.drain()
+        pool = ProxyPool(["a:1"], failure_threshold=1)
+        with (
+            patch("src.scrapers.jobspy_wrapper.get_limiter", return_value=limiter),
+            patch("src.scrapers.jobspy_wrapper.PROXY_POOL", pool),
+        ):
+            with self.assertRaises(RateLimitTimeout):
+                scrape_site("linkedin", "Engineer", "Sydney", deadline=time.monotonic() + 0.05)
+
+        mock_scrape.assert_not_called()
+        self.assertEqual(pool.stats()[0]["failures"], 0)
+
+
+class TestDetach(unittest.TestCase):
+    """Tests for tracking board scrapes whose callers stopped waiting."""
+
+    def test_running_scrape_holds_worker_until_done(self):
+        """Test a detached running scrape is counted until it finishes; a queued one is dropped."""
+        release = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(pool.shutdown)
+        running = pool.submit(release.wait)
+        queued = pool.submit(release.wait)
+        before = detached_workers()
+
+        detach(running)
+        detach(queued)
+        self.assertEqual(detached_workers(), before + 1)
+        self.assertTrue(queued.cancelled())
+
+        release.set()
+        running.result(timeout=1)
+        self.assertEqual(detached_workers(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
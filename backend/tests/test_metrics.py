@@ -0,0 +1,95 @@
+"""Tests for the in-process metrics."""
+
+import os
+import sys
+import unittest
+
+# Add backend to path (so we can import src as a package)
+backend_dir = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, backend_dir)
+
+from src.metrics import CallbackGauge, Counter, Gauge, Histogram, MetricsRegistry
+
+
+class TestMetrics(unittest.TestCase):
+    """Tests for metric types and the text format."""
+
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_counter(self):
+        """Test counters add per label combination."""
+        counter = Counter("scrapes_total", "Scrapes", ["source"], registry=self.registry)
+        counter.inc("seek")
+        counter.inc("seek", amount=2)
+        counter.inc("indeed")
+
+        self.assertEqual(counter.value("seek"), 3)
+        self.assertEqual(
+            self.registry.render(),
+            "# HELP scrapes_total Scrapes\n"
+            "# TYPE scrapes_total counter\n"
+            'scrapes_total{source="indeed"} 1\n'
+            'scrapes_total{source="seek"} 3\n',
+        )
+
+    def test_gauge_track(self):
+        """Test a tracked block is counted while it runs."""
+        gauge = Gauge("in_flight", "In flight", registry=self.registry)
+        with gauge.track():
+            self.assertEqual(gauge.value(), 1)
+        self.assertEqual(gauge.value(), 0)
+        gauge.set(value=5)
+        self.assertIn("in_flight 5\n", self.registry.render())
+
+    def test_histogram_buckets(self):
+        """Test observations land in cumulative buckets with a sum and count."""
+        histogram = Histogram(
+            "latency_seconds", "Latency", ["source"], buckets=(0.1, 1), registry=self.registry
+        )
+        for value in (0.05, 0.1, 0.5, 3):
+            histogram.observe(value, "seek")
+
+        lines = self.registry.render().splitlines()
+        self.assertIn('latency_seconds_bucket{source="seek",le="0.1"} 2', lines)
+        self.assertIn('latency_seconds_bucket{source="seek",le="1"} 3', lines)
+        self.assertIn('latency_seconds_bucket{source="seek",le="+Inf"} 4', lines)
+        self.assertIn('latency_seconds_sum{source="seek"} 3.65', lines)
+        self.assertIn('latency_seconds_count{source="seek"} 4', lines)
+        self.assertEqual(histogram.count("seek"), 4)
+
+    def test_histogram_time(self):
+        """Test timing a block records one observation."""
+        histogram = Histogram("block_seconds", "Block", registry=self.registry)
+        with histogram.time():
+            pass
+        self.assertEqual(histogram.count(), 1)
+
+    def test_callback_gauge(self):
+        """Test callback values are read at render time."""
+        sizes = {"search": 1}
+        CallbackGauge(
+            "cache_entries",
+            "Entries",
+            ["cache"],
+            lambda: {(name,): size for name, size in sizes.items()},
+            registry=self.registry,
+        )
+        sizes["search"] = 7
+        self.assertIn('cache_entries{cache="search"} 7', self.registry.render())
+
+    def test_label_escaping(self):
+        """Test quotes and backslashes in label values are escaped."""
+        counter = Counter("errors_total", "Errors", ["error"], registry=self.registry)
+        counter.inc('bad "quote" \\ here')
+        self.assertIn('errors_total{error="bad \\"quote\\" \\\\ here"} 1', self.registry.render())
+
+    def test_duplicate_name_rejected(self):
+        """Test a metric name can only be registered once."""
+        Counter("dup_total", "Dup", registry=self.registry)
+        with self.assertRaises(ValueError):
+            Counter("dup_total", "Dup", registry=self.registry)
+
+
+if __name__ == "__main__":
+    unittest.main()
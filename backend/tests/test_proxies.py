@@ -0,0 +1,115 @@
+"""Tests for the health-scored proxy pool."""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add backend to path (so we can import src as a package), and src for the
+# scrapers' config import
+backend_dir = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, os.path.join(backend_dir, "src"))
+sys.path.insert(0, backend_dir)
+
+from src.scrapers.proxies import ProxyPool, _parse_proxies
+
+
+class TestParseProxies(unittest.TestCase):
+    """Tests for _parse_proxies."""
+
+    def test_splits_and_strips(self):
+        """Test comma-separated proxies are split and blanks dropped."""
+        self.assertEqual(_parse_proxies(" a:1, user:pass@b:2 ,,"), ["a:1", "user:pass@b:2"])
+
+    def test_empty(self):
+        """Test an empty value gives an empty pool."""
+        self.assertEqual(_parse_proxies(""), [])
+        self.assertFalse(ProxyPool([]))
+        self.assertEqual(ProxyPool([]).select(), [])
+
+
+class TestProxyPool(unittest.TestCase):
+    """Tests for ProxyPool."""
+
+    def setUp(self):
+        self.pool = ProxyPool(
+            ["a:1", "b:2", "c:3"], failure_threshold=2, base_cooldown=10, max_cooldown=25
+        )
+
+    def test_select_prefers_healthy_and_fast(self):
+        """Test selection ranks proxies by success rate discounted by latency."""
+        self.pool.report(["a:1"], ok=True, latency=5.0)
+        self.pool.report(["b:2"], ok=True, latency=0.1)
+        self.pool.report(["c:3"], ok=False)
+
+        # One failure costs less than a very slow proxy
+        self.assertEqual(self.pool.select(3), ["b:2", "c:3", "a:1"])
+        self.assertEqual(self.pool.select(1), ["b:2"])
+
+    def test_quarantine_after_consecutive_failures(self):
+        """Test a proxy is rested once it fails failure_threshold times in a row."""
+        with patch("src.scrapers.proxies.time.time", return_value=1000.0):
+            self.pool.report(["a:1"], ok=False)
+            self.assertIn("a:1", self.pool.select(3))
+            self.pool.report(["a:1"], ok=False)
+            self.assertNotIn("a:1", self.pool.select(3))
+
+        # Released once the cool-down has passed
+        with patch("src.scrapers.proxies.time.time", return_value=1010.0):
+            self.assertIn("a:1", self.pool.select(3))
+
+    def test_cooldown_doubles_up_to_max(self):
+        """Test each quarantine doubles the cool-down, capped at max_cooldown."""
+        cooldowns = []
+        for now in (1000.0, 2000.0, 3000.0):
+            with patch("src.scrapers.proxies.time.time", return_value=now):
+                self.pool.report(["a:1"], ok=False)
+                self.pool.report(["a:1"], ok=False)
+                stats = {s["proxy"]: s for s in self.pool.stats()}
+                cooldowns.append(stats["a:1"]["quarantined_for"])
+
+        self.assertEqual(cooldowns, [10, 20, 25])
+
+    def test_success_resets_cooldown(self):
+        """Test a success after a quarantine starts the back-off over."""
+        with patch("src.scrapers.proxies.time.time", return_value=1000.0):
+            self.pool.report(["a:1"], ok=False)
+            self.pool.report(["a:1"], ok=False)
+        with patch("src.scrapers.proxies.time.time", return_value=1100.0):
+            self.pool.report(["a:1"], ok=True, latency=0.2)
+            self.pool.report(["a:1"], ok=False)
+            self.pool.report(["a:1"], ok=False)
+            stats = {s["proxy"]: s for s in self.pool.stats()}
+
+        self.assertEqual(stats["a:1"]["quarantined_for"], 10)
+
+    def test_all_quarantined_returns_soonest(self):
+        """Test scraping continues through the proxy released soonest."""
+        with patch("src.scrapers.proxies.time.time", return_value=1000.0):
+            for proxy in ("a:1", "b:2"):
+                self.pool.report([proxy], ok=False)
+                self.pool.report([proxy], ok=False)
+        with patch("src.scrapers.proxies.time.time", return_value=1001.0):
+            self.pool.report(["c:3"], ok=False)
+            self.pool.report(["c:3"], ok=False)
+            self.assertEqual(len(self.pool.select(3)), 1)
+            self.assertIn(self.pool.select(3)[0], {"a:1", "b:2"})
+
+    def test_unknown_proxy_ignored(self):
+        """Test reports for proxies outside the pool are ignored."""
+        self.pool.report(["z:9"], ok=False)
+        self.assertEqual(len(self.pool), 3)
+
+    def test_stats(self):
+        """Test stats report counts and moving averages."""
+        self.pool.report(["a:1", "b:2"], ok=True, latency=1.0)
+        stats = {s["proxy"]: s for s in self.pool.stats()}
+
+        self.assertEqual(stats["a:1"]["successes"], 1)
+        self.assertEqual(stats["a:1"]["failures"], 0)
+        self.assertAlmostEqual(stats["a:1"]["latency"], 0.3)
+        self.assertEqual(stats["c:3"]["quarantined_for"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
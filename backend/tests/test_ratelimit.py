@@ -0,0 +1,160 @@
+"""Tests for per-host rate limiting."""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import unittest
+
+import httpx
+
+# Add backend to path (so we can import src as a package), and src for the
+# scrapers' config import
+backend_dir = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, os.path.join(backend_dir, "src"))
+sys.path.insert(0, backend_dir)
+
+from src.scrapers.ratelimit import (
+    AdaptiveConcurrency,
+    HostLimiter,
+    RateLimitedTransport,
+    RateLimitTimeout,
+    TokenBucket,
+    get_limiter,
+)
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Tests for TokenBucket."""
+
+    def test_burst_then_rate(self):
+        """Test the burst is free and later requests are spaced at the rate."""
+        bucket = TokenBucket(rate=10, burst=2)
+
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1, places=2)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, places=2)
+
+    def test_drain(self):
+        """Test draining makes the next request wait for a refill."""
+        bucket = TokenBucket(rate=10, burst=5)
+        bucket.drain()
+        self.assertAlmostEqual(bucket.reserve(), 0.1, places=2)
+
+    def test_reserve_declines_past_max_wait(self):
+        """Test a wait beyond max_wait takes no token."""
+        bucket = TokenBucket(rate=10, burst=1)
+        bucket.drain()
+        self.assertIsNone(bucket.reserve(max_wait=0.05))
+        self.assertAlmostEqual(bucket.reserve(max_wait=0.5), 0.1, places=2)
+
+
+class TestAdaptiveConcurrency(unittest.TestCase):
+    """Tests for AIMD concurrency."""
+
+    def test_halves_on_throttle_and_grows_on_success(self):
+        """Test multiplicative decrease and additive increase within bounds."""
+        concurrency = AdaptiveConcurrency(initial=8, maximum=8)
+        concurrency.try_enter()
+        concurrency.leave(throttled=True)
+        self.assertEqual(concurrency.limit, 4)
+
+        for _ in range(4):
+            concurrency.try_enter()
+            concurrency.leave(throttled=False)
+        self.assertAlmostEqual(concurrency.limit, 5, delta=0.2)
+
+        for _ in range(10):
+            concurrency.try_enter()
+            concurrency.leave(throttled=True)
+        self.assertEqual(concurrency.limit, 1)
+
+    def test_enter_blocks_when_full(self):
+        """Test a thread waits for a slot to be released."""
+        concurrency = AdaptiveConcurrency(initial=1, maximum=1)
+        concurrency.enter()
+        self.assertFalse(concurrency.try_enter())
+
+        entered = threading.Event()
+        thread = threading.Thread(target=lambda: (concurrency.enter(), entered.set()))
+        thread.start()
+        self.assertFalse(entered.wait(0.05))
+        concurrency.leave(throttled=False)
+        self.assertTrue(entered.wait(1))
+        thread.join()
+
+    def test_enter_gives_up_after_timeout(self):
+        """Test a bounded wait for a full limiter returns False without a slot."""
+        concurrency = AdaptiveConcurrency(initial=1, maximum=1)
+        concurrency.enter()
+        self.assertFalse(concurrency.enter(timeout=0.02))
+        self.assertEqual(concurrency.in_flight, 1)
+
+
+class TestHostLimiter(unittest.IsolatedAsyncioTestCase):
+    """Tests for HostLimiter and the rate-limited transport."""
+
+    async def test_async_requests_respect_concurrency(self):
+        """Test no more than max_concurrency async requests run at once."""
+        limiter = HostLimiter("example.com", rate=1000, burst=100, max_concurrency=2)
+        active = 0
+        peak = 0
+
+        async def request():
+            nonlocal active, peak
+            async with limiter.limit_async():
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(request() for _ in range(6)))
+        self.assertEqual(peak, 2)
+
+    async def test_rate_spaces_requests(self):
+        """Test requests beyond the burst wait for tokens."""
+        limiter = HostLimiter("example.com", rate=20, burst=1, max_concurrency=5)
+        start = time.monotonic()
+        for _ in range(3):
+            async with limiter.limit_async():
+                pass
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_limit_skips_request_past_deadline(self):
+        """Test a caller's deadline bounds both waits and sends nothing once it passes."""
+        limiter = HostLimiter("example.com", rate=1, burst=1, max_concurrency=1)
+        limiter.bucket.drain()
+
+        start = time.monotonic()
+        with self.assertRaises(RateLimitTimeout):
+            with limiter.limit(deadline=time.monotonic() + 0.05):
+                self.fail("request ran past its deadline")
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(limiter.concurrency.in_flight, 0)
+        self.assertEqual(limiter.concurrency.limit, 1)
+
+        limiter.concurrency.enter()
+        with self.assertRaises(RateLimitTimeout):
+            with limiter.limit(deadline=time.monotonic() + 0.02):
+                self.fail("request ran without a slot")
+        self.assertEqual(limiter.concurrency.in_flight, 1)
+
+    async def test_transport_backs_off_on_429(self):
+        """Test a 429 response through the transport halves the host's concurrency."""
+        host = "throttled.example.com"
+        limiter = get_limiter(host)
+        before = limiter.concurrency.limit
+        transport = RateLimitedTransport(httpx.MockTransport(lambda request: httpx.Response(429)))
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await client.get(f"https://{host}/jobs")
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(limiter.concurrency.limit, max(1, before / 2))
+        self.assertEqual(limiter.concurrency.in_flight, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
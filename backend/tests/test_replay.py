@@ -0,0 +1,234 @@
+"""Tests for scraper record/replay and the stand-in job board."""
+
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+from datetime import date
+from unittest.mock import patch
+
+import httpx
+import numpy as np
+import pandas as pd
+
+# Add backend to path (so we can import src as a package), and src for the
+# scrapers' config import
+backend_dir = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, os.path.join(backend_dir, "src"))
+sys.path.insert(0, backend_dir)
+
+from benchmarks.standin import StandinJobBoard
+from src.scrapers.jobspy_wrapper import scrape_site
+from src.scrapers.replay import (
+    RecordingMissing,
+    RecordingTransport,
+    ReplayTransport,
+    load_frame,
+    request_key,
+    save_frame,
+)
+from src.scrapers.seek import scrape_seek
+
+SEEK_PAGE = """<html><body>
+    <article data-automation="job-card">
+        <a data-automation="jobTitle" href="/job/42">Python Developer</a>
+        <span data-automation="jobCompany">Acme</span>
+        <span data-automation="jobLocation">Sydney</span>
+    </article>
+</body></html>"""
+
+SCRAPE_PARAMS = {"site_name": ["indeed"], "search_term": "Developer", "results_wanted": 5}
+
+
+def make_frame():
+    """Build a small JobSpy-like DataFrame with missing values and dates."""
+    return pd.DataFrame(
+        {
+            "id": ["in-1", "in-2"],
+            "site": ["indeed", "indeed"],
+            "title": ["Developer", "Engineer"],
+            "company": ["Acme", np.nan],
+            "job_url": ["https://indeed.example/1", "https://indeed.example/2"],
+            "date_posted": [date(2024, 5, 1), None],
+            "min_amount": [np.int64(90000), np.nan],
+        }
+    )
+
+
+def seek_board(request):
+    """Mock Seek answering every request with SEEK_PAGE."""
+    return httpx.Response(200, text=SEEK_PAGE, headers={"content-type": "text/html"})
+
+
+async def fetch(transport, url):
+    """GET a URL through an httpx transport."""
+    async with httpx.AsyncClient(transport=transport) as client:
+        return await client.get(url)
+
+
+class TempRecordingsTestCase(unittest.TestCase):
+    """Points recordings at a temporary directory."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.recordings = tmp.name
+        patcher = patch("src.scrapers.replay.SCRAPER_RECORDINGS_DIR", tmp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TestHttpRecordReplay(TempRecordingsTestCase):
+    """Tests for recording and replaying HTTP responses."""
+
+    def test_request_key_ignores_host_and_query_order(self):
+        """Test recordings match on path and query, whatever the host."""
+        self.assertEqual(
+            request_key("GET", "/jobs", "keywords=dev&page=2"),
+            request_key("get", "/jobs", "page=2&keywords=dev"),
+        )
+        self.assertNotEqual(
+            request_key("GET", "/jobs", "page=2"), request_key("GET", "/jobs", "page=3")
+        )
+
+    def test_record_then_replay(self):
+        """Test a recorded response is replayed without the network."""
+        recorder = RecordingTransport(httpx.MockTransport(seek_board))
+        recorded = asyncio.run(fetch(recorder, "https://www.seek.com.au/jobs?keywords=dev"))
+        self.assertEqual(recorded.text, SEEK_PAGE)
+
+        replayed = asyncio.run(fetch(ReplayTransport(), "http://127.0.0.1:9/jobs?keywords=dev"))
+        self.assertEqual(replayed.status_code, 200)
+        self.assertEqual(replayed.text, SEEK_PAGE)
+        self.assertEqual(replayed.headers["content-type"], "text/html")
+
+    def test_replay_missing_is_404(self):
+        """Test an unrecorded request fails like a missing page."""
+        response = asyncio.run(fetch(ReplayTransport(), "https://www.seek.com.au/jobs?x=1"))
+        self.assertEqual(response.status_code, 404)
+
+    def test_scrape_seek_replays(self):
+        """Test a recorded Seek search is replayed through create_http_client."""
+        with (
+            patch("src.scrapers.http_client.SCRAPER_MODE", "record"),
+            patch(
+                "src.scrapers.http_client.httpx.AsyncHTTPTransport",
+                return_value=httpx.MockTransport(seek_board),
+            ),
+        ):
+            recorded = asyncio.run(scrape_seek("Developer", 100000, 150000, limit=5))
+
+        with patch("src.scrapers.http_client.SCRAPER_MODE", "replay"):
+            replayed = asyncio.run(scrape_seek("Developer", 100000, 150000, limit=5))
+
+        self.assertEqual([job["id"] for job in recorded], ["seek_42"])
+        self.assertEqual(replayed, recorded)
+
+
+class TestFrameRecordReplay(TempRecordingsTestCase):
+    """Tests for recording and replaying JobSpy DataFrames."""
+
+    def test_round_trip(self):
+        """Test frames round-trip with NaN as None and dates as ISO strings."""
+        save_frame(SCRAPE_PARAMS, make_frame())
+        frame = load_frame({**SCRAPE_PARAMS, "proxies": ["p:1"]})
+        self.assertEqual(list(frame.columns), list(make_frame().columns))
+        self.assertEqual(frame["date_posted"].iloc[0], "2024-05-01")
+        self.assertTrue(pd.isna(frame["date_posted"].iloc[1]))
+        self.assertEqual(frame["min_amount"].iloc[0], 90000)
+        self.assertTrue(pd.isna(frame["company"].iloc[1]))
+
+    def test_missing(self):
+        """Test replaying unrecorded parameters raises."""
+        with self.assertRaises(RecordingMissing):
+            load_frame({**SCRAPE_PARAMS, "results_wanted": 50})
+
+    @patch("src.scrapers.jobspy_wrapper.scrape_jobs")
+    def test_scrape_site_records_and_replays(self, mock_scrape):
+        """Test scrape_site records in record mode and never scrapes in replay mode."""
+        mock_scrape.return_value = make_frame()
+        with patch("src.scrapers.jobspy_wrapper.SCRAPER_MODE", "record"):
+            recorded = scrape_site("indeed", "Developer", "Sydney")
+
+        mock_scrape.reset_mock()
+        with patch("src.scrapers.jobspy_wrapper.SCRAPER_MODE", "replay"):
+            replayed = scrape_site("indeed", "Developer", "Sydney")
+
+        mock_scrape.assert_not_called()
+        self.assertEqual([job["id"] for job in replayed], ["in-1", "in-2"])
+        self.assertEqual(replayed[0]["date_posted"], "2024-05-01")
+        self.assertEqual(replayed[1]["company"], recorded[1]["company"])
+
+    @patch("src.scrapers.jobspy_wrapper.scrape_jobs")
+    def test_incremental_refresh_replays(self, mock_scrape):
+        """Test incremental scrapes replay whatever hours_old the refresh computes."""
+        mock_scrape.return_value = make_frame()
+        with patch("src.scrapers.jobspy_wrapper.SCRAPER_MODE", "record"):
+            scrape_site("indeed", "Developer", "Sydney")
+            scrape_site("indeed", "Engineer", "Sydney")
+            mock_scrape.return_value = make_frame().iloc[:1]
+            scrape_site("indeed", "Developer", "Sydney", hours_old=2)
+
+        mock_scrape.reset_mock()
+        with patch("src.scrapers.jobspy_wrapper.SCRAPER_MODE", "replay"):
+            full = scrape_site("indeed", "Developer", "Sydney")
+            incremental = scrape_site("indeed", "Developer", "Sydney", hours_old=5)
+            # Without an incremental recording, the full scrape is replayed
+            fallback = scrape_site("indeed", "Engineer", "Sydney", hours_old=3)
+
+        mock_scrape.assert_not_called()
+        self.assertEqual(len(full), 2)
+        self.assertEqual([job["id"] for job in incremental], ["in-1"])
+        self.assertEqual(len(fallback), 2)
+
+    def test_scrape_site_replay_missing_raises(self):
+        """Test an unrecorded board fails in replay mode."""
+        with patch("src.scrapers.jobspy_wrapper.SCRAPER_MODE", "replay"):
+            with self.assertRaises(RecordingMissing):
+                scrape_site("linkedin", "Developer", "Sydney")
+
+
+class TestStandinJobBoard(TempRecordingsTestCase):
+    """Tests for the local stand-in job board."""
+
+    def start_board(self, **kwargs):
+        board = StandinJobBoard(("127.0.0.1", 0), recordings=self.recordings, **kwargs).start()
+        self.addCleanup(board.stop)
+        return board
+
+    def test_serves_recordings(self):
+        """Test recorded responses are served by path and query."""
+        recorder = RecordingTransport(httpx.MockTransport(seek_board))
+        asyncio.run(fetch(recorder, "https://www.seek.com.au/jobs?keywords=dev"))
+        board = self.start_board(fallback=None)
+
+        response = httpx.get(f"{board.url}?keywords=dev")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, SEEK_PAGE)
+        self.assertEqual(httpx.get(f"{board.url}?keywords=other").status_code, 404)
+
+    def test_fallback_page(self):
+        """Test unrecorded requests get the fallback page."""
+        board = self.start_board()
+        response = httpx.get(f"{board.url}?keywords=dev")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("SEEK_REDUX_DATA", response.text)
+
+    def test_injected_errors(self):
+        """Test failures are injected at the configured rate and status."""
+        board = self.start_board(error_rate=1.0, error_status=429)
+        self.assertEqual(httpx.get(board.url).status_code, 429)
+        self.assertEqual(board.requests, 1)
+
+    def test_scrape_seek_against_board(self):
+        """Test Seek can be scraped end to end from the stand-in board."""
+        board = self.start_board(latency=0.01)
+        with patch("src.scrapers.seek.SEEK_BASE_URL", board.url):
+            jobs = asyncio.run(scrape_seek("Developer", 100000, 150000, limit=5))
+        self.assertEqual(len(jobs), 5)
+        self.assertTrue(all(job["site"] == "Seek" for job in jobs))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""Tests for the saved search scheduler."""
+
+import asyncio
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from scheduler import SavedSearchScheduler
+
+
+def saved(saved_id, interval=600, last_run=None):
+    """Build a saved search record."""
+    return {"id": saved_id, "request": {}, "interval": interval, "last_run": last_run}
+
+
+class TestSavedSearchScheduler(unittest.IsolatedAsyncioTestCase):
+    """Tests for SavedSearchScheduler."""
+
+    def make_scheduler(self, searches, max_concurrent=2, jitter=0):
+        self.refreshed = []
+
+        async def refresh(record):
+            self.refreshed.append(record["id"])
+            await asyncio.sleep(0.01)
+
+        return SavedSearchScheduler(
+            load=lambda: searches, refresh=refresh, max_concurrent=max_concurrent, jitter=jitter
+        )
+
+    async def test_new_searches_run_then_wait_for_interval(self):
+        """Test a new saved search runs once and not again before its interval."""
+        scheduler = self.make_scheduler([saved("a")])
+
+        self.assertEqual(await scheduler.run_pending(), 1)
+        await scheduler.wait()
+        self.assertEqual(await scheduler.run_pending(), 0)
+        self.assertEqual(self.refreshed, ["a"])
+
+    async def test_last_run_is_honoured(self):
+        """Test a search refreshed recently (e.g. before a restart) is not run again yet."""
+        scheduler = self.make_scheduler([saved("a", last_run=time.time())])
+        self.assertEqual(await scheduler.run_pending(), 0)
+
+    async def test_start_times_are_jittered(self):
+        """Test jitter spreads first runs into the future."""
+        scheduler = self.make_scheduler([saved(str(i)) for i in range(5)], jitter=60)
+        await scheduler.run_pending()
+        await scheduler.wait()
+        self.assertLess(len(self.refreshed), 5)
+        await scheduler.stop()
+
+    async def test_concurrency_is_capped(self):
+        """Test no more than max_concurrent refreshes run at once."""
+        running = 0
+        peak = 0
+
+        async def refresh(record):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        scheduler = SavedSearchScheduler(
+            load=lambda: [saved(str(i)) for i in range(4)],
+            refresh=refresh,
+            max_concurrent=2,
+            jitter=0,
+        )
+        self.assertEqual(await scheduler.run_pending(), 4)
+        await scheduler.wait()
+        self.assertEqual(peak, 2)
+
+    async def test_failed_refresh_is_rescheduled(self):
+        """Test a failing refresh does not stop the scheduler or rerun immediately."""
+
+        async def refresh(record):
+            raise RuntimeError("blocked")
+
+        scheduler = SavedSearchScheduler(load=lambda: [saved("a")], refresh=refresh, jitter=0)
+        self.assertEqual(await scheduler.run_pending(), 1)
+        await scheduler.wait()
+        self.assertEqual(await scheduler.run_pending(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
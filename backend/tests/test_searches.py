@@ -0,0 +1,101 @@
+"""Tests for the submitted search registry."""
+
+import asyncio
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from models import SearchRequest
+from searches import SearchRegistry
+
+REQUEST = SearchRequest(
+    role="Software Engineer", country="AU", location="Sydney", salary="100k-200k"
+)
+
+
+class TestSearchRegistry(unittest.IsolatedAsyncioTestCase):
+    """Tests for SearchRegistry."""
+
+    async def test_search_runs_and_records_progress(self):
+        """Test a submitted search reports source progress and stores results."""
+        registry = SearchRegistry(max_concurrent=1, max_retained=10)
+
+        async def runner(search):
+            search.source_done("seek", [{"id": "1"}], None)
+            search.source_done("indeed", [], "blocked")
+            return [{"id": "1"}]
+
+        search = registry.submit(REQUEST, ["seek", "indeed", "linkedin"], runner)
+        self.assertEqual(search.status, "queued")
+        await registry.wait(search.id)
+
+        status = registry.get(search.id).to_status()
+        self.assertEqual(status.status, "completed")
+        self.assertEqual(status.total, 1)
+        self.assertEqual(status.sources["seek"].count, 1)
+        self.assertEqual(status.sources["indeed"].status, "failed")
+        # Sources answered without reporting (e.g. from a cache) are completed
+        self.assertEqual(status.sources["linkedin"].status, "completed")
+
+    async def test_concurrency_is_bounded(self):
+        """Test no more than max_concurrent searches run at once."""
+        registry = SearchRegistry(max_concurrent=2, max_retained=10)
+        running = 0
+        peak = 0
+
+        async def runner(search):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return []
+
+        searches = [registry.submit(REQUEST, [], runner) for _ in range(5)]
+        await asyncio.gather(*(registry.wait(search.id) for search in searches))
+
+        self.assertEqual(peak, 2)
+        self.assertTrue(all(search.status == "completed" for search in searches))
+
+    async def test_failure_is_recorded(self):
+        """Test an exception in the runner marks the search failed."""
+        registry = SearchRegistry()
+
+        async def runner(search):
+            raise RuntimeError("boom")
+
+        search = registry.submit(REQUEST, [], runner)
+        await registry.wait(search.id)
+
+        self.assertEqual(search.status, "failed")
+        self.assertEqual(search.error, "boom")
+
+    async def test_oldest_finished_searches_are_evicted(self):
+        """Test finished searches are forgotten first and active ones reject new work."""
+        registry = SearchRegistry(max_concurrent=1, max_retained=2)
+        release = asyncio.Event()
+
+        async def quick(search):
+            return []
+
+        async def blocked(search):
+            await release.wait()
+            return []
+
+        first = registry.submit(REQUEST, [], quick)
+        await registry.wait(first.id)
+        second = registry.submit(REQUEST, [], blocked)
+        third = registry.submit(REQUEST, [], blocked)
+
+        self.assertIsNone(registry.get(first.id))
+        with self.assertRaises(RuntimeError):
+            registry.submit(REQUEST, [], quick)
+
+        release.set()
+        await asyncio.gather(registry.wait(second.id), registry.wait(third.id))
+
+
+if __name__ == "__main__":
+    unittest.main()
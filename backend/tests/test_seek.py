@@ -1,5 +1,6 @@
 """Tests for Seek scraper."""
 
+import asyncio
 import os
 import sys
 import unittest
@@ -10,7 +11,28 @@ backend_dir = os.path.join(os.path.dirname(__file__), "..")
 sys.path.insert(0, backend_dir)
 
 # Import using the actual config module
-from src.scrapers.seek import _extract_job_id, _extract_work_type, scrape_seek
+from src.scrapers import seek as seek_module
+from src.scrapers.proxies import ProxyPool
+from src.scrapers.seek import _extract_job_id, _extract_work_type, _parse_page, scrape_seek
+
+
+def make_page(start, count):
+    """Build a Seek results page with ``count`` job cards numbered from ``start``."""
+    cards = "".join(f"""
+        <article data-automation="job-card">
+            <a data-automation="jobTitle" href="/job/{i}">Developer {i}</a>
+            <span data-automation="jobCompany">Company {i}</span>
+            <span data-automation="jobLocation">Sydney</span>
+        </article>""" for i in range(start, start + count))
+    return f"<html><body>{cards}</body></html>"
+
+
+def make_response(html, status_code=200):
+    """Build a mock httpx response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.text = html
+    return response
 
 
 class TestSeekHelpers(unittest.TestCase):
@@ -130,5 +152,242 @@ class TestSeekScraperIntegration(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(len(jobs), 0)
 
 
+EMBEDDED_PAGE = """
+<html><head><script>
+window.SEEK_REDUX_DATA = {"results": {"results": {"jobs": [
+    {"id": "111", "title": "Platform Engineer", "companyName": "Acme",
+     "advertiser": {"id": "42", "description": "Acme Pty Ltd"},
+     "locations": [{"label": "Sydney NSW"}], "listingDate": "2024-03-01T10:00:00Z",
+     "teaser": "Build <platforms>; {braces} in strings",
+     "workArrangements": {"data": [{"label": {"text": "Remote"}}]}},
+    {"id": "222", "title": "Data Engineer", "advertiser": {"description": "Beta"},
+     "location": "Melbourne VIC"}
+]}}};
+</script></head><body><article><a data-automation="jobTitle" href="/job/999">Other</a>
+</article></body></html>
+"""
+
+
+class TestSeekParserEngines(unittest.TestCase):
+    """Tests for the selectable Seek page parser engines."""
+
+    def test_fast_engine_matches_legacy(self):
+        """Test the fast HTML engine returns the same jobs as the legacy engine."""
+        html = make_page(0, 5).replace(
+            '<span data-automation="jobCompany">Company 3</span>',
+            '<span data-automation="jobCompany"><a href="/companies/c3">Company 3</a></span>'
+            '<span data-automation="jobShortDescription"> Teaser </span>',
+        )
+
+        fast = _parse_page(html, 100000, 200000, engine="fast")
+        legacy = _parse_page(html, 100000, 200000, engine="legacy")
+
+        self.assertEqual(fast, legacy)
+        self.assertEqual(fast[0][3]["company_url"], "https://www.seek.com.au/companies/c3")
+        self.assertEqual(fast[0][3]["description"], "Teaser")
+
+    def test_fast_engine_text_matches_legacy_with_and_without_lxml(self):
+        """Test card text matches the legacy engine's, with or without lxml."""
+        html = make_page(0, 3).replace(
+            '<a data-automation="jobTitle" href="/job/1">Developer 1</a>',
+            '<h3 data-automation="jobTitle"> <a href="/job/1"> Senior <b>Dev</b> &amp; Ops</a>'
+            "<!-- promoted --><script>track()</script></h3>",
+        )
+        legacy = _parse_page(html, 100000, 200000, engine="legacy")
+
+        self.assertEqual(_parse_page(html, 100000, 200000, engine="fast"), legacy)
+        with patch.object(seek_module, "lxml_html", None):
+            self.assertEqual(_parse_page(html, 100000, 200000, engine="fast"), legacy)
+        self.assertEqual(legacy[0][1]["title"], "Senior Dev & Ops")
+        self.assertEqual(legacy[0][1]["job_url"], "https://www.seek.com.au/job/1")
+
+    def test_fast_engine_falls_back_on_empty_page(self):
+        """Test a page lxml cannot parse falls back to the legacy engine."""
+        self.assertEqual(_parse_page("", 100000, 200000, engine="fast"), ([], 0))
+
+    def test_json_engine_reads_embedded_state(self):
+        """Test jobs are taken from embedded JSON rather than the HTML cards."""
+        jobs, card_count = _parse_page(EMBEDDED_PAGE, 100000, 200000, engine="json")
+
+        self.assertEqual(card_count, 2)
+        first, second = jobs
+        self.assertEqual(first["id"], "seek_111")
+        self.assertEqual(first["job_url"], "https://www.seek.com.au/job/111")
+        self.assertEqual(first["company"], "Acme")
+        self.assertEqual(first["company_url"], "https://www.seek.com.au/jobs?advertiserid=42")
+        self.assertEqual(first["location"], "Sydney NSW")
+        self.assertEqual(first["date_posted"], "2024-03-01")
+        self.assertEqual(first["description"], "Build <platforms>; {braces} in strings")
+        self.assertTrue(first["is_remote"])
+        self.assertEqual(first["salary_range"], "100000-200000")
+        self.assertEqual(second["company"], "Beta")
+        self.assertEqual(second["location"], "Melbourne VIC")
+        self.assertEqual(second["date_posted"], "Recent")
+        self.assertEqual(set(first), set(_parse_page(make_page(0, 1), 1, 2)[0][0]))
+
+    def test_auto_falls_back_without_embedded_state(self):
+        """Test auto mode parses HTML cards when no embedded JSON is present."""
+        jobs, card_count = _parse_page(make_page(0, 3), 100000, 200000, engine="auto")
+        self.assertEqual(card_count, 3)
+        self.assertEqual([job["id"] for job in jobs], ["seek_0", "seek_1", "seek_2"])
+
+    def test_auto_falls_back_on_malformed_state(self):
+        """Test malformed embedded JSON falls back to HTML parsing."""
+        html = "<script>window.SEEK_REDUX_DATA = {broken</script>" + make_page(0, 2)
+        jobs, _ = _parse_page(html, 100000, 200000)
+        self.assertEqual(len(jobs), 2)
+
+    def test_legacy_engine_finds_job_cards_without_articles(self):
+        """Test the legacy engine still handles job cards that are not <article> tags."""
+        html = make_page(0, 2).replace("<article", "<div").replace("</article>", "</div>")
+        jobs, card_count = _parse_page(html, 100000, 200000, engine="auto")
+        self.assertEqual(card_count, 2)
+        self.assertEqual(len(jobs), 2)
+
+
+class TestSeekPaging(unittest.IsolatedAsyncioTestCase):
+    """Tests for multi-page Seek scraping."""
+
+    async def test_fetches_pages_until_limit(self):
+        """Test enough pages are fetched to satisfy a large limit."""
+        pages = {1: make_page(0, 22), 2: make_page(22, 22), 3: make_page(44, 22)}
+        client = AsyncMock()
+        client.get.side_effect = lambda url, params, headers: make_response(
+            pages[params.get("page", 1)]
+        )
+
+        jobs = await scrape_seek("Developer", 100000, 200000, limit=50, client=client)
+
+        self.assertEqual(client.get.await_count, 3)
+        self.assertEqual(len(jobs), 50)
+        self.assertEqual(jobs[0]["id"], "seek_0")
+        self.assertEqual(jobs[-1]["id"], "seek_49")
+
+    async def test_stops_at_short_page(self):
+        """Test results after a short page are discarded."""
+        pages = {1: make_page(0, 5), 2: make_page(100, 22), 3: make_page(200, 22)}
+        client = AsyncMock()
+        client.get.side_effect = lambda url, params, headers: make_response(
+            pages[params.get("page", 1)]
+        )
+
+        jobs = await scrape_seek("Developer", 100000, 200000, limit=60, client=client)
+
+        self.assertEqual([job["id"] for job in jobs], [f"seek_{i}" for i in range(5)])
+
+    async def test_failed_page_keeps_earlier_pages(self):
+        """Test a failing later page does not discard pages before it."""
+        client = AsyncMock()
+        client.get.side_effect = lambda url, params, headers: (
+            make_response(make_page(0, 22))
+            if params.get("page", 1) == 1
+            else make_response("", status_code=500)
+        )
+
+        jobs = await scrape_seek("Developer", 100000, 200000, limit=40, client=client)
+
+        self.assertEqual(len(jobs), 22)
+
+    async def test_records_trace_spans(self):
+        """Test page fetches and parses are recorded on the request's trace."""
+        from src.tracing import Trace, _current_trace
+
+        client = AsyncMock()
+        client.get.side_effect = lambda url, params, headers: make_response(
+            make_page(params.get("page", 1) * 100, 22)
+        )
+        trace = Trace()
+        token = _current_trace.set(trace)
+        try:
+            await scrape_seek("Developer", 100000, 200000, limit=30, client=client)
+        finally:
+            _current_trace.reset(token)
+
+        self.assertEqual(trace.stages()["seek_http"]["count"], 2)
+        self.assertEqual(trace.stages()["seek_parse"]["count"], 2)
+
+    async def test_page_fetches_are_bounded(self):
+        """Test no more than SEEK_MAX_CONCURRENT_PAGES requests run at once."""
+        from src.scrapers.seek import SEEK_MAX_CONCURRENT_PAGES
+
+        active = 0
+        peak = 0
+
+        async def get(url, params, headers):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            page = params.get("page", 1)
+            return make_response(make_page(page * 100, 22))
+
+        client = AsyncMock()
+        client.get.side_effect = get
+
+        jobs = await scrape_seek("Developer", 100000, 200000, limit=100, client=client)
+
+        self.assertEqual(len(jobs), 100)
+        self.assertLessEqual(peak, SEEK_MAX_CONCURRENT_PAGES)
+
+    async def test_known_ids_stop_paging(self):
+        """Test an incremental scrape stops at the first known job and returns newer ones."""
+        pages = {1: make_page(0, 22), 2: make_page(22, 22), 3: make_page(44, 22)}
+        client = AsyncMock()
+        client.get.side_effect = lambda url, params, headers: make_response(
+            pages[params.get("page", 1)]
+        )
+
+        jobs = await scrape_seek(
+            "Developer", 100000, 200000, limit=66, client=client, known_ids={"seek_30", "seek_31"}
+        )
+
+        self.assertEqual(client.get.await_count, 2)
+        self.assertEqual([job["id"] for job in jobs], [f"seek_{i}" for i in range(30)])
+        self.assertEqual(client.get.call_args_list[0].kwargs["params"]["sortmode"], "ListedDate")
+
+
+class TestSeekProxies(unittest.IsolatedAsyncioTestCase):
+    """Tests for routing Seek through the proxy pool."""
+
+    async def test_uses_pooled_proxy_and_reports_failure(self):
+        """Test a proxied client is created and a failed first page counts against the proxy."""
+        pool = ProxyPool(["a:1"], failure_threshold=1)
+        client = AsyncMock()
+        client.get.return_value = make_response("", status_code=403)
+        factory = MagicMock()
+        factory.return_value.__aenter__.return_value = client
+
+        with (
+            patch("src.scrapers.seek.SEEK_USE_PROXIES", True),
+            patch("src.scrapers.seek.PROXY_POOL", pool),
+            patch("src.scrapers.seek.create_http_client", factory),
+        ):
+            jobs = await scrape_seek("Developer", 100000, 200000, client=AsyncMock())
+
+        self.assertEqual(jobs, [])
+        factory.assert_called_once_with("a:1")
+        self.assertEqual(pool.stats()[0]["failures"], 1)
+        self.assertGreater(pool.stats()[0]["quarantined_for"], 0)
+
+    async def test_raise_errors(self):
+        """Test failures are raised on request so callers can tell them from empty searches."""
+        client = AsyncMock()
+        client.get.return_value = make_response("", status_code=500)
+
+        with self.assertRaises(RuntimeError):
+            await scrape_seek("Developer", 100000, 200000, client=client, raise_errors=True)
+
+    async def test_shared_client_used_without_proxies(self):
+        """Test the shared client is used when Seek proxies are disabled."""
+        client = AsyncMock()
+        client.get.return_value = make_response(make_page(0, 3))
+
+        with patch("src.scrapers.seek.SEEK_USE_PROXIES", False):
+            jobs = await scrape_seek("Developer", 100000, 200000, client=client)
+
+        self.assertEqual(len(jobs), 3)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,71 @@
+"""Tests for fast serialization and field projection."""
+
+import json
+import os
+import sys
+import unittest
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from serialization import JOB_FIELDS, dumps, loads, parse_fields, project_jobs
+
+JOB = {
+    "id": "li-1",
+    "site": "linkedin",
+    "title": "Software Engineer",
+    "company": "Tech Corp",
+    "location": "Sydney",
+    "date_posted": date(2024, 1, 15),
+    "job_url": "https://example.com/1",
+    "salary_range": "N/A",
+    "company_url": "N/A",
+    "description": "A" * 500,
+    "is_remote": True,
+    "work_from_home_type": "remote",
+}
+
+
+class TestParseFields(unittest.TestCase):
+    """Tests for parse_fields."""
+
+    def test_none_means_all_fields(self):
+        """Test no projection is requested when fields is omitted or empty."""
+        self.assertIsNone(parse_fields(None))
+        self.assertIsNone(parse_fields(" , "))
+
+    def test_parses_comma_separated_fields(self):
+        """Test field names are split and stripped."""
+        self.assertEqual(parse_fields("id, title ,job_url"), ["id", "title", "job_url"])
+
+    def test_rejects_unknown_fields(self):
+        """Test unknown field names raise ValueError."""
+        with self.assertRaises(ValueError):
+            parse_fields("id,salary")
+
+
+class TestProjectJobs(unittest.TestCase):
+    """Tests for project_jobs and dumps."""
+
+    def test_default_projection_has_every_job_field(self):
+        """Test all Job fields are present, with missing ones as None."""
+        record = project_jobs([JOB])[0]
+        self.assertEqual(tuple(record), JOB_FIELDS)
+        self.assertIsNone(record["source_urls"])
+
+    def test_projection_and_truncation(self):
+        """Test only requested fields are kept and descriptions are capped."""
+        record = project_jobs([JOB], ["id", "description"], description_chars=10)[0]
+        self.assertEqual(record, {"id": "li-1", "description": "A" * 10})
+        self.assertEqual(len(JOB["description"]), 500)
+
+    def test_dumps_matches_model_json(self):
+        """Test dumps emits the same JSON values as the pydantic response path."""
+        payload = loads(dumps(project_jobs([JOB])))
+        self.assertEqual(payload[0]["date_posted"], "2024-01-15")
+        self.assertIs(payload[0]["is_remote"], True)
+        self.assertEqual(payload, json.loads(dumps(project_jobs([JOB]))))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,15 @@
 """Integration tests for the FastAPI server."""
 
+import asyncio
+import json
+import logging
 import os
 import sys
+import tempfile
+import threading
+import time
 import unittest
+from unittest.mock import AsyncMock, Mock, patch
 
 # Get paths and add to sys.path
 tests_dir = os.path.dirname(__file__)
@@ -16,6 +23,9 @@ if "config" in sys.modules and hasattr(sys.modules["config"], "__class__"):
     if sys.modules["config"].__class__.__name__ == "MockConfig":
         del sys.modules["config"]
 
+import httpx
+import pandas as pd
+from fastapi import Response
 from fastapi.testclient import TestClient
 
 # Import the server module - works both ways
@@ -26,7 +36,19 @@ except ImportError:
 
 app = server_module.app
 search_cache = server_module.search_cache
+raw_cache = server_module.raw_cache
 LRUCache = server_module.LRUCache
+SingleFlight = server_module.SingleFlight
+JobStore = server_module.JobStore
+
+try:
+    from src.cache_backends import SQLiteBackend
+    from src.scrapers.breaker import get_breaker, reset_breakers
+    from src.scrapers.ratelimit import HostLimiter
+except ImportError:
+    from cache_backends import SQLiteBackend
+    from scrapers.breaker import get_breaker, reset_breakers
+    from scrapers.ratelimit import HostLimiter
 
 # Import models
 try:
@@ -35,6 +57,37 @@ except ImportError:
     from models import SearchRequest
 
 
+def use_temp_store(test_case):
+    """Point the server at a throwaway job store for the duration of a test."""
+    tmpdir = tempfile.TemporaryDirectory()
+    original_store = server_module.job_store
+    server_module.job_store = JobStore(os.path.join(tmpdir.name, "jobs.db"))
+
+    def restore():
+        server_module.job_store.close()
+        server_module.job_store = original_store
+        tmpdir.cleanup()
+
+    test_case.addCleanup(restore)
+
+
+class ServerTestCase(unittest.TestCase):
+    """Starts each test with empty caches, closed circuits and a throwaway job store."""
+
+    def setUp(self):
+        self.client = TestClient(app)
+        search_cache._cache.clear()
+        raw_cache._cache.clear()
+        server_module._title_indexes.clear()
+        reset_breakers()
+        self.addCleanup(reset_breakers)
+        use_temp_store(self)
+
+
+class AsyncServerTestCase(ServerTestCase, unittest.IsolatedAsyncioTestCase):
+    """ServerTestCase for tests awaiting the server's coroutines."""
+
+
 class TestHealthEndpoint(unittest.TestCase):
     """Tests for the /health endpoint."""
 
@@ -47,14 +100,16 @@ class TestHealthEndpoint(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), {"status": "ok"})
 
+    def test_scraper_stats(self):
+        """Test proxy pool and rate limiter stats are exposed."""
+        response = self.client.get("/api/scraper-stats")
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response.json()["proxies"], list)
+        self.assertIsInstance(response.json()["rate_limits"], dict)
 
-class TestSearchEndpoint(unittest.TestCase):
-    """Tests for the /api/search endpoint."""
 
-    def setUp(self):
-        self.client = TestClient(app)
-        # Clear cache before each test
-        search_cache._cache.clear()
+class TestSearchEndpoint(ServerTestCase):
+    """Tests for the /api/search endpoint."""
 
     def test_search_invalid_salary_format(self):
         """Test search with invalid salary format returns 400."""
@@ -84,12 +139,9 @@ class TestSearchEndpoint(unittest.TestCase):
         self.assertEqual(response.status_code, 422)
 
 
-class TestLRUCache(unittest.TestCase):
+class TestLRUCache(ServerTestCase):
     """Tests for the LRU cache implementation."""
 
-    def setUp(self):
-        search_cache._cache.clear()
-
     def test_cache_respects_maxsize(self):
         """Test cache evicts oldest entries when full."""
         cache = LRUCache(maxsize=3, ttl=3600)
@@ -148,6 +200,1180 @@ class TestLRUCache(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertEqual(result[0]["id"], 1)
 
+    def test_cache_shared_through_sqlite_backend(self):
+        """Test two caches on one SQLite file (two workers) share entries."""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        path = os.path.join(tmpdir.name, "cache.db")
+        first = SQLiteBackend(10, "search", path=path)
+        second = SQLiteBackend(10, "search", path=path)
+        self.addCleanup(first.close)
+        self.addCleanup(second.close)
+        request = SearchRequest(**SEARCH_PAYLOAD)
+
+        LRUCache(maxsize=10, ttl=3600, backend=first).set(request, [{"id": 1}])
+
+        self.assertEqual(LRUCache(maxsize=10, ttl=3600, backend=second).get(request), [{"id": 1}])
+
+    def test_shared_backend_io_runs_off_event_loop(self):
+        """Test async lookups on a SQLite backend read it in an executor thread."""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        backend = SQLiteBackend(10, "search", path=os.path.join(tmpdir.name, "cache.db"))
+        self.addCleanup(backend.close)
+        cache = LRUCache(maxsize=10, ttl=3600, backend=backend)
+        request = SearchRequest(**SEARCH_PAYLOAD)
+        readers = []
+        read = backend.get
+        backend.get = lambda key: readers.append(threading.get_ident()) or read(key)
+
+        async def set_and_lookup():
+            await cache.set_async(request, [{"id": 1}])
+            return await cache.lookup_async(request), threading.get_ident()
+
+        hit, loop_thread = asyncio.run(set_and_lookup())
+
+        self.assertEqual(hit[0], [{"id": 1}])
+        self.assertEqual(len(readers), 1)
+        self.assertNotIn(loop_thread, readers)
+
+
+SEARCH_PAYLOAD = {
+    "role": "Software Engineer",
+    "country": "AU",
+    "location": "Sydney",
+    "salary": "100k-200k",
+    "work_type": "all",
+    "limit": 10,
+}
+
+SEEK_JOB = {
+    "id": "seek_1",
+    "site": "Seek",
+    "title": "Software Engineer",
+    "company": "Tech Corp",
+    "location": "Sydney",
+    "date_posted": "Recent",
+    "job_url": "https://www.seek.com.au/job/1",
+    "salary_range": "100000-200000",
+    "company_url": "N/A",
+    "description": "",
+    "is_remote": False,
+    "work_from_home_type": "",
+}
+
+
+class TestJobStoreIntegration(ServerTestCase):
+    """Tests for serving searches from the persistent job store."""
+
+    @patch.object(server_module, "scrape_site", return_value=[])
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_search_served_from_store_after_cache_clear(self, mock_seek, mock_site):
+        """Test a repeat search is answered from the store without re-scraping."""
+        mock_seek.return_value = [SEEK_JOB]
+
+        first = self.client.post("/api/search", json=SEARCH_PAYLOAD)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(mock_seek.await_count, 1)
+
+        # Simulate a restart: the in-process cache is gone but the store is not
+        search_cache._cache.clear()
+        raw_cache._cache.clear()
+        reset_breakers()
+        second = self.client.post("/api/search", json=SEARCH_PAYLOAD)
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(mock_seek.await_count, 1)
+        self.assertEqual([job["id"] for job in second.json()], ["seek_1"])
+
+    @patch.object(server_module, "scrape_site", return_value=[])
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_store_hit_keeps_stored_scrape_time(self, mock_seek, mock_site):
+        """Test results served from the store are cached as old as their scrape."""
+        mock_seek.return_value = [SEEK_JOB]
+        self.client.post("/api/search", json=SEARCH_PAYLOAD)
+
+        scraped_at = time.time() - server_module.SEARCH_CACHE_TTL - 1
+        conn = server_module.job_store._connect()
+        with conn:
+            conn.execute("UPDATE searches SET scraped_at = ?", (scraped_at,))
+        search_cache._cache.clear()
+        raw_cache._cache.clear()
+        self.client.post("/api/search", json=SEARCH_PAYLOAD)
+
+        request = SearchRequest(**SEARCH_PAYLOAD)
+        self.assertEqual(search_cache.timestamp(request), scraped_at)
+        self.assertTrue(search_cache.lookup(request)[1])
+        self.assertEqual(mock_seek.await_count, 1)
+
+    @patch.object(server_module, "scrape_site", return_value=[])
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_clear_cache_forgets_stored_searches(self, mock_seek, mock_site):
+        """Test clearing the cache forces the next search to scrape again."""
+        mock_seek.return_value = [SEEK_JOB]
+
+        self.client.post("/api/search", json=SEARCH_PAYLOAD)
+        self.client.post("/api/clear-cache")
+        self.client.post("/api/search", json=SEARCH_PAYLOAD)
+
+        self.assertEqual(mock_seek.await_count, 2)
+
+
+class TestTwoTierCache(ServerTestCase):
+    """Tests for serving filter and limit changes from the raw scrape cache."""
+
+    def test_raw_key_ignores_post_scrape_filters(self):
+        """Test work type and limit do not change the raw cache key."""
+        base = SearchRequest(**SEARCH_PAYLOAD)
+        remote = SearchRequest(**dict(SEARCH_PAYLOAD, work_type="remote", limit=5))
+        other_salary = SearchRequest(**dict(SEARCH_PAYLOAD, salary="150k-200k"))
+
+        self.assertEqual(raw_cache._make_key(base), raw_cache._make_key(remote))
+        self.assertNotEqual(raw_cache._make_key(base), raw_cache._make_key(other_salary))
+        self.assertNotEqual(search_cache._make_key(base), search_cache._make_key(remote))
+
+    @patch.object(server_module, "scrape_site", return_value=[])
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_work_type_change_does_not_rescrape(self, mock_seek, mock_site):
+        """Test switching work type re-filters the cached scrape."""
+        mock_seek.return_value = [
+            SEEK_JOB,
+            dict(SEEK_JOB, id="seek_2", job_url="https://x/2", work_from_home_type="remote"),
+        ]
+
+        all_jobs = self.client.post("/api/search", json=SEARCH_PAYLOAD).json()
+        remote = self.client.post(
+            "/api/search", json=dict(SEARCH_PAYLOAD, work_type="remote")
+        ).json()
+
+        self.assertEqual(mock_seek.await_count, 1)
+        self.assertEqual(len(all_jobs), 2)
+        self.assertEqual([job["id"] for job in remote], ["seek_2"])
+
+    @patch.object(server_module, "scrape_site", return_value=[])
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_smaller_limit_served_from_larger_scrape(self, mock_seek, mock_site):
+        """Test a smaller limit reuses a larger scrape but a larger one scrapes again."""
+        mock_seek.return_value = [
+            dict(SEEK_JOB, id=f"seek_{i}", job_url=f"https://x/{i}") for i in range(10)
+        ]
+
+        self.client.post("/api/search", json=SEARCH_PAYLOAD)
+        smaller = self.client.post("/api/search", json=dict(SEARCH_PAYLOAD, limit=3)).json()
+        self.assertEqual(mock_seek.await_count, 1)
+        self.assertEqual([job["id"] for job in smaller], ["seek_0", "seek_1", "seek_2"])
+
+        self.client.post("/api/search", json=dict(SEARCH_PAYLOAD, limit=20))
+        self.assertEqual(mock_seek.await_count, 2)
+
+    @patch.object(server_module, "scrape_site", return_value=[])
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_views_of_a_scrape_share_one_title_index(self, mock_seek, mock_site):
+        """Test work-type and limit views of one scrape reuse its title index."""
+        mock_seek.return_value = [
+            dict(SEEK_JOB, id=f"seek_{i}", job_url=f"https://x/{i}") for i in range(10)
+        ]
+
+        with patch.object(
+            server_module, "TitleIndex", wraps=server_module.TitleIndex
+        ) as mock_index:
+            self.client.post("/api/search", json=SEARCH_PAYLOAD)
+            remote = self.client.post(
+                "/api/search", json=dict(SEARCH_PAYLOAD, work_type="remote")
+            ).json()
+            smaller = self.client.post("/api/search", json=dict(SEARCH_PAYLOAD, limit=3)).json()
+
+        self.assertEqual(mock_index.call_count, 1)
+        self.assertEqual(remote, [])
+        self.assertEqual([job["id"] for job in smaller], ["seek_0", "seek_1", "seek_2"])
+
+    def test_derived_entries_expire_with_their_scrape(self):
+        """Test a derived view keeps the timestamp of the scrape it came from."""
+        request = SearchRequest(**SEARCH_PAYLOAD)
+        cache = LRUCache(maxsize=10, ttl=60)
+        cache.set(request, [SEEK_JOB], timestamp=0)
+        self.assertIsNone(cache.get(request))
+
+
+class TestStaleWhileRevalidate(AsyncServerTestCase):
+    """Tests for serving stale results while refreshing in the background."""
+
+    def setUp(self):
+        super().setUp()
+        self.request = SearchRequest(**SEARCH_PAYLOAD)
+        self.key = search_cache._make_key(self.request)
+
+    def cache_stale_scrape(self, jobs):
+        """Cache a scrape of Seek that is past the soft TTL."""
+        scraped_at = time.time() - server_module.SEARCH_CACHE_TTL - 1
+        raw_cache.store_scrape(self.request, {"seek": jobs}, timestamp=scraped_at)
+        return scraped_at
+
+    async def wait_for_refresh(self):
+        await asyncio.gather(*server_module._refresh_tasks)
+
+    def test_lookup_reports_staleness(self):
+        """Test lookup flags entries past the soft TTL and drops them at the hard TTL."""
+        cache = LRUCache(maxsize=10, ttl=60, stale_ttl=120)
+        cache.set(self.request, ["fresh"], timestamp=1000.0)
+        with patch.object(server_module.time, "time", return_value=1030.0):
+            self.assertEqual(cache.lookup(self.request), (["fresh"], False, 1000.0))
+            cache.set(self.request, ["stale"], timestamp=940.0)
+            self.assertEqual(cache.lookup(self.request), (["stale"], True, 940.0))
+
+        cache.set(self.request, ["expired"], timestamp=time.time() - 130)
+        self.assertIsNone(cache.lookup(self.request))
+
+    @patch.object(server_module, "scrape_site", return_value=[])
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    async def test_stale_result_served_while_refreshing(self, mock_seek, mock_site):
+        """Test a stale scrape is returned immediately and replaced in the background."""
+        self.cache_stale_scrape([SEEK_JOB])
+        mock_seek.return_value = [dict(SEEK_JOB, id="seek_2", job_url="https://x/2")]
+
+        jobs = await server_module._run_search(
+            self.request, self.key, 100000, 200000, search_cache.lookup(self.request)
+        )
+        self.assertEqual([job["id"] for job in jobs], ["seek_1"])
+
+        await self.wait_for_refresh()
+        self.assertEqual(mock_seek.await_count, 1)
+        entry, stale, _ = raw_cache.lookup(self.request)
+        self.assertFalse(stale)
+
+        jobs = await server_module._run_search(
+            self.request, self.key, 100000, 200000, search_cache.lookup(self.request)
+        )
+        self.assertEqual([job["id"] for job in jobs], ["seek_2"])
+
+    @patch.object(server_module, "scrape_site", return_value=[])
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    async def test_smaller_search_refreshes_at_cached_limit(self, mock_seek, mock_site):
+        """Test a refresh started by a smaller search keeps the larger cached scrape."""
+        self.cache_stale_scrape([SEEK_JOB])
+        mock_seek.return_value = [SEEK_JOB]
+        smaller = SearchRequest(**dict(SEARCH_PAYLOAD, limit=3))
+
+        await server_module._run_search(
+            smaller, search_cache._make_key(smaller), 100000, 200000, search_cache.lookup(smaller)
+        )
+        await self.wait_for_refresh()
+
+        self.assertEqual(mock_seek.call_args.kwargs["limit"], 10)
+        self.assertTrue(all(call.args[4] == 10 for call in mock_site.call_args_list))
+        entry, stale, _ = raw_cache.lookup(self.request)
+        self.assertEqual(entry["limit"], 10)
+        self.assertFalse(stale)
+
+    def test_smaller_scrape_does_not_replace_larger_entry(self):
+        """Test a smaller scrape finishing after a larger one keeps the larger entry."""
+        larger = raw_cache.store_scrape(self.request, {"seek": [SEEK_JOB]})
+        smaller = SearchRequest(**dict(SEARCH_PAYLOAD, limit=3))
+
+        self.assertIs(raw_cache.store_scrape(smaller, {"seek": []}), larger)
+        self.assertEqual(raw_cache.lookup(self.request)[0], larger)
+
+    @patch.object(server_module, "scrape_site", side_effect=RuntimeError("blocked"))
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    async def test_failed_refresh_keeps_stale_copy(self, mock_seek, mock_site):
+        """Test a refresh where every source fails does not overwrite the cache."""
+        scraped_at = self.cache_stale_scrape([SEEK_JOB])
+        mock_seek.side_effect = RuntimeError("timeout")
+
+        await server_module._run_search(
+            self.request, self.key, 100000, 200000, search_cache.lookup(self.request)
+        )
+        await self.wait_for_refresh()
+
+        entry, stale, _ = raw_cache.lookup(self.request)
+        self.assertTrue(stale)
+        self.assertEqual(entry["scraped_at"], scraped_at)
+        jobs = await server_module._run_search(
+            self.request, self.key, 100000, 200000, search_cache.lookup(self.request)
+        )
+        self.assertEqual([job["id"] for job in jobs], ["seek_1"])
+        await self.wait_for_refresh()
+
+    @patch.object(server_module, "scrape_site", return_value=[])
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    async def test_partial_refresh_keeps_failed_source_and_retries_it(self, mock_seek, mock_site):
+        """Test a failed source keeps its previous jobs and is scheduled for a retry."""
+        self.cache_stale_scrape([SEEK_JOB])
+        mock_seek.side_effect = RuntimeError("timeout")
+        mock_site.return_value = [dict(SEEK_JOB, id="li-1", site="linkedin", title="Engineer")]
+
+        await server_module._run_search(
+            self.request, self.key, 100000, 200000, search_cache.lookup(self.request)
+        )
+        await self.wait_for_refresh()
+
+        entry, stale, _ = raw_cache.lookup(self.request)
+        self.assertFalse(stale)
+        self.assertEqual(list(entry["retry"]), ["seek"])
+        self.assertEqual(entry["sources"]["seek"], [SEEK_JOB])
+        self.assertEqual(entry["sources"]["linkedin"][0]["id"], "li-1")
+
+    @patch.object(server_module, "scrape_site")
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    async def test_partial_scrape_retries_only_failed_sources(self, mock_seek, mock_site):
+        """Test searches after a partial scrape retry just the failed source, with backoff."""
+        mock_seek.return_value = [SEEK_JOB]
+
+        def failing_glassdoor(site, *args):
+            if site == "glassdoor":
+                raise RuntimeError("blocked")
+            return [dict(SEEK_JOB, id=f"{site}-1", site=site, company=f"{site} Co")]
+
+        mock_site.side_effect = failing_glassdoor
+        await server_module._run_search(
+            self.request, self.key, 100000, 200000, search_cache.lookup(self.request)
+        )
+        self.assertEqual(mock_seek.await_count, 1)
+        self.assertEqual(mock_site.call_count, 3)
+
+        # Before the backoff passes, searches are answered from the cache
+        for _ in range(3):
+            await server_module._run_search(
+                self.request, self.key, 100000, 200000, search_cache.lookup(self.request)
+            )
+            await self.wait_for_refresh()
+        self.assertEqual(mock_seek.await_count, 1)
+        self.assertEqual(mock_site.call_count, 3)
+
+        # Once it has passed, only glassdoor is scraped again, and backs off further
+        with patch("time.time", return_value=time.time() + server_module.SOURCE_RETRY_BACKOFF):
+            await server_module._run_search(
+                self.request, self.key, 100000, 200000, search_cache.lookup(self.request)
+            )
+            await self.wait_for_refresh()
+        self.assertEqual(mock_seek.await_count, 1)
+        self.assertEqual(mock_site.call_count, 4)
+        self.assertEqual(mock_site.call_args.args[0], "glassdoor")
+        entry, stale, _ = raw_cache.lookup(self.request)
+        self.assertFalse(stale)
+        self.assertEqual(entry["retry"]["glassdoor"]["failures"], 2)
+
+        # A successful retry is served to later searches
+        mock_site.side_effect = lambda site, *args: [
+            dict(SEEK_JOB, id=f"{site}-1", site=site, company=f"{site} Co")
+        ]
+        with patch("time.time", return_value=time.time() + 3 * server_module.SOURCE_RETRY_BACKOFF):
+            await server_module._run_search(
+                self.request, self.key, 100000, 200000, search_cache.lookup(self.request)
+            )
+            await self.wait_for_refresh()
+            jobs = await server_module._run_search(
+                self.request, self.key, 100000, 200000, search_cache.lookup(self.request)
+            )
+        self.assertEqual(mock_site.call_count, 5)
+        self.assertIn("glassdoor-1", [job["id"] for job in jobs])
+        self.assertEqual(raw_cache.lookup(self.request)[0]["retry"], {})
+
+
+class TestIncrementalRefresh(AsyncServerTestCase):
+    """Tests for refreshing cached scrapes from per-source watermarks."""
+
+    def setUp(self):
+        super().setUp()
+        self.request = SearchRequest(**SEARCH_PAYLOAD)
+
+    @patch.object(server_module, "scrape_site")
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    async def test_full_scrape_records_watermarks(self, mock_seek, mock_site):
+        """Test a first scrape is a full one and records a watermark per good source."""
+        mock_seek.return_value = [SEEK_JOB]
+
+        def fake_site(site, *args):
+            if site == "glassdoor":
+                raise RuntimeError("blocked")
+            return []
+
+        mock_site.side_effect = fake_site
+
+        entry = await server_module._scrape_all(self.request, 100000, 200000)
+
+        self.assertIsNone(mock_seek.call_args.kwargs["known_ids"])
+        self.assertIsNone(mock_site.call_args.args[5])
+        self.assertEqual(set(entry["watermarks"]), {"seek", "indeed", "linkedin"})
+
+    @patch.object(server_module, "scrape_site")
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    async def test_refresh_fetches_only_new_jobs_and_merges(self, mock_seek, mock_site):
+        """Test a refresh passes hours_old and known ids, then merges new jobs first."""
+        two_hours_ago = time.time() - 2 * 3600 - 60
+        old_linkedin = dict(SEEK_JOB, id="li-1", site="linkedin", job_url="https://li/1")
+        previous = raw_cache.store_scrape(
+            self.request,
+            {"seek": [SEEK_JOB], "linkedin": [old_linkedin], "indeed": [], "glassdoor": []},
+            timestamp=two_hours_ago,
+            watermarks={"seek": two_hours_ago, "linkedin": two_hours_ago},
+        )
+        new_seek = dict(SEEK_JOB, id="seek_2", job_url="https://www.seek.com.au/job/2")
+        mock_seek.return_value = [new_seek]
+        mock_site.return_value = []
+
+        entry = await server_module._scrape_all(self.request, 100000, 200000, previous=previous)
+
+        self.assertEqual(mock_seek.call_args.kwargs["known_ids"], {"seek_1"})
+        hours_old = {call.args[0]: call.args[5] for call in mock_site.call_args_list}
+        self.assertEqual(hours_old, {"linkedin": 4, "indeed": None, "glassdoor": None})
+        self.assertEqual([job["id"] for job in entry["sources"]["seek"]], ["seek_2", "seek_1"])
+        self.assertEqual(entry["sources"]["linkedin"], [old_linkedin])
+        self.assertGreater(entry["watermarks"]["seek"], two_hours_ago)
+
+    @patch.object(server_module, "scrape_site", return_value=[])
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    async def test_stale_refresh_is_incremental(self, mock_seek, mock_site):
+        """Test a background refresh of a stale search continues from its watermarks."""
+        scraped_at = time.time() - server_module.SEARCH_CACHE_TTL - 1
+        raw_cache.store_scrape(
+            self.request,
+            {"seek": [SEEK_JOB]},
+            timestamp=scraped_at,
+            watermarks={"seek": scraped_at},
+        )
+        mock_seek.return_value = []
+
+        key = search_cache._make_key(self.request)
+        await server_module._run_search(
+            self.request, key, 100000, 200000, search_cache.lookup(self.request)
+        )
+        await asyncio.gather(*server_module._refresh_tasks)
+
+        self.assertEqual(mock_seek.call_args.kwargs["known_ids"], {"seek_1"})
+        entry, stale, _ = raw_cache.lookup(self.request)
+        self.assertFalse(stale)
+        self.assertEqual(entry["sources"]["seek"], [SEEK_JOB])
+
+
+class TestSearchDedup(ServerTestCase):
+    """Tests for cross-source duplicate collapsing in /api/search."""
+
+    @patch.object(server_module, "scrape_site")
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_same_posting_on_two_sources_is_returned_once(self, mock_seek, mock_site):
+        """Test a posting found on Seek and LinkedIn is returned once with both URLs."""
+        linkedin_url = "https://www.linkedin.com/jobs/view/1"
+        mock_seek.return_value = [SEEK_JOB]
+        mock_site.side_effect = lambda site, *args: (
+            [dict(SEEK_JOB, id="li-1", site="linkedin", job_url=linkedin_url)]
+            if site == "linkedin"
+            else []
+        )
+
+        jobs = self.client.post("/api/search", json=SEARCH_PAYLOAD).json()
+
+        self.assertEqual(len(jobs), 1)
+        self.assertEqual(jobs[0]["source_urls"], [SEEK_JOB["job_url"], linkedin_url])
+
+
+class TestFastResponseMode(ServerTestCase):
+    """Tests for the fast serialization path of /api/search."""
+
+    def setUp(self):
+        super().setUp()
+        search_cache.set(SearchRequest(**SEARCH_PAYLOAD), [dict(SEEK_JOB, description="x" * 1000)])
+
+    def test_fields_projection_and_description_cap(self):
+        """Test fields and description_chars shape the response."""
+        response = self.client.post(
+            "/api/search?fields=id,title,description&description_chars=20", json=SEARCH_PAYLOAD
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            [{"id": "seek_1", "title": "Software Engineer", "description": "x" * 20}],
+        )
+
+    def test_fast_mode_matches_model_output(self):
+        """Test fast=true returns the same JSON as the validated path."""
+        fast = self.client.post("/api/search?fast=true", json=SEARCH_PAYLOAD).json()
+        regular = self.client.post("/api/search", json=SEARCH_PAYLOAD).json()
+        self.assertEqual(fast, regular)
+
+    def test_unknown_field_is_rejected(self):
+        """Test an unknown projection field returns 400."""
+        response = self.client.post("/api/search?fields=id,bogus", json=SEARCH_PAYLOAD)
+        self.assertEqual(response.status_code, 400)
+
+
+class TestSubmittedSearches(ServerTestCase):
+    """Tests for the asynchronous /api/searches endpoints."""
+
+    def wait_for(self, client, search_id):
+        """Poll a submitted search until it finishes."""
+        for _ in range(100):
+            status = client.get(f"/api/searches/{search_id}").json()
+            if status["status"] in ("completed", "failed"):
+                return status
+            time.sleep(0.01)
+        self.fail("search did not finish")
+
+    @patch.object(server_module, "scrape_site")
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_submit_poll_and_page_results(self, mock_seek, mock_site):
+        """Test a submitted search reports per-source progress and pages its results."""
+        mock_seek.return_value = [
+            dict(SEEK_JOB, id=f"seek_{i}", job_url=f"https://x/{i}") for i in range(5)
+        ]
+
+        def fake_site(site, *args):
+            if site == "glassdoor":
+                raise RuntimeError("blocked")
+            return []
+
+        mock_site.side_effect = fake_site
+
+        with TestClient(app) as client:
+            response = client.post("/api/searches", json=SEARCH_PAYLOAD)
+            self.assertEqual(response.status_code, 202)
+            search_id = response.json()["id"]
+
+            status = self.wait_for(client, search_id)
+            self.assertEqual(status["status"], "completed")
+            self.assertEqual(status["total"], 5)
+            self.assertEqual(
+                status["sources"]["seek"], {"status": "completed", "count": 5, "error": None}
+            )
+            self.assertEqual(status["sources"]["glassdoor"]["status"], "failed")
+
+            page = client.get(f"/api/searches/{search_id}/results?offset=3&limit=10").json()
+            self.assertEqual(page["total"], 5)
+            self.assertEqual([job["id"] for job in page["jobs"]], ["seek_3", "seek_4"])
+
+    def test_unknown_search_returns_404(self):
+        """Test polling an unknown id returns 404."""
+        client = TestClient(app)
+        self.assertEqual(client.get("/api/searches/nope").status_code, 404)
+        self.assertEqual(client.get("/api/searches/nope/results").status_code, 404)
+
+    def test_submit_invalid_salary(self):
+        """Test an invalid salary is rejected at submission."""
+        client = TestClient(app)
+        response = client.post("/api/searches", json=dict(SEARCH_PAYLOAD, salary="invalid"))
+        self.assertEqual(response.status_code, 400)
+
+    @patch.object(server_module, "scrape_site", return_value=[])
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_results_conflict_while_running(self, mock_seek, mock_site):
+        """Test results are not served before the search completes."""
+
+        async def slow_seek(*args, **kwargs):
+            await asyncio.sleep(0.2)
+            return [SEEK_JOB]
+
+        mock_seek.side_effect = slow_seek
+
+        with TestClient(app) as client:
+            search_id = client.post("/api/searches", json=SEARCH_PAYLOAD).json()["id"]
+            self.assertEqual(client.get(f"/api/searches/{search_id}/results").status_code, 409)
+            self.wait_for(client, search_id)
+            self.assertEqual(client.get(f"/api/searches/{search_id}/results").status_code, 200)
+
+
+class TestSavedSearches(ServerTestCase):
+    """Tests for saved searches and their background refresh."""
+
+    def test_create_list_delete(self):
+        """Test saved searches can be created, listed and deleted."""
+        response = self.client.post(
+            "/api/saved-searches", json={"search": SEARCH_PAYLOAD, "interval": 300}
+        )
+        self.assertEqual(response.status_code, 201)
+        saved_id = response.json()["id"]
+
+        listed = self.client.get("/api/saved-searches").json()
+        self.assertEqual([saved["id"] for saved in listed], [saved_id])
+        self.assertEqual(listed[0]["interval"], 300)
+        self.assertEqual(listed[0]["search"]["role"], SEARCH_PAYLOAD["role"])
+
+        self.assertEqual(self.client.delete(f"/api/saved-searches/{saved_id}").status_code, 204)
+        self.assertEqual(self.client.delete(f"/api/saved-searches/{saved_id}").status_code, 404)
+
+    def test_rejects_short_interval_and_bad_salary(self):
+        """Test invalid intervals and salaries are rejected."""
+        short = self.client.post(
+            "/api/saved-searches", json={"search": SEARCH_PAYLOAD, "interval": 5}
+        )
+        self.assertEqual(short.status_code, 422)
+        bad_salary = self.client.post(
+            "/api/saved-searches", json={"search": dict(SEARCH_PAYLOAD, salary="invalid")}
+        )
+        self.assertEqual(bad_salary.status_code, 400)
+
+    @patch.object(server_module, "scrape_site", return_value=[])
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_refresh_precomputes_interactive_search(self, mock_seek, mock_site):
+        """Test a refreshed saved search answers /api/search without scraping."""
+        mock_seek.return_value = [SEEK_JOB]
+        saved_id = self.client.post("/api/saved-searches", json={"search": SEARCH_PAYLOAD}).json()[
+            "id"
+        ]
+
+        saved = server_module.job_store.list_saved_searches()[0]
+        asyncio.run(server_module._refresh_saved(saved))
+        self.assertEqual(mock_seek.await_count, 1)
+
+        jobs = self.client.post("/api/search", json=SEARCH_PAYLOAD).json()
+        self.assertEqual([job["id"] for job in jobs], ["seek_1"])
+        self.assertEqual(mock_seek.await_count, 1)
+
+        listed = self.client.get("/api/saved-searches").json()[0]
+        self.assertEqual(listed["id"], saved_id)
+        self.assertIsNotNone(listed["last_run"])
+        self.assertIsNone(listed["last_error"])
+
+
+class TestSingleFlight(AsyncServerTestCase):
+    """Tests for coalescing concurrent identical searches."""
+
+    async def test_concurrent_calls_share_one_task(self):
+        """Test callers with the same key await a single execution."""
+        flights = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*(flights.do("key", work) for _ in range(5)))
+
+        self.assertEqual(calls, 1)
+        self.assertEqual(results, [1] * 5)
+        self.assertEqual(len(flights), 0)
+
+    async def test_failure_propagates_to_all_callers(self):
+        """Test an exception in the shared call reaches every waiter."""
+        flights = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            flights.do("key", fail), flights.do("key", fail), return_exceptions=True
+        )
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+        self.assertEqual(len(flights), 0)
+
+    async def test_flight_spans_reach_only_callers_that_waited(self):
+        """Test a shared call's spans go to callers awaiting its end, not the one that left."""
+        from src.tracing import Trace, _current_trace, span
+
+        flights = SingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            with span("shared"):
+                await release.wait()
+            return 1
+
+        async def call(trace):
+            _current_trace.set(trace)
+            return await flights.do("key", work)
+
+        starter, joiner = Trace(), Trace()
+        first = asyncio.ensure_future(call(starter))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(call(joiner))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        self.assertEqual(await second, 1)
+        self.assertEqual(starter.spans, [])
+        self.assertEqual([s["name"] for s in joiner.spans], ["shared"])
+
+    @patch.object(server_module, "scrape_site", return_value=[])
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    async def test_concurrent_searches_scrape_once(self, mock_seek, mock_site):
+        """Test a burst of identical searches triggers one scrape."""
+
+        async def slow_seek(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return [SEEK_JOB]
+
+        mock_seek.side_effect = slow_seek
+        request = SearchRequest(**SEARCH_PAYLOAD)
+
+        results = await asyncio.gather(
+            *(server_module.search_jobs(request, Response()) for _ in range(5))
+        )
+
+        self.assertEqual(mock_seek.await_count, 1)
+        self.assertEqual(mock_site.call_count, len(server_module.JOBSPY_SITES))
+        self.assertTrue(all(len(jobs) == 1 for jobs in results))
+
+    @patch.object(server_module, "scrape_site", return_value=[])
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    async def test_streams_and_searches_share_one_scrape(self, mock_seek, mock_site):
+        """Test concurrent identical streams and searches trigger one scrape."""
+
+        async def slow_seek(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return [SEEK_JOB]
+
+        mock_seek.side_effect = slow_seek
+        request = SearchRequest(**SEARCH_PAYLOAD)
+
+        async def stream():
+            response = await server_module.search_jobs_stream(request, Mock(headers={}))
+            return [json.loads(line) async for line in response.body_iterator]
+
+        first, second, jobs = await asyncio.gather(
+            stream(), stream(), server_module.search_jobs(request, Response())
+        )
+
+        self.assertEqual(mock_seek.await_count, 1)
+        self.assertEqual(mock_site.call_count, len(server_module.JOBSPY_SITES))
+        self.assertEqual(first[-1]["total"], 1)
+        self.assertEqual(second[-1]["total"], 1)
+        self.assertEqual(len(jobs), 1)
+
+    async def test_joiner_wait_is_bounded(self):
+        """Test a joiner stops waiting at its timeout while the shared call finishes."""
+        flights = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.1)
+            return "done"
+
+        leader = asyncio.ensure_future(flights.do("key", work))
+        await asyncio.sleep(0)
+        with self.assertRaises(asyncio.TimeoutError):
+            await flights.do("key", work, timeout=0.01)
+        self.assertEqual(await leader, "done")
+
+    @patch.object(server_module, "scrape_site", return_value=[])
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    async def test_joiner_answers_within_its_deadline(self, mock_seek, mock_site):
+        """Test a search joining a longer scrape answers from its finished sources in time."""
+        mock_site.side_effect = lambda site, *args: [
+            dict(SEEK_JOB, id=f"{site}-1", site=site, company=f"{site} Co")
+        ]
+
+        async def slow_seek(*args, **kwargs):
+            await asyncio.sleep(0.5)
+            return [SEEK_JOB]
+
+        mock_seek.side_effect = slow_seek
+        leader = asyncio.ensure_future(
+            server_module.search_jobs(SearchRequest(**SEARCH_PAYLOAD), Response())
+        )
+        await asyncio.sleep(0.05)
+
+        start = time.perf_counter()
+        jobs = await server_module.search_jobs(
+            SearchRequest(**dict(SEARCH_PAYLOAD, deadline=0.1)), Response()
+        )
+        self.assertLess(time.perf_counter() - start, 0.4)
+        self.assertNotIn("seek", {job.site for job in jobs})
+        self.assertEqual(len(jobs), len(server_module.JOBSPY_SITES))
+
+        self.assertEqual(len(await leader), len(server_module.JOBSPY_SITES) + 1)
+        self.assertEqual(mock_seek.await_count, 1)
+
+
+class TestSearchStream(ServerTestCase):
+    """Tests for the /api/search/stream endpoint."""
+
+    def _events(self, response):
+        return [json.loads(line) for line in response.text.splitlines() if line]
+
+    @patch.object(server_module, "scrape_site")
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_stream_emits_batch_per_source_then_summary(self, mock_seek, mock_site):
+        """Test each source produces a filtered jobs event followed by a summary."""
+        mock_seek.return_value = [SEEK_JOB, dict(SEEK_JOB, id="seek_2", title="Chef")]
+        mock_site.side_effect = lambda site, *args: (
+            [dict(SEEK_JOB, id=f"{site}-1", site=site, company="Other Co")]
+            if site == "linkedin"
+            else []
+        )
+
+        response = self.client.post("/api/search/stream", json=SEARCH_PAYLOAD)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("application/x-ndjson"))
+        events = self._events(response)
+        batches = {e["source"]: e["jobs"] for e in events if e["event"] == "jobs"}
+        self.assertEqual(set(batches), {"seek", "indeed", "linkedin", "glassdoor"})
+        self.assertEqual([job["id"] for job in batches["seek"]], ["seek_1"])
+        self.assertEqual(events[-1]["event"], "summary")
+        self.assertEqual(events[-1]["total"], 2)
+
+        # The combined result is cached for the regular endpoint
+        self.assertEqual(len(search_cache.get(SearchRequest(**SEARCH_PAYLOAD))), 2)
+
+    @patch.object(server_module, "scrape_site", return_value=[])
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_stream_reports_source_errors(self, mock_seek, mock_site):
+        """Test a failing source is reported in the summary instead of failing the stream."""
+        mock_seek.side_effect = RuntimeError("seek down")
+
+        events = self._events(self.client.post("/api/search/stream", json=SEARCH_PAYLOAD))
+
+        summary = events[-1]
+        self.assertEqual(
+            summary["sources"]["seek"], {"count": 0, "status": "failed", "error": "seek down"}
+        )
+        self.assertIsNone(summary["sources"]["indeed"]["error"])
+
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_stream_serves_cache_as_server_sent_events(self, mock_seek):
+        """Test cached results are sent as one SSE batch when requested."""
+        search_cache.set(SearchRequest(**SEARCH_PAYLOAD), [SEEK_JOB])
+
+        response = self.client.post(
+            "/api/search/stream",
+            json=SEARCH_PAYLOAD,
+            headers={"Accept": "text/event-stream"},
+        )
+
+        self.assertTrue(response.headers["content-type"].startswith("text/event-stream"))
+        self.assertIn("event: jobs\ndata: ", response.text)
+        self.assertIn("event: summary\ndata: ", response.text)
+        mock_seek.assert_not_awaited()
+
+    def test_stream_invalid_salary(self):
+        """Test an invalid salary is rejected before streaming starts."""
+        response = self.client.post(
+            "/api/search/stream", json=dict(SEARCH_PAYLOAD, salary="invalid")
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class TestSharedHttpClient(ServerTestCase):
+    """Tests for the lifespan-managed HTTP client."""
+
+    @patch.object(server_module, "scrape_site", return_value=[])
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_seek_reuses_app_client(self, mock_seek, mock_site):
+        """Test searches pass the app's pooled client to Seek and it is closed on shutdown."""
+        mock_seek.return_value = []
+
+        with TestClient(app) as client:
+            client.post("/api/search", json=SEARCH_PAYLOAD)
+            client.post("/api/search", json=dict(SEARCH_PAYLOAD, role="Developer"))
+
+        clients = [call.kwargs["client"] for call in mock_seek.call_args_list]
+        self.assertEqual(len(clients), 2)
+        self.assertIsInstance(clients[0], httpx.AsyncClient)
+        self.assertIs(clients[0], clients[1])
+        self.assertTrue(clients[0].is_closed)
+
+
+class TestCircuitBreakers(ServerTestCase):
+    """Tests for skipping sources whose circuit breaker is open."""
+
+    def trip(self, source):
+        """Open a source's circuit."""
+        breaker = get_breaker(source)
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+
+    @patch.object(server_module, "scrape_site", return_value=[])
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_repeated_failures_skip_source(self, mock_seek, mock_site):
+        """Test a source failing repeatedly is skipped and reported in a header."""
+        mock_seek.side_effect = RuntimeError("seek down")
+        threshold = get_breaker("seek").failure_threshold
+
+        for i in range(threshold):
+            response = self.client.post(
+                "/api/search", json=dict(SEARCH_PAYLOAD, role=f"Engineer {i}")
+            )
+            self.assertNotIn("x-skipped-sources", response.headers)
+        self.assertEqual(mock_seek.await_count, threshold)
+        self.assertTrue(mock_seek.call_args.kwargs["raise_errors"])
+
+        response = self.client.post("/api/search", json=SEARCH_PAYLOAD)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["x-skipped-sources"], "seek")
+        self.assertEqual(mock_seek.await_count, threshold)
+
+    @patch.object(server_module, "scrape_site", return_value=[])
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_skipped_source_does_not_poison_cache(self, mock_seek, mock_site):
+        """Test a skipped source neither makes the scrape stale nor schedules a retry."""
+        mock_seek.return_value = [SEEK_JOB]
+        self.trip("seek")
+
+        self.client.post("/api/search", json=SEARCH_PAYLOAD, params={"fast": "true"})
+
+        mock_seek.assert_not_awaited()
+        entry, stale, _ = raw_cache.lookup(SearchRequest(**SEARCH_PAYLOAD))
+        self.assertFalse(stale)
+        self.assertEqual(entry["retry"], {})
+
+    @patch.object(server_module, "scrape_site", return_value=[])
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_stream_summary_lists_skipped(self, mock_seek, mock_site):
+        """Test the stream summary names skipped sources."""
+        self.trip("linkedin")
+
+        response = self.client.post("/api/search/stream", json=SEARCH_PAYLOAD)
+
+        summary = [json.loads(line) for line in response.text.splitlines() if line][-1]
+        self.assertEqual(summary["skipped"], ["linkedin"])
+        self.assertEqual(summary["sources"]["linkedin"]["error"], server_module.SOURCE_SKIPPED)
+        self.assertEqual(mock_site.call_count, len(server_module.JOBSPY_SITES) - 1)
+
+    @patch.object(server_module, "scrape_site", return_value=[])
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_submitted_search_reports_skipped(self, mock_seek, mock_site):
+        """Test a submitted search marks skipped sources."""
+        mock_seek.return_value = [SEEK_JOB]
+        self.trip("glassdoor")
+
+        with TestClient(app) as client:
+            search_id = client.post("/api/searches", json=SEARCH_PAYLOAD).json()["id"]
+            for _ in range(100):
+                status = client.get(f"/api/searches/{search_id}").json()
+                if status["status"] == "completed":
+                    break
+                time.sleep(0.01)
+
+        self.assertEqual(status["status"], "completed")
+        self.assertEqual(status["sources"]["glassdoor"]["status"], "skipped")
+        self.assertEqual(status["sources"]["seek"]["status"], "completed")
+
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_jobspy_logged_failures_open_circuit(self, mock_seek):
+        """Test a board that JobSpy reports as failing only through its logs is skipped."""
+
+        def blocked_linkedin(**params):
+            # Like JobSpy: a blocked board is logged and comes back as an empty frame
+            if params["site_name"] == ["linkedin"]:
+                logging.getLogger("JobSpy:LinkedIn").error("LinkedIn response status code 429")
+            return pd.DataFrame()
+
+        limiter = HostLimiter("linkedin", rate=1000, burst=100, max_concurrency=10)
+        mock_seek.return_value = [SEEK_JOB]
+        with (
+            patch("src.scrapers.jobspy_wrapper.scrape_jobs", side_effect=blocked_linkedin),
+            patch("src.scrapers.jobspy_wrapper.get_limiter", return_value=limiter),
+        ):
+            for i in range(get_breaker("linkedin").failure_threshold):
+                self.client.post("/api/search", json=dict(SEARCH_PAYLOAD, role=f"Dev {i}"))
+            response = self.client.post("/api/search", json=SEARCH_PAYLOAD)
+
+        self.assertEqual(response.headers["x-skipped-sources"], "linkedin")
+        self.assertEqual(get_breaker("indeed").stats()["failures"], 0)
+
+    def test_scraper_stats_include_circuits(self):
+        """Test circuit states are exposed for monitoring."""
+        self.trip("indeed")
+        circuits = self.client.get("/api/scraper-stats").json()["circuits"]
+        self.assertEqual(circuits["indeed"]["state"], "open")
+
+
+class TestSearchDeadline(ServerTestCase):
+    """Tests for deadline-budgeted searches returning partial results."""
+
+    @patch.object(server_module, "scrape_site")
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_slow_sources_are_dropped(self, mock_seek, mock_site):
+        """Test sources missing their budget are left out and reported as timed out."""
+
+        async def hung_seek(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        def fake_site(site, *args):
+            if site == "linkedin":
+                time.sleep(0.5)
+            return [dict(SEEK_JOB, id=f"{site}-1", site=site, company=f"{site} Co")]
+
+        mock_seek.side_effect = hung_seek
+        mock_site.side_effect = fake_site
+
+        start = time.perf_counter()
+        response = self.client.post("/api/search", json=dict(SEARCH_PAYLOAD, deadline=0.2))
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(response.status_code, 200)
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(
+            response.headers["x-source-status"],
+            "seek=timeout, indeed=completed, linkedin=timeout, glassdoor=completed",
+        )
+        self.assertEqual(sorted(job["site"] for job in response.json()), ["glassdoor", "indeed"])
+
+        # The timed-out sources are retried later on their own
+        entry, stale, _ = raw_cache.lookup(SearchRequest(**SEARCH_PAYLOAD))
+        self.assertFalse(stale)
+        self.assertEqual(sorted(entry["retry"]), ["linkedin", "seek"])
+
+    @patch.object(server_module, "scrape_site", return_value=[])
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_stream_and_submitted_report_timeouts(self, mock_seek, mock_site):
+        """Test the stream summary and submitted searches report timed-out sources."""
+
+        async def hung_seek(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        mock_seek.side_effect = hung_seek
+        payload = dict(SEARCH_PAYLOAD, deadline=0.1)
+
+        events = [
+            json.loads(line)
+            for line in self.client.post("/api/search/stream", json=payload).text.splitlines()
+        ]
+        self.assertEqual(events[-1]["sources"]["seek"]["status"], "timeout")
+
+        with TestClient(app) as client:
+            search_id = client.post(
+                "/api/searches", json=dict(payload, role="Platform Engineer")
+            ).json()["id"]
+            for _ in range(100):
+                status = client.get(f"/api/searches/{search_id}").json()
+                if status["status"] == "completed":
+                    break
+                time.sleep(0.01)
+
+        self.assertEqual(status["sources"]["seek"]["status"], "timeout")
+        self.assertEqual(status["sources"]["indeed"]["status"], "completed")
+
+    @patch.object(server_module, "pool_saturated", return_value=True)
+    @patch.object(server_module, "scrape_site", return_value=[])
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_saturated_pool_skips_jobspy_boards(self, mock_seek, mock_site, mock_saturated):
+        """Test JobSpy boards are skipped, not queued, while abandoned scrapes hold the pool."""
+        mock_seek.return_value = [SEEK_JOB]
+
+        response = self.client.post("/api/search", json=SEARCH_PAYLOAD)
+
+        self.assertEqual(
+            response.headers["x-source-status"],
+            "seek=completed, indeed=skipped, linkedin=skipped, glassdoor=skipped",
+        )
+        mock_site.assert_not_called()
+        self.assertTrue(get_breaker("indeed").allow())
+
+    def test_deadline_is_validated(self):
+        """Test a non-positive deadline is rejected."""
+        response = self.client.post("/api/search", json=dict(SEARCH_PAYLOAD, deadline=0))
+        self.assertEqual(response.status_code, 422)
+
+
+class TestMetricsEndpoint(ServerTestCase):
+    """Tests for the /metrics endpoint."""
+
+    @patch.object(server_module, "scrape_site", return_value=[])
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_search_is_instrumented(self, mock_seek, mock_site):
+        """Test a scraped search records scrape, filter, cache and search metrics."""
+        from src.metrics import CACHE_REQUESTS, SCRAPE_DURATION, SCRAPES, SOURCE_JOBS
+
+        mock_seek.return_value = [SEEK_JOB, dict(SEEK_JOB, id="seek_2", title="Chef")]
+        before = {
+            "seek": SCRAPES.value("seek", "completed"),
+            "indeed": SCRAPES.value("indeed", "completed"),
+            "scraped": SOURCE_JOBS.value("seek", "scraped"),
+            "kept": SOURCE_JOBS.value("seek", "kept"),
+            "latency": SCRAPE_DURATION.count("seek"),
+            "hits": CACHE_REQUESTS.value("search", "hit"),
+            "misses": CACHE_REQUESTS.value("search", "miss"),
+            "raw_misses": CACHE_REQUESTS.value("raw", "miss"),
+        }
+
+        self.client.post("/api/search", json=SEARCH_PAYLOAD)
+        self.client.post("/api/search", json=SEARCH_PAYLOAD)
+
+        self.assertEqual(SCRAPES.value("seek", "completed"), before["seek"] + 1)
+        self.assertEqual(SCRAPES.value("indeed", "completed"), before["indeed"] + 1)
+        self.assertEqual(SOURCE_JOBS.value("seek", "scraped"), before["scraped"] + 2)
+        self.assertEqual(SOURCE_JOBS.value("seek", "kept"), before["kept"] + 1)
+        self.assertEqual(SCRAPE_DURATION.count("seek"), before["latency"] + 1)
+        self.assertEqual(CACHE_REQUESTS.value("search", "hit"), before["hits"] + 1)
+        # Each search looks up each cache tier once
+        self.assertEqual(CACHE_REQUESTS.value("search", "miss"), before["misses"] + 1)
+        self.assertEqual(CACHE_REQUESTS.value("raw", "miss"), before["raw_misses"] + 1)
+
+        response = self.client.get("/metrics")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/plain; version=0.0.4"))
+        body = response.text
+        self.assertIn('career_hunter_scrape_duration_seconds_bucket{source="seek",le="+Inf"}', body)
+        self.assertIn('career_hunter_filter_jobs_total{filter="role",result="dropped"}', body)
+        self.assertIn('career_hunter_search_duration_seconds_count{cache="hit"}', body)
+        self.assertIn('career_hunter_cache_entries{cache="search"} 1', body)
+        self.assertIn("career_hunter_executor_queue_depth 0", body)
+        self.assertIn('career_hunter_searches_in_flight{endpoint="search"} 0', body)
+
+
+class TestServerTiming(ServerTestCase):
+    """Tests for per-stage timing of searches."""
+
+    @patch.object(server_module, "scrape_site")
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_server_timing_header(self, mock_seek, mock_site):
+        """Test a scraped search reports each stage in Server-Timing."""
+        from src.tracing import span
+
+        mock_seek.return_value = [SEEK_JOB]
+
+        def fake_site(site, *args):
+            # Runs on the JobSpy pool; the span must still reach the request's trace
+            with span(f"jobspy_{site}"):
+                return []
+
+        mock_site.side_effect = fake_site
+
+        response = self.client.post("/api/search", json=SEARCH_PAYLOAD)
+
+        stages = [entry.split(";")[0] for entry in response.headers["server-timing"].split(", ")]
+        for stage in (
+            "cache_lookup",
+            "scrape",
+            "source_seek",
+            "jobspy_linkedin",
+            "filter_role",
+            "dedupe",
+            "validate",
+            "total",
+        ):
+            self.assertIn(stage, stages)
+
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_cached_search_timing(self, mock_seek):
+        """Test a cache hit reports only the cheap stages."""
+        search_cache.set(SearchRequest(**SEARCH_PAYLOAD), [SEEK_JOB])
+
+        response = self.client.post(
+            "/api/search", json=SEARCH_PAYLOAD, params={"fields": "id,title"}
+        )
+
+        stages = [entry.split(";")[0] for entry in response.headers["server-timing"].split(", ")]
+        self.assertEqual(stages, ["cache_lookup", "serialize", "total"])
+        mock_seek.assert_not_awaited()
+
+    @patch.object(server_module, "scrape_site", return_value=[])
+    @patch.object(server_module, "scrape_seek", new_callable=AsyncMock)
+    def test_debug_timing_trace(self, mock_seek, mock_site):
+        """Test debug=timing wraps the jobs with a structured trace."""
+        mock_seek.return_value = [SEEK_JOB]
+
+        response = self.client.post("/api/search", json=SEARCH_PAYLOAD, params={"debug": "timing"})
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual([job["id"] for job in body["jobs"]], ["seek_1"])
+        self.assertIn("source_seek", body["trace"]["stages"])
+        self.assertIn("serialize", body["trace"]["stages"])
+        self.assertGreater(body["trace"]["total_ms"], 0)
+        names = [span_["name"] for span_ in body["trace"]["spans"]]
+        self.assertLess(names.index("cache_lookup"), names.index("serialize"))
+
+    def test_debug_rejects_unknown_mode(self):
+        """Test only the timing debug mode is accepted."""
+        response = self.client.post("/api/search", json=SEARCH_PAYLOAD, params={"debug": "sql"})
+        self.assertEqual(response.status_code, 422)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,148 @@
+"""Tests for the persistent job store."""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from store import JobStore, job_key
+
+
+def make_job(job_id, **overrides):
+    """Build a job dictionary in the scraper output shape."""
+    job = {
+        "id": job_id,
+        "site": "LinkedIn",
+        "title": "Software Engineer",
+        "company": "Tech Corp",
+        "location": "Sydney",
+        "date_posted": date(2024, 1, 15),
+        "job_url": f"https://example.com/job/{job_id}",
+        "salary_range": "N/A",
+        "company_url": "N/A",
+        "description": "Build things",
+        "is_remote": False,
+        "work_from_home_type": "",
+    }
+    job.update(overrides)
+    return job
+
+
+class TestJobStore(unittest.TestCase):
+    """Tests for JobStore."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.store = JobStore(os.path.join(self.tmpdir.name, "jobs.db"))
+
+    def tearDown(self):
+        self.store.close()
+        self.tmpdir.cleanup()
+
+    def test_upsert_inserts_and_updates_by_id(self):
+        """Test upserting the same id twice keeps one row with the latest values."""
+        self.store.upsert_jobs([make_job("li-1", title="Engineer")])
+        self.store.upsert_jobs([make_job("li-1", title="Senior Engineer")])
+
+        jobs = self.store.get_jobs(["li-1"])
+        self.assertEqual(len(jobs), 1)
+        self.assertEqual(jobs[0]["title"], "Senior Engineer")
+
+    def test_round_trip_normalizes_values(self):
+        """Test dates are stored as ISO strings and is_remote as bool."""
+        self.store.upsert_jobs([make_job("li-1", is_remote=True)])
+
+        job = self.store.get_jobs(["li-1"])[0]
+        self.assertEqual(job["date_posted"], "2024-01-15")
+        self.assertIs(job["is_remote"], True)
+
+    def test_get_jobs_preserves_order(self):
+        """Test get_jobs returns jobs in the requested order."""
+        self.store.upsert_jobs([make_job("a"), make_job("b"), make_job("c")])
+
+        jobs = self.store.get_jobs(["c", "a", "missing", "b"])
+        self.assertEqual([job["id"] for job in jobs], ["c", "a", "b"])
+
+    def test_unknown_ids_fall_back_to_url(self):
+        """Test jobs without a usable id do not collide in the store."""
+        first = make_job("seek_unknown", job_url="https://example.com/1")
+        second = make_job("seek_unknown", job_url="https://example.com/2")
+        self.assertNotEqual(job_key(first), job_key(second))
+
+        self.assertEqual(self.store.upsert_jobs([first, second]), 2)
+        self.assertEqual(len(self.store.query_jobs()), 2)
+
+    def test_query_jobs_filters_indexed_columns(self):
+        """Test query_jobs filters by site, company and work type case-insensitively."""
+        self.store.upsert_jobs(
+            [
+                make_job("li-1", site="LinkedIn", work_from_home_type="remote"),
+                make_job("in-1", site="Indeed", company="Other Co"),
+                make_job("seek_1", site="Seek", company="tech corp"),
+            ]
+        )
+
+        self.assertEqual(len(self.store.query_jobs(site="linkedin")), 1)
+        self.assertEqual(len(self.store.query_jobs(company="TECH CORP")), 2)
+        self.assertEqual(self.store.query_jobs(work_type="remote")[0]["id"], "li-1")
+        self.assertEqual(len(self.store.query_jobs(posted_since="2025-01-01")), 0)
+
+    def test_ingest_and_load_search(self):
+        """Test ingested search results are served until they are too old."""
+        scraped = [make_job("a"), make_job("b")]
+        before = time.time()
+        self.store.ingest("key", scraped, scraped[1:])
+        jobs, scraped_at = self.store.load_search("key", 60)
+        self.assertEqual([job["id"] for job in jobs], ["b"])
+        self.assertGreaterEqual(scraped_at, before)
+        self.assertEqual(len(self.store.query_jobs()), 2)
+        self.assertIsNone(self.store.load_search("other", 60))
+
+        time.sleep(0.01)
+        self.assertIsNone(self.store.load_search("key", 0.001))
+
+    def test_ingest_keeps_result_source_urls(self):
+        """Test source_urls on deduplicated results survive a store round trip."""
+        scraped = [make_job("a")]
+        results = [dict(scraped[0], source_urls=["https://example.com/job/a", "https://b"])]
+        self.store.ingest("key", scraped, results)
+
+        # A later plain upsert of the same job does not erase them
+        self.store.upsert_jobs(scraped)
+
+        job = self.store.load_search("key", 60)[0][0]
+        self.assertEqual(job["source_urls"], ["https://example.com/job/a", "https://b"])
+
+    def test_clear_searches_keeps_jobs(self):
+        """Test clearing searches forgets results but keeps stored jobs."""
+        self.store.ingest("key", [make_job("a")], [make_job("a")])
+
+        self.assertEqual(self.store.clear_searches(), 1)
+        self.assertIsNone(self.store.load_search("key", 60))
+        self.assertEqual(len(self.store.get_jobs(["a"])), 1)
+
+    def test_saved_searches_round_trip(self):
+        """Test saved searches are listed, marked as run and deleted."""
+        request = {"role": "Engineer", "country": "AU", "location": "Sydney"}
+        self.store.save_search("s1", request, 600)
+
+        saved = self.store.list_saved_searches()
+        self.assertEqual(len(saved), 1)
+        self.assertEqual(saved[0]["request"], request)
+        self.assertIsNone(saved[0]["last_run"])
+
+        self.store.mark_saved_search_run("s1", 123.0, "blocked")
+        saved = self.store.list_saved_searches()[0]
+        self.assertEqual((saved["last_run"], saved["last_error"]), (123.0, "blocked"))
+
+        self.assertTrue(self.store.delete_saved_search("s1"))
+        self.assertFalse(self.store.delete_saved_search("s1"))
+        self.assertEqual(self.store.list_saved_searches(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
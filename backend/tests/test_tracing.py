@@ -0,0 +1,144 @@
+"""Tests for per-request tracing."""
+
+import asyncio
+import contextvars
+import os
+import sys
+import threading
+import unittest
+
+# Add backend to path (so we can import src as a package)
+backend_dir = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, backend_dir)
+
+from src.tracing import (
+    ServerTimingMiddleware,
+    Trace,
+    _current_trace,
+    current_trace,
+    detached_task,
+    span,
+)
+
+
+class TestSpans(unittest.TestCase):
+    """Tests for recording spans."""
+
+    def setUp(self):
+        self.trace = Trace()
+        token = _current_trace.set(self.trace)
+        self.addCleanup(_current_trace.reset, token)
+
+    def test_span_without_trace_is_noop(self):
+        """Test spans outside a request record nothing."""
+        token = _current_trace.set(None)
+        try:
+            with span("ignored"):
+                pass
+        finally:
+            _current_trace.reset(token)
+        self.assertEqual(self.trace.spans, [])
+
+    def test_stages_aggregate_by_name(self):
+        """Test repeated spans are summed per stage in the Server-Timing header."""
+        self.trace.add("seek_http", self.trace.start, 0.010)
+        self.trace.add("seek_http", self.trace.start + 0.001, 0.020)
+        self.trace.add("filter_role", self.trace.start + 0.03, 0.0005)
+
+        header = self.trace.server_timing()
+        entries = header.split(", ")
+        self.assertEqual(entries[0], 'seek_http;dur=30.0;desc="x2"')
+        self.assertEqual(entries[1], "filter_role;dur=0.5")
+        self.assertTrue(entries[2].startswith("total;dur="))
+
+    def test_span_records_duration(self):
+        """Test a span is recorded even when the block raises."""
+        with self.assertRaises(ValueError):
+            with span("parse"):
+                raise ValueError("bad page")
+        self.assertEqual([s["name"] for s in self.trace.spans], ["parse"])
+
+    def test_to_dict(self):
+        """Test the JSON trace lists spans in start order with stage totals."""
+        self.trace.add("b", self.trace.start + 0.002, 0.001)
+        self.trace.add("a", self.trace.start + 0.001, 0.003)
+
+        data = self.trace.to_dict()
+        self.assertEqual([s["name"] for s in data["spans"]], ["a", "b"])
+        self.assertEqual(data["spans"][0]["start_ms"], 1.0)
+        self.assertEqual(data["stages"]["a"], {"count": 1, "total_ms": 3.0})
+
+    def test_copied_context_carries_trace_into_threads(self):
+        """Test work run in a copied context records spans on the request's trace."""
+
+        def work():
+            with span("jobspy_indeed"):
+                pass
+
+        thread = threading.Thread(target=contextvars.copy_context().run, args=(work,))
+        thread.start()
+        thread.join()
+        self.assertEqual([s["name"] for s in self.trace.spans], ["jobspy_indeed"])
+
+
+class TestDetachedTasks(unittest.IsolatedAsyncioTestCase):
+    """Tests for tasks that outlive the request starting them."""
+
+    async def test_detached_task_records_outside_request_trace(self):
+        """Test a detached task records into its own trace, or none, not the request's."""
+        request = Trace()
+        _current_trace.set(request)
+        own = Trace()
+
+        async def work():
+            with span("refresh"):
+                await asyncio.sleep(0)
+            return current_trace()
+
+        self.assertIsNone(await detached_task(work()))
+        self.assertIs(await detached_task(work(), own), own)
+
+        self.assertEqual(request.spans, [])
+        self.assertEqual([s["name"] for s in own.spans], ["refresh"])
+        self.assertIs(current_trace(), request)
+
+    def test_extend_keeps_span_times(self):
+        """Test spans copied from another trace keep their wall-clock position."""
+        first = Trace()
+        second = Trace()
+        first.add("shared", first.start + 0.5, 0.25)
+
+        second.extend(first)
+
+        span_ = second.spans[0]
+        self.assertAlmostEqual(second.start + span_["start"], first.start + 0.5)
+        self.assertEqual(span_["duration"], 0.25)
+
+
+class TestServerTimingMiddleware(unittest.IsolatedAsyncioTestCase):
+    """Tests for the ASGI middleware."""
+
+    async def test_adds_header_and_resets_trace(self):
+        """Test the response start carries Server-Timing with spans from the app."""
+
+        async def app(scope, receive, send):
+            with span("handler"):
+                await asyncio.sleep(0)
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        await ServerTimingMiddleware(app)({"type": "http"}, None, send)
+
+        headers = dict(sent[0]["headers"])
+        self.assertTrue(headers[b"server-timing"].startswith(b"handler;dur="))
+        self.assertIn(b"total;dur=", headers[b"server-timing"])
+        self.assertIsNone(current_trace())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,7 +9,14 @@ backend_src = os.path.join(os.path.dirname(__file__), "..", "src")
 sys.path.insert(0, backend_src)
 
 # Import using the actual config module
-from utils import filter_by_work_type, filter_jobs, parse_salary
+from utils import (
+    TitleIndex,
+    compile_role,
+    filter_by_work_type,
+    filter_jobs,
+    parse_salary,
+    tokenize_title,
+)
 
 
 class TestParseSalary(unittest.TestCase):
@@ -163,6 +170,46 @@ class TestFilterJobs(unittest.TestCase):
         self.assertEqual(len(filtered), 2)
 
 
+class TestCompiledRoleMatcher(unittest.TestCase):
+    """Tests for compiled role queries and the title index."""
+
+    def setUp(self):
+        self.jobs = [
+            {"title": "Senior Software Engineer"},
+            {"title": "Engineering Manager"},
+            {"title": "Data Analyst"},
+            {"title": "N/A"},
+            {"title": "Software Developer (React)"},
+        ]
+
+    def test_compile_role_is_cached_per_normalized_role(self):
+        """Test roles differing only in case/punctuation share one compiled query."""
+        self.assertIs(compile_role("Software Engineer"), compile_role("  software, ENGINEER "))
+
+    def test_compile_role_drops_stop_words(self):
+        """Test stop words do not become token groups."""
+        query = compile_role("Senior Software Engineer")
+        self.assertEqual(len(query.token_groups), 2)
+        self.assertTrue(query.matches(tokenize_title("Software Developer")))
+
+    def test_index_reused_across_roles(self):
+        """Test one index answers several roles, preserving job order."""
+        index = TitleIndex(self.jobs)
+
+        engineers = filter_jobs(self.jobs, "Software Engineer", index=index)
+        managers = filter_jobs(self.jobs, "Engineering Manager", index=index)
+
+        self.assertEqual(
+            [job["title"] for job in engineers],
+            ["Senior Software Engineer", "Software Developer (React)"],
+        )
+        self.assertEqual([job["title"] for job in managers], ["Engineering Manager"])
+
+    def test_role_without_tokens_matches_titled_jobs(self):
+        """Test an empty role keeps every job that has a title."""
+        self.assertEqual(len(filter_jobs(self.jobs, "")), 4)
+
+
 class TestFilterByWorkType(unittest.TestCase):
     """Tests for filter_by_work_type function."""
 
@@ -9,6 +9,8 @@ export interface Job {
   salary_range: string;
   company_url: string;
   description: string;
+  /** Job URLs for the same posting on every source it was found on */
+  source_urls?: string[];
 }
 
 /** Aggregated company information derived from jobs */